@@ -1,7 +1,25 @@
 """ASV Benchmarks für PyIntLab – ScalarInterval und zukünftige NumPy-Varianten."""
 
+import operator
+import os
+import pickle
+import shutil
+import tempfile
+
 import numpy
 
+from pyintlab import array_interval, interval_io
+from pyintlab.array_interval import ArrayInterval, RoundingSession
+from pyintlab.array_linalg import (
+    IntervalFactorization,
+    solve,
+    solve_batched,
+)
+from pyintlab.array_memmap import IntervalMemmap
+from pyintlab.array_parallel import ParallelExecutor
+from pyintlab.array_processes import ProcessExecutor, SharedArrayInterval
+from pyintlab.interval_list import IntervalList
+from pyintlab.interval_stream import IntervalAccumulator
 from pyintlab.scalar_interval import ScalarInterval
 
 
@@ -114,3 +132,460 @@ class TimeCreation:
     def time_create_from_tuple(self):
         for v in self.values:
             _ = ScalarInterval(v, v + 2, _orderguaranteed=True)
+
+
+class TimeArrayIntervalMul:
+    """Elementweise Multiplikation von ArrayInterval (Zeit und Speicher)."""
+
+    params = [10_000, 10_000_000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        rng = numpy.random.default_rng(42)
+        self.left = ArrayInterval(numpy.sort(rng.normal(size=(size, 2))))
+        self.right = ArrayInterval(numpy.sort(rng.normal(size=(size, 2))))
+
+    def time_mul(self, size):
+        _ = self.left * self.right
+
+    def time_mul_scalar(self, size):
+        _ = self.left * -2.5
+
+    def peakmem_mul(self, size):
+        _ = self.left * self.right
+
+    def time_mul_inplace(self, size):
+        self.left *= 1.0
+
+    def peakmem_add_out(self, size):
+        _ = self.left.add(self.right, out=self.left)
+
+
+class TimeArrayIntervalMatmul:
+    """Matrixprodukt von ArrayInterval, geblockt und Mittelpunkt-Radius."""
+
+    params = [100, 400]
+    param_names = ["size"]
+
+    def setup(self, size):
+        rng = numpy.random.default_rng(42)
+        bounds = numpy.sort(rng.normal(size=(size * size, 2)))
+        self.matrix = ArrayInterval(bounds).reshape(size, size)
+
+    def time_matmul(self, size):
+        _ = self.matrix @ self.matrix
+
+    def peakmem_matmul(self, size):
+        _ = self.matrix @ self.matrix
+
+    def peakmem_matmul_small_budget(self, size):
+        _ = self.matrix.matmul(self.matrix, memory_budget=16 * 2**20)
+
+    def time_matmul_midrad(self, size):
+        _ = self.matrix.matmul(self.matrix, method="midrad")
+
+    def peakmem_matmul_midrad(self, size):
+        _ = self.matrix.matmul(self.matrix, method="midrad")
+
+
+class TimeRoundingSession:
+    """Kette kleiner ArrayInterval-Operationen mit und ohne RoundingSession."""
+
+    params = [100, 100_000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        rng = numpy.random.default_rng(42)
+        self.values = ArrayInterval(numpy.sort(rng.normal(size=(size, 2))))
+
+    def _pipeline(self):
+        values = self.values
+        return ((values + values) * values - values) / 3.0
+
+    def time_pipeline(self, size):
+        self._pipeline()
+
+    def time_pipeline_session(self, size):
+        with RoundingSession():
+            self._pipeline()
+
+
+class TimeParallelExecutor:
+    """ArrayInterval-Operationen verteilt auf mehrere Threads."""
+
+    params = [1, 2, 4]
+    param_names = ["workers"]
+
+    def setup(self, workers):
+        rng = numpy.random.default_rng(42)
+        self.values = ArrayInterval(
+            numpy.sort(rng.normal(size=(4_000_000, 2)))
+        )
+        self.matrix = ArrayInterval(
+            ArrayInterval(numpy.sort(rng.normal(size=(400 * 400, 2))))[
+                :
+            ].reshape(400, 400)
+        )
+        self.executor = ParallelExecutor(workers)
+
+    def teardown(self, workers):
+        self.executor.shutdown()
+
+    def time_mul(self, workers):
+        self.executor.elementwise(operator.mul, self.values, self.values)
+
+    def time_sum(self, workers):
+        self.executor.sum(self.values)
+
+    def time_matmul(self, workers):
+        self.executor.matmul(self.matrix, self.matrix)
+
+
+class TimeArrayIntervalElementary:
+    """Vektorisierte Elementarfunktionen von ArrayInterval."""
+
+    params = ["sqrt", "exp", "log", "tanh", "sin", "cos"]
+    param_names = ["function"]
+
+    def setup(self, function):
+        rng = numpy.random.default_rng(42)
+        self.values = ArrayInterval(
+            numpy.sort(rng.uniform(0.1, 10.0, size=(1_000_000, 2)))
+        )
+        self.scalars = [
+            ScalarInterval(lb, ub)
+            for lb, ub in numpy.sort(rng.uniform(0.1, 10.0, size=(1000, 2)))
+        ]
+
+    def time_array(self, function):
+        getattr(self.values, function)()
+
+    def time_scalar_loop_1000(self, function):
+        if not hasattr(ScalarInterval, function):
+            raise NotImplementedError
+        for value in self.scalars:
+            getattr(value, function)()
+
+
+class TimeArrayIntervalReductions:
+    """Rigorose Reduktionen von ArrayInterval, gerichtet gerundet und EFT."""
+
+    params = [100_000, 10_000_000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        rng = numpy.random.default_rng(42)
+        self.values = ArrayInterval(numpy.sort(rng.normal(size=(size, 2))))
+
+    def time_sum(self, size):
+        _ = self.values.sum()
+
+    def time_sum_eft(self, size):
+        _ = self.values.sum(method="eft")
+
+    def peakmem_sum_eft(self, size):
+        _ = self.values.sum(method="eft")
+
+    def time_prod(self, size):
+        _ = self.values.prod()
+
+    def time_cumsum(self, size):
+        _ = self.values.cumsum()
+
+    def time_hull(self, size):
+        _ = self.values.hull()
+
+
+class TimeRoundingFallback:
+    """ArrayInterval mit fesetround und mit der nextafter/EFT-Rückfallebene."""
+
+    params = [False, True]
+    param_names = ["fallback"]
+
+    def setup(self, fallback):
+        if not fallback and not array_interval._HAS_ROUNDING_CONTROL:
+            raise NotImplementedError("Keine Rundungssteuerung verfügbar.")
+        self.previous = array_interval.ROUNDING_FALLBACK
+        array_interval.ROUNDING_FALLBACK = fallback
+        rng = numpy.random.default_rng(42)
+        self.values = ArrayInterval(
+            numpy.sort(rng.normal(size=(1_000_000, 2)))
+        )
+        self.matrix = ArrayInterval(
+            numpy.sort(rng.normal(size=(300 * 300, 2)))
+        ).reshape(300, 300)
+
+    def teardown(self, fallback):
+        array_interval.ROUNDING_FALLBACK = self.previous
+
+    def time_add(self, fallback):
+        _ = self.values + self.values
+
+    def time_mul(self, fallback):
+        _ = self.values * self.values
+
+    def time_div_scalar(self, fallback):
+        _ = self.values / 3.0
+
+    def time_sum(self, fallback):
+        _ = self.values.sum()
+
+    def time_matmul(self, fallback):
+        _ = self.matrix @ self.matrix
+
+    def time_matmul_midrad(self, fallback):
+        _ = self.matrix.matmul(self.matrix, method="midrad")
+
+
+class TimeSolveBatched:
+    """Verifizierte Lösung vieler kleiner Intervall-Gleichungssysteme."""
+
+    params = ([3, 4], [10_000, 100_000])
+    param_names = ["n", "batch"]
+
+    def setup(self, n, batch):
+        rng = numpy.random.default_rng(42)
+        mid = rng.normal(size=(batch, n, n)) + n * numpy.eye(n)
+        rad = 1e-6 * numpy.abs(mid)
+        self.matrices = ArrayInterval._from_bounds(rad - mid, mid + rad)
+        self.rhs = rng.normal(size=(batch, n))
+
+    def time_solve(self, n, batch):
+        _ = solve_batched(self.matrices, self.rhs)
+
+    def time_solve_midrad(self, n, batch):
+        _ = solve_batched(self.matrices, self.rhs, method="midrad")
+
+
+class TimeSolveDense:
+    """Verifizierte Lösung eines dichten Intervall-Gleichungssystems."""
+
+    params = [200, 1000]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = numpy.random.default_rng(42)
+        mid = rng.normal(size=(n, n))
+        rad = 1e-10 * numpy.abs(mid)
+        self.matrix = ArrayInterval._from_bounds(rad - mid, mid + rad)
+        self.rhs = rng.normal(size=n)
+
+    def time_solve(self, n):
+        _ = solve(self.matrix, self.rhs)
+
+    def peakmem_solve(self, n):
+        _ = solve(self.matrix, self.rhs)
+
+
+class TimeIntervalFactorization:
+    """Einmal vorkonditionieren, dann viele rechte Seiten lösen."""
+
+    params = [200, 1000]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = numpy.random.default_rng(42)
+        mid = rng.normal(size=(n, n))
+        rad = 1e-10 * numpy.abs(mid)
+        self.matrix = ArrayInterval._from_bounds(rad - mid, mid + rad)
+        self.factorization = IntervalFactorization(self.matrix)
+        self.rhs = rng.normal(size=n)
+        self.columns = rng.normal(size=(n, 100))
+
+    def time_factorize(self, n):
+        _ = IntervalFactorization(self.matrix)
+
+    def time_solve(self, n):
+        _ = self.factorization.solve(self.rhs)
+
+    def time_solve_100_columns(self, n):
+        _ = self.factorization.solve(self.columns)
+
+
+class TimeScalarConversion:
+    """Umwandlung zwischen ScalarInterval-Listen und ArrayInterval."""
+
+    params = [1000, 100000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        lower = numpy.random.default_rng(42).normal(size=size)
+        self.array = ArrayInterval._from_bounds(-lower, lower + 1.0)
+        self.scalars = self.array.tolist()
+
+    def time_from_scalar_intervals(self, size):
+        _ = ArrayInterval.from_scalar_intervals(self.scalars)
+
+    def time_tolist(self, size):
+        _ = self.array.tolist()
+
+    def time_element_proxy(self, size):
+        element = self.array[size // 2]
+        _ = element * element + 1.0
+
+
+class TimeIntervalList:
+    """Kompakte Intervall-Liste im Vergleich zur Python-Liste."""
+
+    params = [100000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        lower = numpy.random.default_rng(42).normal(size=size).tolist()
+        self.scalars = [ScalarInterval._from_bounds(v, v + 1) for v in lower]
+        self.compact = IntervalList(self.scalars)
+
+    def time_append(self, size):
+        compact = IntervalList()
+        for value in self.scalars:
+            compact.append(value)
+
+    def time_sort(self, size):
+        self.compact[:].sort()
+
+    def time_to_array_interval(self, size):
+        _ = self.compact.to_array_interval()
+
+    def peakmem_interval_list(self, size):
+        _ = IntervalList(self.scalars)
+
+
+class TimeIntervalMemmap:
+    """Blockweise Verarbeitung einer Intervall-Datei (Zeit und Speicher)."""
+
+    params = [10_000_000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.directory = tempfile.mkdtemp()
+        lower = numpy.random.default_rng(42).normal(size=size)
+        self.mapped = IntervalMemmap.from_array(
+            os.path.join(self.directory, "values.npy"),
+            ArrayInterval._from_bounds(-lower, lower + 1.0),
+        )
+
+    def teardown(self, size):
+        shutil.rmtree(self.directory)
+
+    def time_map(self, size):
+        self.mapped.map(
+            lambda chunk: chunk * chunk + 1.0,
+            out=os.path.join(self.directory, "result.npy"),
+        )
+
+    def time_sum(self, size):
+        _ = self.mapped.sum()
+
+    def peakmem_sum(self, size):
+        _ = self.mapped.sum()
+
+
+def _scalar_offsets(values, offset):
+    """Skalarer Code pro Element, hält den GIL."""
+    for pos in range(len(values)):
+        element = values[pos]
+        element += offset
+
+
+class TimeProcessExecutor:
+    """Prozess-Pool auf Intervallen im Shared Memory."""
+
+    params = [1, 4]
+    param_names = ["workers"]
+
+    def setup(self, workers):
+        lower = numpy.random.default_rng(42).normal(size=200_000)
+        self.shared = SharedArrayInterval.from_array(
+            ArrayInterval._from_bounds(-lower, lower + 1.0)
+        )
+        self.executor = ProcessExecutor(workers, min_chunk=1)
+        self.executor.map(_scalar_offsets, self.shared, 0.0)
+
+    def teardown(self, workers):
+        self.executor.shutdown()
+        self.shared.unlink()
+
+    def time_scalar_code(self, workers):
+        self.executor.map(_scalar_offsets, self.shared, 1.0)
+
+
+class TimeIntervalIO:
+    """Binärformat im Vergleich zu pickle einer ScalarInterval-Liste."""
+
+    params = [100000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        lower = numpy.random.default_rng(42).normal(size=size)
+        self.values = ArrayInterval._from_bounds(-lower, lower + 1.0)
+        self.scalars = self.values.to_scalar_intervals().tolist()
+        self.pickled = pickle.dumps(self.scalars)
+        self.data = interval_io.dumps(self.values)
+
+    def time_pickle_dumps(self, size):
+        _ = pickle.dumps(self.scalars)
+
+    def time_pickle_loads(self, size):
+        _ = pickle.loads(self.pickled)
+
+    def time_dumps(self, size):
+        _ = interval_io.dumps(self.values)
+
+    def time_loads(self, size):
+        _ = interval_io.loads(self.data)
+
+    def time_dumps_compressed(self, size):
+        _ = interval_io.dumps(self.values, compress=True)
+
+    def track_bytes_pickle(self, size):
+        return len(self.pickled)
+
+    def track_bytes_dumps(self, size):
+        return len(self.data)
+
+
+class TimeArrowColumns:
+    """Spalten-Export im Arrow-Layout gegenüber dem Record-Array."""
+
+    params = [1_000_000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        lower = numpy.random.default_rng(42).normal(size=size)
+        self.values = ArrayInterval._from_bounds(-lower, lower + 1.0)
+        self.columns = self.values.arrow_columns()
+
+    def time_records(self, size):
+        _ = self.values.to_structured()
+
+    def time_arrow_columns(self, size):
+        _ = self.values.arrow_columns()
+
+    def time_from_arrow_columns(self, size):
+        _ = ArrayInterval.from_arrow_columns(**self.columns)
+
+
+class TimeIntervalAccumulator:
+    """Laufende Aggregation eines Generators gegenüber ScalarInterval-Summe."""
+
+    params = [100000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        lower = numpy.random.default_rng(42).normal(size=size).tolist()
+        self.pairs = [(value, value + 1.0) for value in lower]
+
+    def time_scalar_sum(self, size):
+        total = ScalarInterval(0)
+        for lower, upper in self.pairs:
+            total += ScalarInterval(lower, upper)
+
+    def time_accumulator(self, size):
+        acc = IntervalAccumulator(pair for pair in self.pairs)
+        _ = acc.sum(), acc.hull(), acc.mean()
+
+    def time_accumulator_batches(self, size):
+        acc = IntervalAccumulator()
+        for start in range(0, size, 1000):
+            acc.add(ArrayInterval(self.pairs[start : start + 1000]))
+        _ = acc.sum(), acc.hull(), acc.mean()
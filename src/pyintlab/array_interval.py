@@ -3,21 +3,38 @@ Numpy-basierte Intervall-Arrays mit garantierter Outward Rounding.
 Unterstützt Linux, macOS und Windows.
 
 Architektur:
-- Nutzt structured dtype: [('lowerbound', '<f8'), ('upperbound', '<f8')]
+- Speichert zwei getrennte, C-zusammenhängende float64-Puffer für die
+  negierte untere und die obere Schranke (struct of arrays), alle
+  Arithmetik läuft darauf und rundet nur aufwärts.
+- Der structured dtype [('lowerbound', '<f8'), ('upperbound', '<f8')]
+  wird nur bei Bedarf für Interop erzeugt (to_structured).
+- Indizierung liefert Views auf die Puffer, einzelne Elemente als
+  ScalarIntervalView, die ScalarInterval-Arithmetik beherrscht.
 - ScalarInterval ist die Referenz für Korrektheit.
-- RoundingContext steuert fesetround (Unix) bzw. _controlfp (Windows).
+- RoundingContext steuert fesetround (Unix) bzw. _control87 (Windows) und
+  stellt beim Verlassen den vorherigen Modus wieder her.
+- RoundingSession setzt den Modus einmal für viele Operationen,
+  rounding_statistics zählt die Umschaltungen.
+- Ohne Rundungssteuerung (ROUNDING_FALLBACK) wird zum nächsten Wert
+  gerundet und jedes Ergebnis per np.nextafter eine ulp nach außen
+  geschoben, Summen nutzen fehlerfreie Transformationen.
 """
 
 from __future__ import annotations
 
 import ctypes
 import platform
-from typing import Tuple, Union
+import threading
+from numbers import Integral, Real
+from typing import Callable, Tuple, Union
 
 import numpy as np
 
+from .scalar_interval import ScalarInterval, ScalarIntervalView
+
 # --- Platform-specific Rounding Setup ---
 _OS = platform.system()
+_MACHINE = platform.machine().lower()
 
 
 class RoundingMode:
@@ -27,11 +44,53 @@ class RoundingMode:
     TOWARDZERO = 3
 
 
+# Platform values of the modes (FE_* of <fenv.h>, _RC_* on Windows).
+if _OS == "Windows":
+    _MODE_BITS = {
+        RoundingMode.TONEAREST: 0x000,
+        RoundingMode.DOWNWARD: 0x100,
+        RoundingMode.UPWARD: 0x200,
+        RoundingMode.TOWARDZERO: 0x300,
+    }
+elif _MACHINE in ("arm64", "aarch64"):
+    _MODE_BITS = {
+        RoundingMode.TONEAREST: 0x000000,
+        RoundingMode.DOWNWARD: 0x800000,
+        RoundingMode.UPWARD: 0x400000,
+        RoundingMode.TOWARDZERO: 0xC00000,
+    }
+elif _MACHINE.startswith(("ppc", "powerpc", "s390")):
+    _MODE_BITS = {
+        RoundingMode.TONEAREST: 0,
+        RoundingMode.DOWNWARD: 3,
+        RoundingMode.UPWARD: 2,
+        RoundingMode.TOWARDZERO: 1,
+    }
+elif _MACHINE.startswith("riscv"):
+    _MODE_BITS = {
+        RoundingMode.TONEAREST: 0,
+        RoundingMode.DOWNWARD: 2,
+        RoundingMode.UPWARD: 3,
+        RoundingMode.TOWARDZERO: 1,
+    }
+else:  # x86, x86_64
+    _MODE_BITS = {
+        RoundingMode.TONEAREST: 0x000,
+        RoundingMode.DOWNWARD: 0x400,
+        RoundingMode.UPWARD: 0x800,
+        RoundingMode.TOWARDZERO: 0xC00,
+    }
+_MODE_FROM_BITS = {bits: mode for mode, bits in _MODE_BITS.items()}
+# _MCW_RC, rounding control mask of _control87
+_WINDOWS_RC_MASK = 0x300
+
 _HAS_ROUNDING_CONTROL = False
 
 if _OS == "Windows":
     try:
         _libc = ctypes.windll.msvcrt
+        _libc._control87.argtypes = [ctypes.c_uint, ctypes.c_uint]
+        _libc._control87.restype = ctypes.c_uint
         _HAS_ROUNDING_CONTROL = True
     except Exception:
         _HAS_ROUNDING_CONTROL = False
@@ -41,20 +100,73 @@ else:
         _fesetround = _libc.fesetround
         _fesetround.argtypes = [ctypes.c_int]
         _fesetround.restype = ctypes.c_int
-        _HAS_ROUNDING_CONTROL = True
+        _fegetround = _libc.fegetround
+        _fegetround.argtypes = []
+        _fegetround.restype = ctypes.c_int
+        # reject a wrong table of FE_* values instead of rounding silently
+        # to nearest
+        _HAS_ROUNDING_CONTROL = (
+            _fegetround() in _MODE_FROM_BITS
+            and _fesetround(_MODE_BITS[RoundingMode.UPWARD]) == 0
+            and _fegetround() == _MODE_BITS[RoundingMode.UPWARD]
+        )
+        _fesetround(_MODE_BITS[RoundingMode.TONEAREST])
     except Exception:
         _HAS_ROUNDING_CONTROL = False
 
 
+class RoundingStatistics:
+    """Process-wide counters of rounding mode changes."""
+
+    __slots__ = ("switches", "skipped")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        # fesetround/_control87 calls performed
+        self.switches = 0
+        # RoundingContexts that found their mode already set
+        self.skipped = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"RoundingStatistics(switches={self.switches}, "
+            f"skipped={self.skipped})"
+        )
+
+
+rounding_statistics = RoundingStatistics()
+
+
+def get_rounding_mode() -> int:
+    """Current RoundingMode of the calling thread."""
+    if not _HAS_ROUNDING_CONTROL:
+        return RoundingMode.TONEAREST
+    if _OS == "Windows":
+        return _MODE_FROM_BITS[_libc._control87(0, 0) & _WINDOWS_RC_MASK]
+    return _MODE_FROM_BITS[_fegetround()]
+
+
 def set_rounding_mode(mode: int):
     if not _HAS_ROUNDING_CONTROL:
         return
+    rounding_statistics.switches += 1
     if _OS == "Windows":
         # Windows: _control87(value, mask)
-        # Rounding control bits are 10-11. Mask is 0x0300.
-        _libc._control87(mode << 10, 0x0300)
+        _libc._control87(_MODE_BITS[mode], _WINDOWS_RC_MASK)
     else:
-        _fesetround(mode)
+        _fesetround(_MODE_BITS[mode])
+
+
+# Rounding mode is per thread, so are the active sessions.
+_thread_state = threading.local()
+
+
+def _session_mode() -> Union[int, None]:
+    """Mode pinned by the innermost RoundingSession of this thread."""
+    sessions = getattr(_thread_state, "sessions", None)
+    return sessions[-1] if sessions else None
 
 
 class RoundingContext:
@@ -62,16 +174,94 @@ class RoundingContext:
 
     def __init__(self, mode: int):
         self.mode = mode
-        self.old_mode = RoundingMode.TONEAREST
+        self.old_mode = None
 
     def __enter__(self):
+        self.old_mode = None
         if _HAS_ROUNDING_CONTROL:
+            current = _session_mode()
+            if current is None:
+                current = get_rounding_mode()
+            if current == self.mode:
+                rounding_statistics.skipped += 1
+            else:
+                self.old_mode = current
+                set_rounding_mode(self.mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.old_mode is not None:
+            set_rounding_mode(self.old_mode)
+
+
+class RoundingSession:
+    """
+    Pin the rounding mode for a whole block of ArrayInterval operations.
+
+    The mode is set once on entry and the previous mode is restored on exit.
+    In between, every RoundingContext asking for the same mode is a no-op,
+    so a pipeline of ArrayInterval operations (which all round upward) costs
+    a single switch instead of two per operation. Contexts for other modes
+    still switch and come back to the session mode. Sessions nest and are
+    per thread. Plain float arithmetic inside the block is rounded in the
+    session mode as well. Do not call set_rounding_mode inside a session.
+
+    switches holds the number of mode changes performed process-wide while
+    the session was active, available after exit.
+    """
+
+    def __init__(self, mode: int = RoundingMode.UPWARD):
+        self.mode = mode
+        self.old_mode = RoundingMode.TONEAREST
+        self.switches = 0
+        self._start = 0
+
+    def __enter__(self):
+        if not hasattr(_thread_state, "sessions"):
+            _thread_state.sessions = []
+        current = _session_mode()
+        self.old_mode = get_rounding_mode() if current is None else current
+        self._start = rounding_statistics.switches
+        if self.old_mode != self.mode:
             set_rounding_mode(self.mode)
+        _thread_state.sessions.append(self.mode)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if _HAS_ROUNDING_CONTROL:
-            set_rounding_mode(RoundingMode.TONEAREST)
+        _thread_state.sessions.pop()
+        if self.old_mode != self.mode:
+            set_rounding_mode(self.old_mode)
+        self.switches = rounding_statistics.switches - self._start
+
+
+# --- Fallback without rounding control ---
+# Without fesetround/_control87 (PyPy, some musl builds) the ArrayInterval
+# kernels compute in round to nearest and step every result one ulp upward
+# by np.nextafter, sums switch to error-free transformations. Selected
+# automatically, setting it to True tries the fallback anywhere.
+ROUNDING_FALLBACK = not _HAS_ROUNDING_CONTROL
+
+
+def _kernel_mode() -> int:
+    """Rounding mode the ArrayInterval kernels run in."""
+    if ROUNDING_FALLBACK:
+        return RoundingMode.TONEAREST
+    return RoundingMode.UPWARD
+
+
+def _upward(x: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
+    """
+    Upper bound of the exact result of one kernel operation.
+
+    In fallback mode x was rounded to nearest, off by at most half an ulp,
+    so the next float upward bounds the exact value. x is stepped in place
+    if it is an array. With rounding control x already is rounded upward.
+    """
+    if not ROUNDING_FALLBACK:
+        return x
+    return np.nextafter(
+        x, np.inf, out=x if isinstance(x, np.ndarray) else None
+    )
 
 
 # --- Structured dtype ---
@@ -80,184 +270,1500 @@ scalar_interval_dtype = np.dtype(
 )
 
 
+# --- ScalarInterval interop ---
+# One pass over object arrays, anything with lowerbound and upperbound
+# counts as interval, numbers become point intervals.
+_scalar_bounds = np.frompyfunc(
+    lambda val: (
+        getattr(val, "lowerbound", val),
+        getattr(val, "upperbound", val),
+    ),
+    1,
+    2,
+)
+_scalar_intervals = np.frompyfunc(ScalarInterval._from_bounds, 2, 1)
+
+
+def _check_bounds(nlb: np.ndarray, ub: np.ndarray) -> None:
+    """
+    ValueError unless every lower bound is <= its upper bound.
+
+    NaN is only valid in both bounds, the empty interval of isempty.
+    """
+    lb = np.negative(nlb)
+    if not np.all(np.less_equal(lb, ub) | (np.isnan(lb) & np.isnan(ub))):
+        raise ValueError(
+            "Lower bound must be <= upper bound for all intervals."
+        )
+
+
+def _column(values) -> np.ndarray:
+    """Flat float64 view of an exported column, raw bytes as float64."""
+    if isinstance(values, (bytes, bytearray, memoryview)) and (
+        memoryview(values).format in ("B", "b", "c")
+    ):
+        return np.frombuffer(values, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64).reshape(-1)
+
+
+# --- Elementary functions ---
+# Outward widening in ulps of the results of NumPy's transcendental float64
+# ufuncs, whose SIMD variants are accurate to 4 ulp.
+ELEMENTARY_ULPS = 4
+# sin and cos of intervals reaching beyond are bounded by [-1, 1] only.
+_TRIG_REDUCTION_LIMIT = 2.0**52
+
+
+# --- Matmul blocking ---
+# Default algorithm of ArrayInterval.matmul, "blocked" or "midrad".
+MATMUL_METHOD = "blocked"
+# Upper limit in bytes for the temporaries of one ArrayInterval.matmul tile.
+MATMUL_MEMORY_BUDGET = 256 * 2**20
+# float64 temporaries per element of the (m, k, n) product cube:
+# two candidate products, two selected factors, one bound kept alive.
+_MATMUL_BYTES_PER_ELEMENT = 5 * 8
+
+
+def _matmul_tiles(
+    batch: int, m: int, k: int, n: int, memory_budget: int
+) -> Tuple[int, int, int]:
+    """
+    Tile sizes (m_tile, k_tile, n_tile) keeping one product cube tile of
+    batch * m_tile * k_tile * n_tile elements within memory_budget.
+
+    Rows are cut first, then the summation length, then the columns.
+    """
+    elements = max(1, memory_budget // _MATMUL_BYTES_PER_ELEMENT // batch)
+    k_tile = max(1, min(k, elements // n))
+    n_tile = max(1, min(n, elements // k_tile))
+    m_tile = max(1, min(m, elements // (k_tile * n_tile)))
+    return m_tile, k_tile, n_tile
+
+
+# --- Reductions ---
+# Default algorithm of ArrayInterval.sum, "rounding" or "eft".
+SUM_METHOD = "rounding"
+_EPS = np.finfo(np.float64).eps / 2
+
+
+def _reduction_axes(
+    ndim: int, axis: Union[int, Tuple[int, ...], None]
+) -> Tuple[int, ...]:
+    """Sorted non-negative reduction axes, all of them for None."""
+    if axis is None:
+        return tuple(range(ndim))
+    return tuple(sorted(np.lib.array_utils.normalize_axis_tuple(axis, ndim)))
+
+
+def _axes_first(x: np.ndarray, axes: Tuple[int, ...]) -> np.ndarray:
+    """View or copy of x with the reduction axes merged into the first."""
+    moved = np.moveaxis(x, axes, range(len(axes)))
+    return moved.reshape((-1,) + moved.shape[len(axes) :])  # noqa: E203
+
+
+def _reduced_shape(
+    shape: Tuple[int, ...], axes: Tuple[int, ...], keepdims: bool
+) -> Tuple[int, ...]:
+    """Result shape of a reduction of shape over axes."""
+    if keepdims:
+        return tuple(
+            1 if pos in axes else size for pos, size in enumerate(shape)
+        )
+    return tuple(size for pos, size in enumerate(shape) if pos not in axes)
+
+
+def _two_sum(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Knuth's TwoSum: a + b = s + e exactly, rounding to nearest."""
+    s = a + b
+    z = s - a
+    return s, (a - (s - z)) + (b - z)
+
+
+def _upper_sum_eft(x: np.ndarray) -> np.ndarray:
+    """
+    Upper bound of the exact sum of x along the first axis.
+
+    Rounds to nearest only. The sum is built pairwise by TwoSum, which
+    leaves s and error terms e with sum(x) = s + sum(e) exactly. The error
+    terms are summed in floating point, their rounding error is below
+    2 * (n + 1) * eps * sum(|e|), which is added before two final steps
+    upward by nextafter. The result is within a few ulps of the exact sum.
+    Non-finite sums are taken over from the plain sum.
+    """
+    n = x.shape[0]
+    if n == 0:
+        return np.zeros(x.shape[1:])
+    err_sum = np.zeros(x.shape[1:])
+    err_abs = np.zeros(x.shape[1:])
+    part = x
+    with np.errstate(invalid="ignore", over="ignore"):
+        while part.shape[0] > 1:
+            half = part.shape[0] // 2
+            pair_sum, pair_err = _two_sum(part[:half], part[half : 2 * half])
+            err_sum += pair_err.sum(axis=0)
+            err_abs += np.abs(pair_err).sum(axis=0)
+            if part.shape[0] % 2:
+                pair_sum = np.concatenate((pair_sum, part[2 * half :]))
+            part = pair_sum
+        # factor 2 covers the rounding of err_abs and of the bound itself
+        bound = np.nextafter(4 * (n + 1) * _EPS * err_abs, np.inf)
+        res = np.nextafter(part[0] + err_sum, np.inf)
+        res = np.nextafter(res + bound, np.inf)
+    return np.asarray(np.where(np.isfinite(res), res, x.sum(axis=0)))
+
+
+def _upper_cumsum_nearest(x: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Upper bounds of the running sums of x along axis, rounding to nearest.
+
+    The k-th running sum is off by at most (k - 1) * eps times the running
+    sum of |x| (Higham, Lemma 3.1), twice that bound is added.
+    """
+    n = x.shape[axis]
+    with RoundingContext(RoundingMode.TONEAREST):
+        bound = 4 * (n + 1) * _EPS * np.cumsum(np.abs(x), axis=axis)
+        res = np.cumsum(x, axis=axis)
+        res += np.nextafter(bound, np.inf, out=bound)
+        return np.nextafter(res, np.inf, out=res)
+
+
+def _accumulate(res: np.ndarray, products: np.ndarray) -> None:
+    """Add the sums of products over their axis -2 to res, in _kernel_mode."""
+    if not ROUNDING_FALLBACK:
+        res += products.sum(axis=-2)
+        return
+    res += _upper_sum_eft(np.moveaxis(products, -2, 0))
+    np.nextafter(res, np.inf, out=res)
+
+
+def _midrad_radius(
+    a_mid: np.ndarray,
+    a_rad: np.ndarray,
+    b_mid: np.ndarray,
+    b_rad: np.ndarray,
+) -> np.ndarray:
+    """
+    |mA| @ rB + rA @ (|mB| + rB), one BLAS product if a factor is a point.
+
+    Point factors are common, e.g. preconditioners and approximate
+    solutions in array_linalg.
+    """
+    if not a_rad.any():
+        return np.matmul(np.abs(a_mid), b_rad)
+    if not b_rad.any():
+        return np.matmul(a_rad, np.abs(b_mid))
+    rad = np.matmul(np.abs(a_mid), b_rad)
+    rad += np.matmul(a_rad, np.abs(b_mid) + b_rad)
+    return rad
+
+
+def _nearest_midrad(
+    nlb: np.ndarray, ub: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Midpoints and radii enclosing [-nlb, ub], rounding to nearest.
+
+    A difference rounded to zero is exact, so point intervals keep radius
+    zero, all others are stepped up by one ulp.
+    """
+    mid = 0.5 * (ub - nlb)
+    rad = np.maximum(ub - mid, mid + nlb)
+    np.nextafter(rad, np.inf, out=rad, where=rad != 0)
+    return mid, rad
+
+
+def _matmul_midrad_nearest(
+    a_nlb: np.ndarray,
+    a_ub: np.ndarray,
+    b_nlb: np.ndarray,
+    b_ub: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """ArrayInterval._matmul_midrad rounding to nearest only."""
+    a_mid, a_rad = _nearest_midrad(a_nlb, a_ub)
+    b_mid, b_rad = _nearest_midrad(b_nlb, b_ub)
+    inner = a_mid.shape[-1]
+
+    mid = np.matmul(a_mid, b_mid)
+    rad = _midrad_radius(a_mid, a_rad, b_mid, b_rad)
+    error = np.matmul(np.abs(a_mid), np.abs(b_mid))
+    error += rad
+    error *= 4 * (inner + 2) * _EPS
+    rad += error
+    rad += (inner + 2) * np.finfo(np.float64).smallest_subnormal
+    np.nextafter(rad, np.inf, out=rad)
+
+    res_nlb = np.nextafter(rad - mid, np.inf)
+    res_ub = np.nextafter(rad + mid, np.inf)
+    return res_nlb, res_ub
+
+
 class ArrayInterval:
     """
-    Represents an array of intervals using a NumPy structured array.
+    Represents an array of intervals as two contiguous float64 buffers.
+
+    The lower bounds are stored negated. With -[a, b] = [-b, -a] every
+    downward rounded result is minus an upward rounded one, so each
+    operation runs in RoundingMode.UPWARD only. lowerbound converts back
+    on access.
 
     Attributes:
-        _arr (np.ndarray): The underlying structured array.
+        _nlb (np.ndarray): Negated lower bounds, C-contiguous unless a view.
+        _ub (np.ndarray): Upper bounds of the same shape.
     """
 
-    def __init__(self, data: Union[list, np.ndarray]):
+    def __init__(
+        self, data: Union[list, np.ndarray, ArrayInterval, ScalarInterval]
+    ):
+        if isinstance(data, ArrayInterval):
+            self._set_bounds(data._nlb.copy(), data._ub.copy())
+            return
+        if isinstance(data, ScalarInterval) or (
+            isinstance(data, np.ndarray) and data.dtype == object
+        ):
+            res = ArrayInterval.from_scalar_intervals(data)
+            self._set_bounds(res._nlb, res._ub)
+            return
         if isinstance(data, np.ndarray):
             if data.dtype == scalar_interval_dtype:
-                self._arr = data
+                lb, ub = data["lowerbound"], data["upperbound"]
+            elif data.ndim == 2 and data.shape[1] == 2:
+                # 2D array of shape (N, 2)
+                lb, ub = data[:, 0], data[:, 1]
             else:
-                # Try to convert if it's a 2D array of shape (N, 2)
-                if data.ndim == 2 and data.shape[1] == 2:
-                    res = np.empty(data.shape[0], dtype=scalar_interval_dtype)
-                    res["lowerbound"] = data[:, 0]
-                    res["upperbound"] = data[:, 1]
-                    self._arr = res
-                else:
-                    raise ValueError("Invalid data type for ArrayInterval")
+                raise ValueError("Invalid data type for ArrayInterval")
         else:
-            # Assume list of tuples/lists
-            self._arr = np.array(data, dtype=scalar_interval_dtype)
+            # Assume list of tuples/lists, else (nested) ScalarIntervals
+            try:
+                arr = np.array(data, dtype=scalar_interval_dtype)
+            except TypeError:
+                res = ArrayInterval.from_scalar_intervals(data)
+                self._set_bounds(res._nlb, res._ub)
+                return
+            lb, ub = arr["lowerbound"], arr["upperbound"]
+        self._set_bounds(np.negative(lb), ub)
 
-        # Validate intervals
-        if np.any(self._arr["lowerbound"] > self._arr["upperbound"]):
-            raise ValueError(
-                "Lower bound must be <= upper bound for all intervals."
-            )
+    def _set_bounds(
+        self, nlb: Union[np.ndarray, float], ub: Union[np.ndarray, float]
+    ) -> None:
+        """Store negated lower and upper bounds as contiguous buffers."""
+        self._nlb = np.asarray(nlb, dtype=np.float64, order="C")
+        self._ub = np.asarray(ub, dtype=np.float64, order="C")
+        if self._nlb.shape != self._ub.shape:
+            raise ValueError("Lower and upper bounds differ in shape.")
+        _check_bounds(self._nlb, self._ub)
 
     @property
     def shape(self) -> Tuple[int, ...]:
-        return self._arr.shape
+        return self._ub.shape
 
     @property
     def ndim(self) -> int:
-        return self._arr.ndim
+        return self._ub.ndim
 
     @property
     def lowerbound(self) -> np.ndarray:
-        return self._arr["lowerbound"]
+        # out= keeps 0-d results arrays
+        return np.negative(self._nlb, out=np.empty_like(self._nlb))
 
     @property
     def upperbound(self) -> np.ndarray:
-        return self._arr["upperbound"]
+        return self._ub
+
+    @staticmethod
+    def _structured(
+        nlb: Union[np.ndarray, float], ub: Union[np.ndarray, float]
+    ) -> np.ndarray:
+        res = np.empty(np.shape(ub), dtype=scalar_interval_dtype)
+        np.negative(nlb, out=res["lowerbound"])
+        res["upperbound"] = ub
+        return res
+
+    def to_structured(self) -> np.ndarray:
+        """Copy of the intervals as array of scalar_interval_dtype."""
+        return self._structured(self._nlb, self._ub)
 
     def __getitem__(self, idx):
-        return self._arr[idx]
+        """
+        Intervals at idx without copying the bounds.
+
+        A single element is a ScalarIntervalView into the buffers, whose
+        in-place operators write through. Slices give views of the same
+        type, fancy indexing copies as for ndarray.
+        """
+        nlb = self._nlb[idx]
+        if not isinstance(nlb, np.ndarray):
+            return ScalarIntervalView(self._nlb, self._ub, idx)
+        return self._view(nlb, self._ub[idx])
+
+    def __iter__(self):
+        """Iterate over the first axis like an ndarray."""
+        for pos in range(len(self)):
+            yield self[pos]
 
     def __setitem__(self, idx, value):
-        self._arr[idx] = value
+        if isinstance(value, ArrayInterval):
+            nlb, ub = value._nlb, value._ub
+        elif isinstance(value, ScalarInterval):
+            nlb, ub = -value.lowerbound, value.upperbound
+        else:
+            value = np.asarray(value, dtype=scalar_interval_dtype)
+            nlb, ub = np.negative(value["lowerbound"]), value["upperbound"]
+        if np.any(np.less(ub, np.negative(nlb))):
+            raise ValueError(
+                "Lower bound must be <= upper bound for all intervals."
+            )
+        self._nlb[idx] = nlb
+        self._ub[idx] = ub
 
     def __repr__(self) -> str:
-        return f"ArrayInterval(shape={self.shape}, dtype={self._arr.dtype})"
+        return (
+            f"{type(self).__name__}(shape={self.shape}, "
+            f"dtype={scalar_interval_dtype})"
+        )
+
+    # --- Views ---
+    # Structural operations share the bound buffers like their ndarray
+    # counterparts (copying only where NumPy has to) and keep the type.
+
+    def _view(self, nlb: np.ndarray, ub: np.ndarray) -> ArrayInterval:
+        """Interval array of the type of self on the given bounds."""
+        res = object.__new__(type(self))
+        res._nlb = nlb
+        res._ub = ub
+        return res
+
+    @property
+    def size(self) -> int:
+        return self._ub.size
+
+    def __len__(self) -> int:
+        return len(self._ub)
+
+    def reshape(self, *shape) -> ArrayInterval:
+        """Intervals in a new shape, a view whenever ndarray.reshape is."""
+        return self._view(self._nlb.reshape(*shape), self._ub.reshape(*shape))
+
+    def transpose(self, *axes) -> ArrayInterval:
+        """View with permuted axes."""
+        return self._view(
+            self._nlb.transpose(*axes), self._ub.transpose(*axes)
+        )
+
+    @property
+    def T(self) -> ArrayInterval:
+        return self.transpose()
+
+    def ravel(self) -> ArrayInterval:
+        """Flattened intervals, a view if the buffers allow it."""
+        return self._view(self._nlb.ravel(), self._ub.ravel())
+
+    def copy(self) -> ArrayInterval:
+        """Copy with own contiguous buffers."""
+        return self._view(self._nlb.copy(), self._ub.copy())
 
     # --- Arithmetic ---
+    # Everything below rounds upward, lower bounds enter and leave negated.
+    # Every method takes an optional out= ArrayInterval that receives the
+    # result in place. It may be self or an operand, other overlaps with
+    # the operands are not supported.
 
-    def __add__(
-        self, other: Union[ArrayInterval, float, int]
+    @staticmethod
+    def _operand_bounds(
+        other: Union[ArrayInterval, ScalarInterval, Real],
+    ) -> Tuple[Union[np.ndarray, float], Union[np.ndarray, float]]:
+        """
+        Negated lower and upper bound of an operand.
+
+        Numbers (NumPy scalars included) and ScalarIntervals are passed as
+        float64 scalars, so they broadcast without a 0-d array.
+        """
+        if isinstance(other, ArrayInterval):
+            return other._nlb, other._ub
+        if isinstance(other, ScalarInterval):
+            return np.float64(-other.lowerbound), np.float64(other.upperbound)
+        val = np.float64(other)
+        return -val, val
+
+    @staticmethod
+    def _buffers(
+        out: Union[ArrayInterval, None],
+    ) -> Tuple[Union[np.ndarray, None], Union[np.ndarray, None]]:
+        """Bound buffers of out for ufunc out= arguments."""
+        if out is None:
+            return None, None
+        return out._nlb, out._ub
+
+    @staticmethod
+    def _result(
+        res_nlb: Union[np.ndarray, float],
+        res_ub: Union[np.ndarray, float],
+        out: Union[ArrayInterval, None],
     ) -> ArrayInterval:
-        if isinstance(other, (int, float)):
-            lb_other = np.full(self.shape, float(other))
-            ub_other = lb_other
-        else:
-            lb_other, ub_other = other.lowerbound, other.upperbound
+        """Wrap fresh bounds, or copy them into out unless computed there."""
+        if out is None:
+            return ArrayInterval._from_bounds(res_nlb, res_ub)
+        if res_nlb is not out._nlb:
+            np.copyto(out._nlb, res_nlb)
+        if res_ub is not out._ub:
+            np.copyto(out._ub, res_ub)
+        return out
 
-        with RoundingContext(RoundingMode.DOWNWARD):
-            res_lb = self.lowerbound + lb_other
-        with RoundingContext(RoundingMode.UPWARD):
-            res_ub = self.upperbound + ub_other
+    def add(
+        self,
+        other: Union[ArrayInterval, ScalarInterval, Real],
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
+        """Elementwise self + other."""
+        nlb_other, ub_other = self._operand_bounds(other)
+        out_nlb, out_ub = self._buffers(out)
 
-        return self._from_bounds(res_lb, res_ub)
+        with RoundingContext(_kernel_mode()):
+            res_nlb = _upward(np.add(self._nlb, nlb_other, out=out_nlb))
+            res_ub = _upward(np.add(self._ub, ub_other, out=out_ub))
 
-    def __sub__(
-        self, other: Union[ArrayInterval, float, int]
+        return self._result(res_nlb, res_ub, out)
+
+    def subtract(
+        self,
+        other: Union[ArrayInterval, ScalarInterval, Real],
+        out: Union[ArrayInterval, None] = None,
     ) -> ArrayInterval:
-        if isinstance(other, (int, float)):
-            lb_other = np.full(self.shape, float(other))
-            ub_other = lb_other
-        else:
-            lb_other, ub_other = other.lowerbound, other.upperbound
+        """Elementwise self - other."""
+        nlb_other, ub_other = self._operand_bounds(other)
+        # the lower bound reads the upper one of other and vice versa
+        out_nlb, out_ub = self._buffers(None if out is other else out)
 
-        with RoundingContext(RoundingMode.DOWNWARD):
-            res_lb = self.lowerbound - ub_other
-        with RoundingContext(RoundingMode.UPWARD):
-            res_ub = self.upperbound - lb_other
+        with RoundingContext(_kernel_mode()):
+            res_nlb = _upward(np.add(self._nlb, ub_other, out=out_nlb))
+            res_ub = _upward(np.add(self._ub, nlb_other, out=out_ub))
+
+        return self._result(res_nlb, res_ub, out)
 
-        return self._from_bounds(res_lb, res_ub)
+    def _scale(
+        self,
+        ufunc: np.ufunc,
+        value: Real,
+        out: Union[ArrayInterval, None],
+    ) -> ArrayInterval:
+        """Multiply or divide by a number, swapping bounds for negatives."""
+        value = float(value)
+        out_nlb, out_ub = self._buffers(out)
+        with RoundingContext(_kernel_mode()):
+            if value >= 0:
+                res_nlb = ufunc(self._nlb, value, out=out_nlb)
+                res_ub = ufunc(self._ub, value, out=out_ub)
+            else:
+                # out may be self, so keep one swapped bound aside
+                res_ub = ufunc(self._nlb, -value)
+                res_nlb = ufunc(self._ub, -value, out=out_nlb)
+        return self._result(_upward(res_nlb), _upward(res_ub), out)
+
+    def multiply(
+        self,
+        other: Union[ArrayInterval, ScalarInterval, Real],
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
+        """Elementwise self * other."""
+        if isinstance(other, Real):
+            return self._scale(np.multiply, other, out)
+        nlb_other, ub_other = self._operand_bounds(other)
+
+        with RoundingContext(_kernel_mode()):
+            return self._result(
+                *self._mul_bounds(self._nlb, self._ub, nlb_other, ub_other),
+                out,
+            )
+
+    @staticmethod
+    def _mul_bounds(
+        nlb1: Union[np.ndarray, float],
+        ub1: Union[np.ndarray, float],
+        nlb2: Union[np.ndarray, float],
+        ub2: Union[np.ndarray, float],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sign-classified interval product, like ScalarInterval._mulbounds.
+
+        For fixed x the product x*y is extremal at an endpoint of y chosen
+        by the sign of x, and for fixed y it is monotone in x. So each result
+        bound is the better of only two candidates, x = lb1 or x = ub1, each
+        paired with the endpoint of the other factor its sign selects. That
+        halves the products and avoids stacking them for a reduction.
+
+        Bounds are passed and returned as (-lb, ub), the caller has to round
+        in _kernel_mode: the sign of every candidate is moved into the
+        selected endpoint of the second factor, which is exact.
+        """
+        lb2, nub2 = np.negative(nlb2), np.negative(ub2)
+        nonneg_lb1 = np.asarray(nlb1) <= 0
+        nonneg_ub1 = np.asarray(ub1) >= 0
+
+        # -(lb1 * y) = nlb1 * y and -(ub1 * y) = ub1 * -y
+        res_nlb = np.asarray(nlb1 * np.where(nonneg_lb1, lb2, ub2))
+        res_nlb = np.maximum(
+            res_nlb, ub1 * np.where(nonneg_ub1, nlb2, nub2), out=res_nlb
+        )
+        # lb1 * y = nlb1 * -y
+        res_ub = np.asarray(nlb1 * np.where(nonneg_lb1, nub2, nlb2))
+        res_ub = np.maximum(
+            res_ub, ub1 * np.where(nonneg_ub1, ub2, lb2), out=res_ub
+        )
+
+        return _upward(res_nlb), _upward(res_ub)
+
+    def negative(
+        self, out: Union[ArrayInterval, None] = None
+    ) -> ArrayInterval:
+        """Elementwise -self, exact."""
+        if out is None:
+            return self._from_bounds(self._ub.copy(), self._nlb.copy())
+        if out is self:
+            # swap the buffer contents, not the buffers, views stay valid
+            upper = self._ub.copy()
+            np.copyto(out._ub, self._nlb)
+            np.copyto(out._nlb, upper)
+            return out
+        return self._result(self._ub, self._nlb, out)
+
+    def positive(
+        self, out: Union[ArrayInterval, None] = None
+    ) -> ArrayInterval:
+        """Elementwise +self, a copy."""
+        if out is None:
+            return self._from_bounds(self._nlb.copy(), self._ub.copy())
+        return self._result(self._nlb, self._ub, out)
+
+    def reciproc(
+        self, out: Union[ArrayInterval, None] = None
+    ) -> ArrayInterval:
+        """Elementwise 1/x, like ScalarInterval.reciproc."""
+        if np.any((self._nlb >= 0) & (self._ub >= 0)):
+            raise ZeroDivisionError(
+                "Can not build the reziprocal of an indefinite Interval."
+            )
+        out_nlb, _ = self._buffers(out)
+        with RoundingContext(_kernel_mode()):
+            # out may be self, so keep one swapped bound aside
+            res_ub = _upward(np.divide(-1.0, self._nlb))
+            res_nlb = _upward(np.divide(-1.0, self._ub, out=out_nlb))
+
+        return self._result(res_nlb, res_ub, out)
+
+    def divide(
+        self,
+        other: Union[ArrayInterval, ScalarInterval, Real],
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
+        """Elementwise self / other."""
+        if not isinstance(other, Real):
+            return self.multiply(_as_interval(other).reciproc(), out)
+        if other == 0:
+            raise ZeroDivisionError("Can not divide by zero.")
+        return self._scale(np.divide, other, out)
+
+    def absolute(
+        self, out: Union[ArrayInterval, None] = None
+    ) -> ArrayInterval:
+        """Elementwise absolute value, exact."""
+        res_ub = np.maximum(np.abs(self._nlb), np.abs(self._ub))
+        res_nlb = np.where(
+            self._nlb <= 0, self._nlb, np.where(self._ub <= 0, self._ub, 0.0)
+        )
+        return self._result(res_nlb, res_ub, out)
+
+    def __add__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.add(other)
+
+    def __sub__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.subtract(other)
 
     def __mul__(
-        self, other: Union[ArrayInterval, float, int]
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.multiply(other)
+
+    def __truediv__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.divide(other)
+
+    def __iadd__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.add(other, out=self)
+
+    def __isub__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.subtract(other, out=self)
+
+    def __imul__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.multiply(other, out=self)
+
+    def __itruediv__(
+        self, other: Union[ArrayInterval, ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.divide(other, out=self)
+
+    def __radd__(self, other: Union[ScalarInterval, Real]) -> ArrayInterval:
+        return self.add(other)
+
+    def __rmul__(self, other: Union[ScalarInterval, Real]) -> ArrayInterval:
+        return self.multiply(other)
+
+    def __rsub__(self, other: Union[ScalarInterval, Real]) -> ArrayInterval:
+        return self.negative().add(other)
+
+    def __rtruediv__(
+        self, other: Union[ScalarInterval, Real]
+    ) -> ArrayInterval:
+        return self.reciproc().multiply(other)
+
+    def __neg__(self) -> ArrayInterval:
+        return self.negative()
+
+    def __pos__(self) -> ArrayInterval:
+        return self.positive()
+
+    def __abs__(self) -> ArrayInterval:
+        return self.absolute()
+
+    def __pow__(self, exponent: Union[ArrayInterval, Real]) -> ArrayInterval:
+        return self.power(exponent)
+
+    def __rpow__(self, base: Union[ScalarInterval, Real]) -> ArrayInterval:
+        return _as_interval(base).power(self)
+
+    def power(
+        self,
+        exponent: Union[ArrayInterval, Real],
+        out: Union[ArrayInterval, None] = None,
     ) -> ArrayInterval:
-        if isinstance(other, (int, float)):
-            lb_other = np.full(self.shape, float(other))
-            ub_other = lb_other
+        """
+        Elementwise power, widened outward by ELEMENTARY_ULPS.
+
+        Integer exponents are valid for any base (even powers of intervals
+        containing zero start at zero, x**0 is 1 as in ScalarInterval,
+        negative powers are unbounded there, see _inverse_power).
+        All other exponents are bounded by the four corner powers as in
+        ScalarInterval and need base >= 0: negative parts of the base are
+        cut off, completely negative bases give empty (NaN) intervals.
+        """
+        if isinstance(exponent, Integral):
+            exponent = int(exponent)
+            if exponent == 0:
+                ones = np.ones(self.shape)
+                return self._result(np.negative(ones), ones, out)
+            if exponent < 0:
+                return self._inverse_power(-exponent, out)
+        elif isinstance(exponent, Real):
+            exponent = float(exponent)
         else:
-            lb_other, ub_other = other.lowerbound, other.upperbound
+            exponent = _as_interval(exponent)
+        lb, ub = self.lowerbound, self._ub
+        # libm powers are only accurate to nearest, the ulp widening
+        # below relies on that even inside a RoundingSession
+        with (
+            RoundingContext(RoundingMode.TONEAREST),
+            np.errstate(invalid="ignore", divide="ignore"),
+        ):
+            if isinstance(exponent, int):
+                p_lb = np.power(lb, exponent)
+                p_ub = np.power(ub, exponent)
+                if exponent % 2:
+                    res_lb, res_ub = p_lb, p_ub
+                else:
+                    res_lb = np.where(
+                        lb >= 0,
+                        p_lb,
+                        np.where(ub <= 0, p_ub, 0.0),
+                    )
+                    res_ub = np.maximum(p_lb, p_ub)
+            else:
+                if isinstance(exponent, float):
+                    lb_exp = ub_exp = exponent
+                else:
+                    lb_exp, ub_exp = exponent.lowerbound, exponent._ub
+                empty = ub < 0
+                lb = np.maximum(lb, 0.0)
+                corners = [
+                    np.power(lb, lb_exp),
+                    np.power(lb, ub_exp),
+                    np.power(ub, lb_exp),
+                    np.power(ub, ub_exp),
+                ]
+                res_lb = np.where(empty, np.nan, np.minimum.reduce(corners))
+                res_ub = np.where(empty, np.nan, np.maximum.reduce(corners))
 
-        # Interval multiplication: [min(ac, ad, bc, bd), max(ac, ad, bc, bd)]
-        with RoundingContext(RoundingMode.DOWNWARD):
-            p1 = self.lowerbound * lb_other
-            p2 = self.lowerbound * ub_other
-            p3 = self.upperbound * lb_other
-            p4 = self.upperbound * ub_other
-            res_lb = np.minimum.reduce([p1, p2, p3, p4])
+        res_lb, res_ub = self._outward(res_lb, res_ub, ELEMENTARY_ULPS)
+        if not isinstance(exponent, int) or not exponent % 2:
+            res_lb = np.maximum(res_lb, 0.0)
+        return self._result(np.negative(res_lb), res_ub, out)
 
-        with RoundingContext(RoundingMode.UPWARD):
-            p1 = self.lowerbound * lb_other
-            p2 = self.lowerbound * ub_other
-            p3 = self.upperbound * lb_other
-            p4 = self.upperbound * ub_other
-            res_ub = np.maximum.reduce([p1, p2, p3, p4])
+    def _inverse_power(
+        self, exponent: int, out: Union[ArrayInterval, None] = None
+    ) -> ArrayInterval:
+        """
+        Elementwise x**-exponent for exponent > 0, masked at the pole.
 
-        return self._from_bounds(res_lb, res_ub)
+        Bases containing zero give unbounded intervals instead of
+        ZeroDivisionError: [1/max, inf] for even exponents or a zero bound,
+        [-inf, inf] for odd exponents with zero inside. [0, 0] has no
+        power at all, the result is empty (NaN).
+        """
+        lb, ub = self.lowerbound, self._ub
+        odd = bool(exponent % 2)
+        pos = self.power(exponent)
+        p_lb, p_ub = pos.lowerbound, pos._ub
+        # the sign of x**exponent is known, the ulp widening must not
+        # cross zero, signed zeros turn into the right infinities
+        negative = (lb < 0) & (ub <= 0) & odd
+        p_lb = np.where(negative | (p_lb > 0), p_lb, 0.0)
+        p_ub = np.where(~negative | (p_ub < 0), p_ub, -0.0)
+        with (
+            RoundingContext(_kernel_mode()),
+            np.errstate(divide="ignore", over="ignore"),
+        ):
+            res_ub = _upward(np.divide(1.0, p_lb))
+            res_nlb = _upward(np.divide(-1.0, p_ub))
+        if odd:
+            both = (lb < 0) & (ub > 0)
+            res_ub = np.where(both, np.inf, res_ub)
+            res_nlb = np.where(both, np.inf, res_nlb)
+        zero = (lb == 0) & (ub == 0)
+        return self._result(
+            np.where(zero, np.nan, res_nlb),
+            np.where(zero, np.nan, res_ub),
+            out,
+        )
+
+    # --- Elementary functions ---
+
+    @staticmethod
+    def _outward(
+        lb: Union[np.ndarray, float], ub: Union[np.ndarray, float], ulps: int
+    ) -> Tuple[Union[np.ndarray, float], Union[np.ndarray, float]]:
+        """Widen lb and ub by ulps floating point steps outward."""
+        for _ in range(ulps):
+            lb = np.nextafter(lb, -np.inf)
+            ub = np.nextafter(ub, np.inf)
+        return lb, ub
+
+    def _monotone(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        domain: Tuple[float, bool] = (-np.inf, False),
+        image: Tuple[float, float] = (-np.inf, np.inf),
+        ulps: int = ELEMENTARY_ULPS,
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
+        """
+        Increasing func applied to both bounds, widened outward by ulps.
+
+        domain is the lower end of the domain of func and whether it is
+        excluded. Parts of intervals below it are cut off, intervals lying
+        completely outside become empty (NaN bounds), no exception is
+        raised. The result is clipped to image.
+        """
+        domain_lb, domain_open = domain
+        lb, ub = self.lowerbound, self._ub
+        empty = ub <= domain_lb if domain_open else ub < domain_lb
+        with (
+            RoundingContext(RoundingMode.TONEAREST),
+            np.errstate(invalid="ignore", divide="ignore"),
+        ):
+            res_lb = func(np.maximum(lb, domain_lb))
+            res_ub = func(ub)
+        res_lb, res_ub = self._outward(res_lb, res_ub, ulps)
+        res_lb = np.where(empty, np.nan, np.maximum(res_lb, image[0]))
+        res_ub = np.where(empty, np.nan, np.minimum(res_ub, image[1]))
+        return self._result(np.negative(res_lb), res_ub, out)
+
+    def isempty(self) -> np.ndarray:
+        """Mask of empty intervals, as produced outside function domains."""
+        return np.isnan(self._ub)
+
+    def sqrt(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise square root, correctly rounded by IEEE 754."""
+        return self._monotone(np.sqrt, (0.0, False), (0.0, np.inf), 1, out)
+
+    def exp(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise e to the power of the intervals."""
+        return self._monotone(np.exp, image=(0.0, np.inf), out=out)
+
+    def log(
+        self,
+        base: Union[ArrayInterval, Real, None] = None,
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
+        """Elementwise logarithm to the given base or natural if omitted."""
+        if base is None:
+            return self._monotone(np.log, (0.0, True), out=out)
+        if not isinstance(base, ArrayInterval):
+            base = _as_interval(base)
+        return self._monotone(np.log, (0.0, True)).divide(base.log(), out)
+
+    def log2(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise base 2 logarithm."""
+        return self._monotone(np.log2, (0.0, True), out=out)
+
+    def log10(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise base 10 logarithm."""
+        return self._monotone(np.log10, (0.0, True), out=out)
+
+    def log1p(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise natural logarithm of 1+x."""
+        return self._monotone(np.log1p, (-1.0, True), out=out)
+
+    def tanh(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise hyperbolic tangens."""
+        return self._monotone(np.tanh, image=(-1.0, 1.0), out=out)
+
+    def _periodic(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        shift: float,
+        out: Union[ArrayInterval, None],
+    ) -> ArrayInterval:
+        """
+        Range of sin or cos over the intervals.
+
+        func has its maxima at x = pi * (shift + k) for even and its minima
+        for odd integers k. The range of the endpoint values is extended to
+        1 or -1 where such a k lies in [lb / pi - shift, ub / pi - shift],
+        that quotient widened over the error of np.pi and of the division.
+        Intervals reaching beyond _TRIG_REDUCTION_LIMIT give [-1, 1].
+        """
+        lb, ub = self.lowerbound, self._ub
+        with (
+            RoundingContext(RoundingMode.TONEAREST),
+            np.errstate(invalid="ignore"),
+        ):
+            f_lb, f_ub = func(lb), func(ub)
+            q_lb, q_ub = self._outward(lb / np.pi, ub / np.pi, 2)
+            q_lb, q_ub = self._outward(q_lb - shift, q_ub - shift, 1)
+            first, last = np.ceil(q_lb), np.floor(q_ub)
+            hits = first <= last
+            first_even = first % 2 == 0
+            several = first + 1 <= last
+        full = np.maximum(np.abs(lb), np.abs(ub)) >= _TRIG_REDUCTION_LIMIT
+        res_lb, res_ub = self._outward(
+            np.minimum(f_lb, f_ub), np.maximum(f_lb, f_ub), ELEMENTARY_ULPS
+        )
+        res_lb = np.where(
+            full | (hits & (~first_even | several)),
+            -1.0,
+            np.maximum(res_lb, -1.0),
+        )
+        res_ub = np.where(
+            full | (hits & (first_even | several)),
+            1.0,
+            np.minimum(res_ub, 1.0),
+        )
+        return self._result(np.negative(res_lb), res_ub, out)
+
+    def sin(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise sine."""
+        return self._periodic(np.sin, 0.5, out)
+
+    def cos(self, out: Union[ArrayInterval, None] = None) -> ArrayInterval:
+        """Elementwise cosine."""
+        return self._periodic(np.cos, 0.0, out)
 
     def __matmul__(self, other: ArrayInterval) -> ArrayInterval:
+        return self.matmul(other)
+
+    def matmul(
+        self,
+        other: ArrayInterval,
+        memory_budget: Union[int, None] = None,
+        method: Union[str, None] = None,
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
         """
-        Rigorous matrix multiplication using vectorized operations.
+        Rigorous matrix multiplication in memory-bounded blocks.
 
         For C = A @ B, each element C_ij is the sum of products A_ik * B_kj.
         To ensure outward rounding:
-        - Lower bound: Sum of minimum products for each k.
-        - Upper bound: Sum of maximum products for each k.
+        - Lower bound: Sum of lower product bounds, rounded downward.
+        - Upper bound: Sum of upper product bounds, rounded upward.
+        Both are done upward, the lower bound as negated sum.
+
+        The (m, k, n) product cube is never built as a whole. It is cut into
+        tiles whose temporaries fit into memory_budget bytes (default
+        MATMUL_MEMORY_BUDGET), partial sums are accumulated per tile with
+        the same directed rounding. Like numpy.matmul, leading dimensions
+        are broadcast batch dimensions and 1-D operands are treated as
+        vectors, so (..., m, k) @ (..., k, n) stacks and matrix-vector
+        products are supported.
+
+        method selects the algorithm, default MATMUL_METHOD:
+        - "blocked": the tiled infimum-supremum product described above.
+        - "midrad": midpoint-radius product at BLAS speed, see
+          _matmul_midrad for its overestimation bound.
+        """
+        if self.ndim == 0 or other.ndim == 0:
+            raise ValueError("Matmul is not defined for 0-d operands.")
+        if method is None:
+            method = MATMUL_METHOD
+        if method == "midrad":
+            with RoundingContext(_kernel_mode()):
+                return self._result(
+                    *self._matmul_midrad(
+                        self._nlb, self._ub, other._nlb, other._ub
+                    ),
+                    out,
+                )
+        if method != "blocked":
+            raise ValueError(f"Unknown matmul method {method!r}.")
+        if memory_budget is None:
+            memory_budget = MATMUL_MEMORY_BUDGET
+
+        a_nlb, a_ub = self._nlb, self._ub
+        b_nlb, b_ub = other._nlb, other._ub
+        if self.ndim == 1:
+            a_nlb, a_ub = a_nlb[np.newaxis, :], a_ub[np.newaxis, :]
+        if other.ndim == 1:
+            b_nlb, b_ub = b_nlb[:, np.newaxis], b_ub[:, np.newaxis]
+        if a_nlb.shape[-1] != b_nlb.shape[-2]:
+            raise ValueError(
+                f"Matmul shape mismatch: {self.shape} @ {other.shape}."
+            )
+
+        batch = np.broadcast_shapes(a_nlb.shape[:-2], b_nlb.shape[:-2])
+        m, k = a_nlb.shape[-2:]
+        n = b_nlb.shape[-1]
+        m_tile, k_tile, n_tile = _matmul_tiles(
+            int(np.prod(batch)), m, k, n, memory_budget
+        )
+
+        res_nlb = np.zeros(batch + (m, n))
+        res_ub = np.zeros(batch + (m, n))
+        with RoundingContext(_kernel_mode()):
+            for i0 in range(0, m, m_tile):
+                rows = slice(i0, i0 + m_tile)
+                for j0 in range(0, n, n_tile):
+                    cols = slice(j0, j0 + n_tile)
+                    for k0 in range(0, k, k_tile):
+                        inner = slice(k0, k0 + k_tile)
+                        # (..., m_tile, k_tile, 1) * (..., 1, k_tile, n_tile)
+                        prod_nlb, prod_ub = self._mul_bounds(
+                            a_nlb[..., rows, inner, np.newaxis],
+                            a_ub[..., rows, inner, np.newaxis],
+                            b_nlb[..., np.newaxis, inner, cols],
+                            b_ub[..., np.newaxis, inner, cols],
+                        )
+                        _accumulate(res_nlb[..., rows, cols], prod_nlb)
+                        del prod_nlb
+                        _accumulate(res_ub[..., rows, cols], prod_ub)
+                        del prod_ub
+
+        if self.ndim == 1:
+            res_nlb, res_ub = res_nlb[..., 0, :], res_ub[..., 0, :]
+        if other.ndim == 1:
+            res_nlb, res_ub = res_nlb[..., 0], res_ub[..., 0]
+        return self._result(res_nlb, res_ub, out)
+
+    @staticmethod
+    def _matmul_midrad(
+        a_nlb: np.ndarray,
+        a_ub: np.ndarray,
+        b_nlb: np.ndarray,
+        b_ub: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Midpoint-radius matrix product after Rump (BIT 39, 1999).
+
+        Both factors are converted to <mid, rad> form with rounding upward,
+        such that [mid - rad, mid + rad] encloses [lb, ub]. Then
+
+            C_lb = (mA @ mB rounded down) - R
+            C_ub = (mA @ mB rounded up) + R
+            R = |mA| @ rB + rA @ (|mB| + rB)   (rounded up)
+
+        takes four float64 BLAS products, independent of the tile sizes of
+        the blocked algorithm. Rigor requires that the BLAS honors the
+        rounding mode of the calling thread, which holds for the usual
+        SIMD kernels (OpenBLAS, MKL, Accelerate) but not for Strassen-like
+        ones. A multithreaded BLAS has to pass the mode on to its own
+        threads (OpenBLAS built with CONSISTENT_FPCSR=1) or run on one.
+
+        Overestimation: apart from rounding errors the radius of the
+        result is at most 1.5 times the radius of the exact interval
+        product (Rump, Theorem 2.3), and equal to it if one factor is a
+        point matrix or all midpoints have constant sign patterns. The
+        rounding errors add at most about (k + 2) * eps * |mA| @ |mB| for
+        inner dimension k.
+
+        Like _mul_bounds this works on (-lb, ub) and needs rounding upward,
+        C_lb is computed as -((-mA) @ mB) + R. In ROUNDING_FALLBACK mode
+        the products are rounded to nearest and their error is bounded a
+        priori (Higham, Theorem 3.5) by 2 * (k + 2) * eps * (|mA| @ |mB| + R)
+        plus the underflow error, the radius is widened by twice that.
+        """
+        if ROUNDING_FALLBACK:
+            return _matmul_midrad_nearest(a_nlb, a_ub, b_nlb, b_ub)
+        a_mid = 0.5 * (a_ub + a_nlb) - a_nlb
+        a_rad = a_mid + a_nlb
+        b_mid = 0.5 * (b_ub + b_nlb) - b_nlb
+        b_rad = b_mid + b_nlb
+
+        res_nlb = np.matmul(np.negative(a_mid), b_mid)
+        res_ub = np.matmul(a_mid, b_mid)
+        rad = _midrad_radius(a_mid, a_rad, b_mid, b_rad)
+        res_nlb += rad
+        res_ub += rad
+
+        return res_nlb, res_ub
+
+    # --- Reductions ---
+    # axis may be an int, a tuple of ints or None for all axes.
+
+    def sum(
+        self,
+        axis: Union[int, Tuple[int, ...], None] = None,
+        keepdims: bool = False,
+        method: Union[str, None] = None,
+    ) -> ArrayInterval:
+        """
+        Rigorous sum along axis.
+
+        method selects the algorithm, default SUM_METHOD:
+        - "rounding": NumPy's pairwise summation rounded upward, fastest.
+        - "eft": error-free transformations in round to nearest, see
+          _upper_sum_eft. Tight to a few ulps of the exact sums however
+          large the cancellation, and independent of rounding control.
         """
-        if self.ndim != 2 or other.ndim != 2:
-            raise NotImplementedError(
-                "Matmul currently only supported for 2D arrays."
+        if method is None:
+            method = SUM_METHOD
+        if method == "rounding" and ROUNDING_FALLBACK:
+            method = "eft"
+        if method == "rounding":
+            with RoundingContext(RoundingMode.UPWARD):
+                return self._from_bounds(
+                    self._nlb.sum(axis=axis, keepdims=keepdims),
+                    self._ub.sum(axis=axis, keepdims=keepdims),
+                )
+        if method != "eft":
+            raise ValueError(f"Unknown sum method {method!r}.")
+        axes = _reduction_axes(self.ndim, axis)
+        shape = _reduced_shape(self.shape, axes, keepdims)
+        with RoundingContext(RoundingMode.TONEAREST):
+            return self._from_bounds(
+                _upper_sum_eft(_axes_first(self._nlb, axes)).reshape(shape),
+                _upper_sum_eft(_axes_first(self._ub, axes)).reshape(shape),
             )
 
-        m, k = self.shape
-        _, n = other.shape
+    def mean(
+        self,
+        axis: Union[int, Tuple[int, ...], None] = None,
+        keepdims: bool = False,
+        method: Union[str, None] = None,
+    ) -> ArrayInterval:
+        """
+        Rigorous arithmetic mean along axis, summed as in sum.
 
-        # Expand dimensions for broadcasting:
-        # self: (m, k, 1) -> (m, k, n)
-        # other: (k, n) -> (1, k, n)
-        self_lb = self.lowerbound[:, :, np.newaxis]  # (m, k, 1)
-        self_ub = self.upperbound[:, :, np.newaxis]  # (m, k, 1)
-        other_lb = other.lowerbound[np.newaxis, :, :]  # (1, k, n)
-        other_ub = other.upperbound[np.newaxis, :, :]  # (1, k, n)
+        Means over no elements are empty (NaN) intervals, where NumPy
+        returns NaN.
+        """
+        count = int(
+            np.prod(
+                [self.shape[pos] for pos in _reduction_axes(self.ndim, axis)]
+            )
+        )
+        total = self.sum(axis, keepdims, method)
+        if not count:
+            nan = np.full(total.shape, np.nan)
+            return self._from_bounds(nan, nan.copy())
+        return total.divide(count)
 
-        # Compute all four products for each (i, j, k)
-        with RoundingContext(RoundingMode.DOWNWARD):
-            p1 = self_lb * other_lb
-            p2 = self_lb * other_ub
-            p3 = self_ub * other_lb
-            p4 = self_ub * other_ub
+    def prod(
+        self,
+        axis: Union[int, Tuple[int, ...], None] = None,
+        keepdims: bool = False,
+    ) -> ArrayInterval:
+        """
+        Rigorous product along axis.
 
-            # Find min product for each (i, j, k)
-            min_products = np.minimum.reduce([p1, p2, p3, p4])
+        Factors are multiplied pairwise in a tree, each level one vectorized
+        interval product, so there are only log2(n) Python steps.
+        """
+        axes = _reduction_axes(self.ndim, axis)
+        shape = _reduced_shape(self.shape, axes, keepdims)
+        nlb, ub = _axes_first(self._nlb, axes), _axes_first(self._ub, axes)
+        if nlb.shape[0] == 0:
+            return self._from_bounds(np.full(shape, -1.0), np.ones(shape))
+        with RoundingContext(_kernel_mode()):
+            while nlb.shape[0] > 1:
+                half = nlb.shape[0] // 2
+                pair_nlb, pair_ub = self._mul_bounds(
+                    nlb[:half],
+                    ub[:half],
+                    nlb[half : 2 * half],  # noqa: E203
+                    ub[half : 2 * half],  # noqa: E203
+                )
+                if nlb.shape[0] % 2:
+                    pair_nlb = np.concatenate((pair_nlb, nlb[2 * half :]))
+                    pair_ub = np.concatenate((pair_ub, ub[2 * half :]))
+                nlb, ub = pair_nlb, pair_ub
+        return self._from_bounds(nlb[0].reshape(shape), ub[0].reshape(shape))
 
-            # Sum along k-axis with downward rounding
-            res_lb = np.sum(min_products, axis=1)  # (m, n)
+    def cumsum(self, axis: Union[int, None] = None) -> ArrayInterval:
+        """
+        Rigorous running sums along axis, of the flattened array if None.
 
+        In ROUNDING_FALLBACK mode see _upper_cumsum_nearest.
+        """
+        nlb, ub = self._nlb, self._ub
+        if axis is None:
+            nlb, ub, axis = nlb.ravel(), ub.ravel(), 0
+        if ROUNDING_FALLBACK:
+            return self._from_bounds(
+                _upper_cumsum_nearest(nlb, axis),
+                _upper_cumsum_nearest(ub, axis),
+            )
         with RoundingContext(RoundingMode.UPWARD):
-            p1 = self_lb * other_lb
-            p2 = self_lb * other_ub
-            p3 = self_ub * other_lb
-            p4 = self_ub * other_ub
+            return self._from_bounds(
+                np.cumsum(nlb, axis=axis), np.cumsum(ub, axis=axis)
+            )
 
-            # Find max product for each (i, j, k)
-            max_products = np.maximum.reduce([p1, p2, p3, p4])
+    def dot(
+        self,
+        other: Union[ArrayInterval, ScalarInterval, Real],
+        method: Union[str, None] = None,
+        out: Union[ArrayInterval, None] = None,
+    ) -> ArrayInterval:
+        """Like numpy.dot: products with 0-d operands, matmul up to 2-D."""
+        if not isinstance(other, ArrayInterval):
+            return self.multiply(other, out)
+        if self.ndim == 0 or other.ndim == 0:
+            return self.multiply(other, out)
+        if self.ndim > 2 or other.ndim > 2:
+            raise ValueError("ArrayInterval dot supports up to 2-D operands.")
+        return self.matmul(other, method=method, out=out)
 
-            # Sum along k-axis with upward rounding
-            res_ub = np.sum(max_products, axis=1)  # (m, n)
+    def min(
+        self,
+        axis: Union[int, Tuple[int, ...], None] = None,
+        keepdims: bool = False,
+    ) -> ArrayInterval:
+        """Range of the elementwise minimum along axis, exact."""
+        return self._from_bounds(
+            self._nlb.max(axis=axis, keepdims=keepdims),
+            self._ub.min(axis=axis, keepdims=keepdims),
+        )
 
-        return self._from_bounds(res_lb, res_ub)
+    def max(
+        self,
+        axis: Union[int, Tuple[int, ...], None] = None,
+        keepdims: bool = False,
+    ) -> ArrayInterval:
+        """Range of the elementwise maximum along axis, exact."""
+        return self._from_bounds(
+            self._nlb.min(axis=axis, keepdims=keepdims),
+            self._ub.max(axis=axis, keepdims=keepdims),
+        )
 
-    def _from_bounds(self, lb: np.ndarray, ub: np.ndarray) -> ArrayInterval:
-        res = np.empty(lb.shape, dtype=scalar_interval_dtype)
-        res["lowerbound"] = lb
-        res["upperbound"] = ub
-        return ArrayInterval(res)
+    def hull(
+        self,
+        axis: Union[int, Tuple[int, ...], None] = None,
+        keepdims: bool = False,
+    ) -> ArrayInterval:
+        """Smallest interval containing all intervals along axis, exact."""
+        return self._from_bounds(
+            self._nlb.max(axis=axis, keepdims=keepdims),
+            self._ub.max(axis=axis, keepdims=keepdims),
+        )
+
+    # --- NumPy protocols ---
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        """
+        Dispatch NumPy ufuncs to the interval methods.
+
+        Numbers and float arrays take part as point intervals, out= has to
+        be an ArrayInterval of the result shape. np.add.reduce is the sum.
+        """
+        if method == "__call__" and not kwargs:
+            name = _UFUNC_METHODS.get(ufunc)
+            if name is None:
+                return NotImplemented
+            first, *others = inputs
+            return getattr(_as_interval(first), name)(
+                *(
+                    (
+                        x
+                        if isinstance(x, (ArrayInterval, ScalarInterval, Real))
+                        else _as_interval(x)
+                    )
+                    for x in others
+                ),
+                out=_out_interval(out),
+            )
+        elif method == "reduce" and ufunc is np.add:
+            if set(kwargs) - {"axis", "keepdims", "dtype"} or kwargs.get(
+                "dtype"
+            ) not in (None, np.float64):
+                return NotImplemented
+            return _into(
+                _as_interval(inputs[0]).sum(
+                    kwargs.get("axis", 0), kwargs.get("keepdims", False)
+                ),
+                _out_interval(out),
+            )
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Dispatch NumPy array functions, see _ARRAY_FUNCTIONS."""
+        impl = _ARRAY_FUNCTIONS.get(func)
+        if impl is None or not all(
+            issubclass(t, (ArrayInterval, np.ndarray)) for t in types
+        ):
+            return NotImplemented
+        return impl(*args, **kwargs)
+
+    @staticmethod
+    def _from_bounds(
+        nlb: Union[np.ndarray, float], ub: Union[np.ndarray, float]
+    ) -> ArrayInterval:
+        """
+        Trusted constructor from negated lower and upper bounds.
+
+        Only for results of the directed rounding kernels: the buffers are
+        taken over as they are, without copying or revalidation.
+        """
+        res = ArrayInterval.__new__(ArrayInterval)
+        res._nlb = np.asarray(nlb)
+        res._ub = np.asarray(ub)
+        return res
+
+    @staticmethod
+    def from_scalar_intervals(data) -> ArrayInterval:
+        """
+        Converts (nested lists or object arrays of) ScalarIntervals.
+
+        Numbers become point intervals. The bounds are collected in one
+        vectorized pass instead of element by element.
+        """
+        lb, ub = _scalar_bounds(np.asarray(data, dtype=object))
+        return ArrayInterval._from_bounds(
+            np.negative(np.asarray(lb, dtype=np.float64)),
+            np.asarray(ub, dtype=np.float64),
+        )
+
+    def to_scalar_intervals(self) -> np.ndarray:
+        """Object array of ScalarInterval copies of the intervals."""
+        return np.asarray(
+            _scalar_intervals(
+                self.lowerbound.astype(object), self._ub.astype(object)
+            ),
+            dtype=object,
+        )
+
+    def tolist(self):
+        """Nested lists of ScalarInterval copies, like ndarray.tolist."""
+        return self.to_scalar_intervals().tolist()
+
+    def arrow_columns(self) -> dict[str, np.ndarray]:
+        """
+        Bounds as flat float64 columns of an Arrow struct<lower, upper>.
+
+        The columns are in C order and without nulls, as buffers (memoryview,
+        pyarrow.array, StructArray.from_arrays) they need no further copy.
+        upper is a view of the bounds. lower has to be negated once, as
+        the lower bounds are stored negated, so it is a new buffer. For the
+        same reason ArrayInterval itself has no __buffer__: none of its
+        buffers holds the struct layout, the columns carry the protocol.
+        """
+        return {
+            "lower": np.negative(self._nlb).ravel(),
+            "upper": np.ascontiguousarray(self._ub).reshape(-1),
+        }
 
     @staticmethod
-    def from_scalar_intervals(data: np.ndarray) -> ArrayInterval:
-        """Converts an object array of ScalarIntervals to ArrayInterval."""
-        res = np.empty(data.shape, dtype=scalar_interval_dtype)
-        for idx, val in np.ndenumerate(data):
-            res[idx] = (val.lowerbound, val.upperbound)
-        return ArrayInterval(res)
+    def from_arrow_columns(lower, upper, shape=None) -> ArrayInterval:
+        """
+        Intervals of lower and upper bound columns, flat unless shape.
+
+        Columns are anything exporting float64 data: NumPy or null-free
+        Arrow arrays, memoryviews and raw byte buffers. upper is used
+        without copying, lower is negated into a new buffer. The bounds
+        are validated as by the constructor.
+        """
+        nlb, ub = np.negative(_column(lower)), _column(upper)
+        if nlb.shape != ub.shape:
+            raise ValueError(
+                f"Bound columns of lengths {len(nlb)} and {len(ub)}."
+            )
+        _check_bounds(nlb, ub)
+        if shape is not None:
+            nlb, ub = nlb.reshape(shape), ub.reshape(shape)
+        return ArrayInterval._from_bounds(nlb, ub)
+
+
+# ScalarInterval op ArrayInterval ends up in the reflected dunders above
+ScalarInterval._array_types += (ArrayInterval,)
+
+
+# --- NumPy protocols ---
+_UFUNC_METHODS = {
+    np.add: "add",
+    np.subtract: "subtract",
+    np.multiply: "multiply",
+    np.true_divide: "divide",
+    np.power: "power",
+    np.matmul: "matmul",
+    np.negative: "negative",
+    np.positive: "positive",
+    np.absolute: "absolute",
+    np.reciprocal: "reciproc",
+    np.sqrt: "sqrt",
+    np.exp: "exp",
+    np.log: "log",
+    np.log2: "log2",
+    np.log10: "log10",
+    np.log1p: "log1p",
+    np.tanh: "tanh",
+    np.sin: "sin",
+    np.cos: "cos",
+}
+_ARRAY_FUNCTIONS = {}
+
+
+def _implements(func):
+    """Register an ArrayInterval implementation of a NumPy function."""
+
+    def register(impl):
+        _ARRAY_FUNCTIONS[func] = impl
+        return impl
+
+    return register
+
+
+def _as_interval(value) -> ArrayInterval:
+    """ArrayInterval as is, numbers and float arrays as point intervals."""
+    if isinstance(value, ArrayInterval):
+        return value
+    if isinstance(value, np.ndarray) and value.dtype == scalar_interval_dtype:
+        return ArrayInterval(value)
+    if isinstance(value, ScalarInterval) or (
+        isinstance(value, np.ndarray) and value.dtype == object
+    ):
+        return ArrayInterval.from_scalar_intervals(value)
+    value = np.asarray(value, dtype=np.float64)
+    return ArrayInterval._from_bounds(np.negative(value), value)
+
+
+def _out_interval(
+    out: Union[Tuple[ArrayInterval, ...], None],
+) -> Union[ArrayInterval, None]:
+    """The single ArrayInterval of a ufunc out= tuple."""
+    if out is None:
+        return None
+    (res,) = out
+    if not isinstance(res, ArrayInterval):
+        raise TypeError("out has to be an ArrayInterval.")
+    return res
+
+
+def _into(
+    res: ArrayInterval, out: Union[ArrayInterval, None]
+) -> ArrayInterval:
+    """Store res in out if given, as NumPy does for out= arguments."""
+    if out is not None and not isinstance(out, ArrayInterval):
+        raise TypeError("out has to be an ArrayInterval.")
+    return ArrayInterval._result(res._nlb, res._ub, out)
+
+
+@_implements(np.shape)
+def _shape(a):
+    return a.shape
+
+
+@_implements(np.ndim)
+def _ndim(a):
+    return a.ndim
+
+
+@_implements(np.size)
+def _size(a, axis=None):
+    return a._ub.size if axis is None else a.shape[axis]
+
+
+@_implements(np.sum)
+def _sum(a, axis=None, dtype=None, out=None, keepdims=False):
+    if dtype not in (None, np.float64):
+        raise TypeError("ArrayInterval sums are float64.")
+    return _into(_as_interval(a).sum(axis, keepdims), out)
+
+
+@_implements(np.concatenate)
+def _concatenate(arrays, axis=0, out=None):
+    arrays = [_as_interval(a) for a in arrays]
+    res = ArrayInterval._from_bounds(
+        np.concatenate([a._nlb for a in arrays], axis=axis),
+        np.concatenate([a._ub for a in arrays], axis=axis),
+    )
+    return _into(res, out)
+
+
+@_implements(np.stack)
+def _stack(arrays, axis=0, out=None):
+    arrays = [_as_interval(a) for a in arrays]
+    res = ArrayInterval._from_bounds(
+        np.stack([a._nlb for a in arrays], axis=axis),
+        np.stack([a._ub for a in arrays], axis=axis),
+    )
+    return _into(res, out)
+
+
+@_implements(np.where)
+def _where(condition, x, y):
+    x, y = _as_interval(x), _as_interval(y)
+    return ArrayInterval._from_bounds(
+        np.where(condition, x._nlb, y._nlb), np.where(condition, x._ub, y._ub)
+    )
+
+
+@_implements(np.dot)
+def _dot(a, b, out=None):
+    return _into(_as_interval(a).dot(_as_interval(b)), out)
+
+
+@_implements(np.mean)
+def _mean(a, axis=None, dtype=None, out=None, keepdims=False):
+    if dtype not in (None, np.float64):
+        raise TypeError("ArrayInterval means are float64.")
+    return _into(_as_interval(a).mean(axis, keepdims), out)
+
+
+@_implements(np.prod)
+def _prod(a, axis=None, dtype=None, out=None, keepdims=False):
+    if dtype not in (None, np.float64):
+        raise TypeError("ArrayInterval products are float64.")
+    return _into(_as_interval(a).prod(axis, keepdims), out)
+
+
+@_implements(np.cumsum)
+def _cumsum(a, axis=None, dtype=None, out=None):
+    if dtype not in (None, np.float64):
+        raise TypeError("ArrayInterval sums are float64.")
+    return _into(_as_interval(a).cumsum(axis), out)
+
+
+@_implements(np.amin)
+@_implements(np.min)
+def _min(a, axis=None, out=None, keepdims=False):
+    return _into(_as_interval(a).min(axis, keepdims), out)
+
+
+@_implements(np.amax)
+@_implements(np.max)
+def _max(a, axis=None, out=None, keepdims=False):
+    return _into(_as_interval(a).max(axis, keepdims), out)
@@ -0,0 +1,291 @@
+"""Out-of-core ArrayInterval on memory-mapped interval files.
+
+Interval files are .npy files of scalar_interval_dtype records, so plain
+NumPy reads them as well, e.g. numpy.load(path, mmap_mode="r"). An
+IntervalMemmap maps such a file and processes it in chunks of rows along
+the first axis: every chunk becomes an ArrayInterval of at most
+chunk_bytes, is processed with the directed rounding of ArrayInterval and
+written into another mapped file or reduced into a running result. The
+pages of a finished chunk are handed back to the kernel with madvise
+where available, so the resident memory is bounded by the chunk size
+instead of growing with the file.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from logging import Logger, getLogger
+from typing import Any
+
+import numpy
+
+from .array_interval import ArrayInterval, _as_interval, scalar_interval_dtype
+from .array_parallel import _chunk_slices
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["IntervalMemmap"]
+
+# default size of the ArrayInterval chunks, per mapped operand
+CHUNK_BYTES: int = 64 * 2**20
+
+_Path = str | os.PathLike
+
+
+def _release(records: numpy.memmap, part: slice) -> None:
+    """Drop the pages of rows part of records from the resident set.
+
+    Only for shared mappings, the data stays in the page cache and the file.
+    Copy-on-write mappings (mode "c") would lose their changes.
+    """
+    mapping: Any = getattr(records, "_mmap", None)
+    if (
+        mapping is None
+        or records.mode == "c"
+        or not hasattr(mmap, "MADV_DONTNEED")
+        or not records.size
+    ):
+        return
+    row: int = records.itemsize * (records.size // len(records))
+    # numpy maps from offset rounded down to the allocation granularity
+    base: int = records.offset % mmap.ALLOCATIONGRANULARITY
+    start: int = base + part.start * row
+    stop: int = min(base + part.stop * row, len(mapping))
+    # whole pages inside the chunk only, neighbours may still be in use
+    start += -start % mmap.PAGESIZE
+    stop -= stop % mmap.PAGESIZE
+    if stop > start:
+        mapping.madvise(mmap.MADV_DONTNEED, start, stop - start)
+
+
+class IntervalMemmap:
+    """
+    Interval array in a memory-mapped .npy file, processed chunk-wise.
+
+    Indexing returns in-memory ArrayInterval copies, assignment writes
+    through to the file. map and the reductions stream over
+    chunks of rows, so the files may be much larger than the memory.
+    """
+
+    __slots__ = ("chunk_bytes", "records")
+    chunk_bytes: int
+    records: numpy.memmap
+
+    def __init__(
+        self, records: numpy.memmap, chunk_bytes: int | None = None
+    ) -> None:
+        """Wrap a memmap of scalar_interval_dtype records."""
+        if records.dtype != scalar_interval_dtype:
+            raise ValueError(
+                f"Need records of {scalar_interval_dtype}, got {records.dtype}."
+            )
+        if records.ndim < 1:
+            raise ValueError("Need at least one dimension to chunk along.")
+        self.records = records
+        self.chunk_bytes = CHUNK_BYTES if chunk_bytes is None else chunk_bytes
+
+    @classmethod
+    def create(
+        cls,
+        path: _Path,
+        shape: int | tuple[int, ...],
+        chunk_bytes: int | None = None,
+    ) -> IntervalMemmap:
+        """Create (or overwrite) an interval file of the given shape."""
+        return cls(
+            numpy.lib.format.open_memmap(
+                path, mode="w+", dtype=scalar_interval_dtype, shape=shape
+            ),
+            chunk_bytes,
+        )
+
+    @classmethod
+    def open(
+        cls, path: _Path, mode: str = "r", chunk_bytes: int | None = None
+    ) -> IntervalMemmap:
+        """Map an existing interval file, mode as for numpy.memmap."""
+        return cls(numpy.lib.format.open_memmap(path, mode=mode), chunk_bytes)
+
+    @classmethod
+    def from_array(
+        cls,
+        path: _Path,
+        values: ArrayInterval,
+        chunk_bytes: int | None = None,
+    ) -> IntervalMemmap:
+        """Write values to a new interval file."""
+        res: IntervalMemmap = cls.create(path, values.shape, chunk_bytes)
+        for part in res._slices():
+            res[part] = values[part]
+            _release(res.records, part)
+        return res
+
+    def __repr__(self) -> str:
+        return (
+            f"IntervalMemmap({self.records.filename!r}, shape={self.shape}, "
+            f"chunk_bytes={self.chunk_bytes})"
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.records.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.records.ndim
+
+    @property
+    def size(self) -> int:
+        return self.records.size
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, idx: Any) -> ArrayInterval:
+        """In-memory copy of the intervals at idx."""
+        return ArrayInterval(numpy.asarray(self.records[idx]))
+
+    def __setitem__(self, idx: Any, value: Any) -> None:
+        """Write intervals or numbers to the file."""
+        value = _as_interval(value)
+        self.records["lowerbound"][idx] = value.lowerbound
+        self.records["upperbound"][idx] = value.upperbound
+
+    def load(self) -> ArrayInterval:
+        """The whole array in memory."""
+        return self[...]
+
+    def flush(self) -> None:
+        """Write changes to the file."""
+        self.records.flush()
+
+    # --- Chunked processing ---
+
+    def _slices(self, operands: int = 1) -> list[slice]:
+        """Slices of rows, chunk_bytes per operand."""
+        length: int = len(self)
+        row: int = scalar_interval_dtype.itemsize * max(
+            1, self.size // max(1, length)
+        )
+        rows: int = max(1, self.chunk_bytes // (row * operands))
+        return _chunk_slices(length, max(1, -(-length // rows)))
+
+    def chunks(self) -> Iterator[tuple[slice, ArrayInterval]]:
+        """Rows and ArrayInterval copy of every chunk."""
+        for part in self._slices():
+            yield part, self[part]
+            _release(self.records, part)
+
+    def map(
+        self,
+        func: Callable[..., ArrayInterval],
+        *operands: Any,
+        out: _Path | IntervalMemmap | None = None,
+    ) -> IntervalMemmap | ArrayInterval:
+        """
+        Apply func chunk-wise, func(chunk, *operands) keeps the rows.
+
+        func may be an elementwise expression like operator.add or any
+        function of ArrayIntervals that returns one row per input row,
+        e.g. lambda chunk: chunk.sum(axis=1) to reduce the other axes.
+
+        IntervalMemmap operands of the same length are cut into the same
+        chunks, all other operands (numbers, ScalarIntervals, broadcasting
+        ArrayIntervals) are passed whole. The results go to out, a path for
+        a new interval file or an IntervalMemmap, or to memory if None.
+        """
+        mapped: list[IntervalMemmap] = [
+            arg
+            for arg in operands
+            if isinstance(arg, IntervalMemmap) and len(arg) == len(self)
+        ]
+        slices: list[slice] = self._slices(2 + len(mapped))
+        target: IntervalMemmap | None = (
+            out if isinstance(out, IntervalMemmap) else None
+        )
+        res_nlb: numpy.ndarray | None = None
+        res_ub: numpy.ndarray | None = None
+        for part in slices:
+            res: ArrayInterval = func(
+                self[part],
+                *(
+                    arg[part] if any(arg is m for m in mapped) else arg
+                    for arg in operands
+                ),
+            )
+            if len(res) != part.stop - part.start:
+                raise ValueError("func has to keep the rows of its chunk.")
+            shape: tuple[int, ...] = (len(self),) + res.shape[1:]
+            if target is None and out is not None:
+                target = IntervalMemmap.create(out, shape, self.chunk_bytes)
+            if target is not None:
+                target[part] = res
+                _release(target.records, part)
+            else:
+                if res_nlb is None:
+                    res_nlb, res_ub = numpy.empty(shape), numpy.empty(shape)
+                res_nlb[part] = res._nlb
+                res_ub[part] = res._ub
+            for arg in (self, *mapped):
+                _release(arg.records, part)
+        if target is not None:
+            target.flush()
+            return target
+        return ArrayInterval._from_bounds(res_nlb, res_ub)
+
+    def _reduce(
+        self, name: str, axis: int | None, **kwargs: Any
+    ) -> ArrayInterval:
+        """Reduce along axis 0 or all axes by ArrayInterval method name.
+
+        Every chunk is reduced on its own, the partial results are combined
+        with a running reduction of two.
+        """
+        if axis is not None and axis % self.ndim:
+            raise ValueError(
+                "Only axis=None and axis=0 stream, reduce other axes "
+                "chunk-wise with map."
+            )
+        total: ArrayInterval | None = None
+        for _, chunk in self.chunks():
+            part: ArrayInterval = getattr(chunk, name)(axis=axis, **kwargs)
+            if total is not None:
+                part = getattr(
+                    ArrayInterval._from_bounds(
+                        numpy.stack((total._nlb, part._nlb)),
+                        numpy.stack((total._ub, part._ub)),
+                    ),
+                    name,
+                )(axis=0, **kwargs)
+            total = part
+        if total is None:  # no rows
+            return getattr(self[...], name)(axis=axis, **kwargs)
+        return total
+
+    def sum(
+        self, axis: int | None = None, method: str | None = None
+    ) -> ArrayInterval:
+        """Rigorous sum over all elements or along axis 0."""
+        return self._reduce("sum", axis, method=method)
+
+    def mean(
+        self, axis: int | None = None, method: str | None = None
+    ) -> ArrayInterval:
+        """Rigorous mean over all elements or along axis 0."""
+        count: int = self.size if axis is None else len(self)
+        if not count:
+            return self[...].mean(axis=axis, method=method)
+        return self.sum(axis, method).divide(count)
+
+    def min(self, axis: int | None = None) -> ArrayInterval:
+        """Range of the minimum over all elements or along axis 0."""
+        return self._reduce("min", axis)
+
+    def max(self, axis: int | None = None) -> ArrayInterval:
+        """Range of the maximum over all elements or along axis 0."""
+        return self._reduce("max", axis)
+
+    def hull(self, axis: int | None = None) -> ArrayInterval:
+        """Hull of all intervals or along axis 0."""
+        return self._reduce("hull", axis)
@@ -0,0 +1,222 @@
+"""Thread-parallel chunked execution of ArrayInterval operations.
+
+The floating point rounding mode is a per thread setting, so interval
+arithmetic can be split over a thread pool as long as every worker sets the
+mode itself. A ParallelExecutor cuts the bound buffers into contiguous
+slices along the first axis, each worker enters its own RoundingSession and
+processes one slice. NumPy releases the GIL inside its loops, so large
+chunks scale on GIL builds and everything scales on free-threaded builds.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger, getLogger
+from typing import TypeVar
+
+import numpy
+
+from . import array_interval
+from .array_interval import ArrayInterval, RoundingSession
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["ParallelExecutor"]
+
+_Result = TypeVar("_Result")
+
+
+def _chunk_slices(length: int, parts: int) -> list[slice]:
+    """Split range(length) into parts slices of nearly equal size."""
+    return [
+        slice(length * pos // parts, length * (pos + 1) // parts)
+        for pos in range(parts)
+    ]
+
+
+class ParallelExecutor:
+    """Opt-in thread pool running ArrayInterval operations chunk-wise.
+
+    Arrays with fewer than min_chunk elements per worker are processed in
+    fewer chunks, down to a single one in the calling thread. Use it as a
+    context manager or call shutdown to stop the threads.
+
+    method="midrad" matmuls call into BLAS, whose own threads do not see the
+    rounding mode of the worker unless OpenBLAS is built with
+    CONSISTENT_FPCSR=1. Limit BLAS to one thread per worker otherwise.
+    """
+
+    __slots__ = ("_pool", "min_chunk", "workers")
+    _pool: ThreadPoolExecutor
+    min_chunk: int
+    workers: int
+
+    def __init__(
+        self, workers: int | None = None, min_chunk: int = 2**16
+    ) -> None:
+        """Start workers threads, default one per CPU."""
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self._pool = ThreadPoolExecutor(
+            self.workers, thread_name_prefix="pyintlab"
+        )
+
+    def __enter__(self) -> ParallelExecutor:
+        """Use the executor for a block."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop the worker threads after the block."""
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        """Show number of workers and minimal chunk size."""
+        return (
+            f"ParallelExecutor(workers={self.workers}, "
+            f"min_chunk={self.min_chunk})"
+        )
+
+    def shutdown(self) -> None:
+        """Wait for running chunks and stop the worker threads."""
+        self._pool.shutdown()
+
+    def _slices(self, length: int, size: int) -> list[slice]:
+        """Slices of length rows holding size elements in total."""
+        parts: int = max(
+            1, min(self.workers, length, size // max(1, self.min_chunk))
+        )
+        return _chunk_slices(length, parts)
+
+    def _run(
+        self, func: Callable[[slice], _Result], slices: list[slice]
+    ) -> list[_Result]:
+        """Apply func to every slice, each call inside a RoundingSession."""
+
+        def task(part: slice) -> _Result:
+            with RoundingSession(array_interval._kernel_mode()):
+                return func(part)
+
+        if len(slices) == 1:
+            return [task(slices[0])]
+        return list(self._pool.map(task, slices))
+
+    def elementwise(
+        self,
+        func: Callable[..., ArrayInterval],
+        *operands: ArrayInterval | float | int,
+    ) -> ArrayInterval:
+        """Evaluate the elementwise expression func(*operands) chunk-wise.
+
+        func may be an operator like operator.mul or any composition of
+        elementwise ArrayInterval operations. Numbers and operands that are
+        broadcast along the first axis are handed to every chunk unsliced.
+        """
+        shape: tuple[int, ...] = numpy.broadcast_shapes(
+            *(numpy.shape(arg) for arg in operands)
+        )
+        if not shape:
+            with RoundingSession(array_interval._kernel_mode()):
+                return func(*operands)
+        length: int = shape[0]
+
+        def sliced(
+            arg: ArrayInterval | float | int, part: slice
+        ) -> ArrayInterval | float | int:
+            if (
+                isinstance(arg, ArrayInterval)
+                and arg.ndim == len(shape)
+                and arg.shape[0] == length
+            ):
+                return arg._from_bounds(arg._nlb[part], arg._ub[part])
+            return arg
+
+        res_nlb: numpy.ndarray = numpy.empty(shape)
+        res_ub: numpy.ndarray = numpy.empty(shape)
+
+        def chunk(part: slice) -> None:
+            res: ArrayInterval = func(*(sliced(arg, part) for arg in operands))
+            res_nlb[part] = res._nlb
+            res_ub[part] = res._ub
+
+        self._run(chunk, self._slices(length, int(numpy.prod(shape))))
+        return ArrayInterval._from_bounds(res_nlb, res_ub)
+
+    def sum(
+        self, values: ArrayInterval, axis: int | None = None
+    ) -> ArrayInterval:
+        """Rigorous sum along axis, of all elements if axis is None.
+
+        Chunks are cut along the first axis. Reducing along it, every worker
+        returns partial sums which are added up afterwards, each summation
+        done by ArrayInterval.sum.
+        """
+        if values.ndim == 0:
+            return values
+        if axis is not None:
+            if not -values.ndim <= axis < values.ndim:
+                raise ValueError(
+                    f"axis {axis} is out of bounds for {values.ndim} dims."
+                )
+            axis %= values.ndim
+        slices: list[slice] = self._slices(values.shape[0], values._ub.size)
+
+        def part_sum(part: slice) -> ArrayInterval:
+            return values._from_bounds(
+                values._nlb[part], values._ub[part]
+            ).sum(axis=axis)
+
+        if axis is None or axis == 0:
+            partials: list[ArrayInterval] = self._run(part_sum, slices)
+            return values._from_bounds(
+                numpy.stack([res._nlb for res in partials]),
+                numpy.stack([res._ub for res in partials]),
+            ).sum(axis=0)
+
+        shape: tuple[int, ...] = (
+            values.shape[:axis] + values.shape[axis + 1 :]  # noqa: E203
+        )
+        res_nlb = numpy.empty(shape)
+        res_ub = numpy.empty(shape)
+
+        def chunk(part: slice) -> None:
+            res: ArrayInterval = part_sum(part)
+            res_nlb[part] = res._nlb
+            res_ub[part] = res._ub
+
+        self._run(chunk, slices)
+        return values._from_bounds(res_nlb, res_ub)
+
+    def matmul(
+        self,
+        left: ArrayInterval,
+        right: ArrayInterval,
+        memory_budget: int | None = None,
+        method: str | None = None,
+    ) -> ArrayInterval:
+        """left @ right with the rows of left distributed over the workers.
+
+        Arguments as for ArrayInterval.matmul, memory_budget is shared by
+        all workers.
+        """
+        if left.ndim < 2:
+            return left.matmul(right, memory_budget, method)
+        rows: int = left.shape[-2]
+        slices: list[slice] = self._slices(
+            rows, left._ub.size * int(numpy.prod(right.shape[-1:]))
+        )
+        if memory_budget is None:
+            memory_budget = array_interval.MATMUL_MEMORY_BUDGET
+        memory_budget //= len(slices)
+
+        results: list[ArrayInterval] = self._run(
+            lambda part: left._from_bounds(
+                left._nlb[..., part, :], left._ub[..., part, :]
+            ).matmul(right, memory_budget, method),
+            slices,
+        )
+        axis: int = -2 if right.ndim >= 2 else -1
+        return left._from_bounds(
+            numpy.concatenate([res._nlb for res in results], axis=axis),
+            numpy.concatenate([res._ub for res in results], axis=axis),
+        )
@@ -0,0 +1,240 @@
+"""Process-parallel chunked execution on shared-memory ArrayIntervals.
+
+ParallelExecutor scales as long as NumPy releases the GIL. Pipelines that
+mix in ScalarInterval code hold it, so ProcessExecutor distributes the
+work over a ProcessPoolExecutor instead. The arrays are not pickled: their
+bound buffers live in one multiprocessing.shared_memory block each, the
+workers attach to the blocks, wrap zero-copy ArrayInterval views of their
+rows and run the user function on them, results are written back into
+shared memory in place. Only the block names, shapes and row ranges travel
+through the pool.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from logging import Logger, getLogger
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from typing import Any, NamedTuple
+
+import numpy
+
+from . import array_interval
+from .array_interval import ArrayInterval, RoundingSession
+from .array_parallel import _chunk_slices
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["ProcessExecutor", "SharedArrayInterval"]
+
+
+class _Handle(NamedTuple):
+    """Picklable reference to a SharedArrayInterval."""
+
+    name: str
+    shape: tuple[int, ...]
+
+
+def _bound_views(
+    buffer: Any, shape: tuple[int, ...]
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Negated lower and upper bounds laid out one after the other."""
+    size: int = int(numpy.prod(shape))
+    bounds: numpy.ndarray = numpy.ndarray((2, size), numpy.float64, buffer)
+    return bounds[0].reshape(shape), bounds[1].reshape(shape)
+
+
+class SharedArrayInterval:
+    """
+    ArrayInterval whose bound buffers live in shared memory.
+
+    The creating process owns the block: use it as a context manager or
+    call unlink when done. array is a zero-copy ArrayInterval view, valid
+    until close.
+    """
+
+    __slots__ = ("_memory", "array")
+    _memory: shared_memory.SharedMemory
+    array: ArrayInterval
+
+    def __init__(self, shape: int | tuple[int, ...]) -> None:
+        """Uninitialized intervals of the given shape."""
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=max(1, 16 * int(numpy.prod(shape)))
+        )
+        self.array = ArrayInterval._from_bounds(
+            *_bound_views(self._memory.buf, shape)
+        )
+
+    @classmethod
+    def from_array(cls, values: ArrayInterval) -> SharedArrayInterval:
+        """Copy of values in shared memory."""
+        res: SharedArrayInterval = cls(values.shape)
+        res.array._nlb[...] = values._nlb
+        res.array._ub[...] = values._ub
+        return res
+
+    def __enter__(self) -> SharedArrayInterval:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Release and remove the shared memory block."""
+        self.unlink()
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedArrayInterval(name={self._memory.name!r}, "
+            f"shape={self.shape})"
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.array.shape
+
+    @property
+    def _handle(self) -> _Handle:
+        return _Handle(self._memory.name, self.shape)
+
+    def copy(self) -> ArrayInterval:
+        """Copy of the intervals in private memory."""
+        return self.array.copy()
+
+    def close(self) -> None:
+        """Drop the views and detach from the block."""
+        del self.array
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Detach and free the block, by the creating process only."""
+        if hasattr(self, "array"):
+            self.close()
+        self._memory.unlink()
+
+
+def _run_chunk(
+    func: Callable[..., ArrayInterval | None],
+    operands: tuple[Any, ...],
+    out: _Handle | None,
+    part: slice,
+) -> None:
+    """Worker: attach to the blocks, run func on rows part, store results."""
+    blocks: list[shared_memory.SharedMemory] = []
+
+    def attach(handle: _Handle) -> tuple[numpy.ndarray, numpy.ndarray]:
+        blocks.append(shared_memory.SharedMemory(name=handle.name))
+        return _bound_views(blocks[-1].buf, handle.shape)
+
+    try:
+        args: list[Any] = [
+            (
+                ArrayInterval._from_bounds(
+                    *(bounds[part] for bounds in attach(arg))
+                )
+                if isinstance(arg, _Handle)
+                else arg
+            )
+            for arg in operands
+        ]
+        with RoundingSession(array_interval._kernel_mode()):
+            res: ArrayInterval | None = func(*args)
+        if out is not None:
+            if res is None:
+                raise ValueError("func returned no result for out.")
+            out_nlb, out_ub = attach(out)
+            out_nlb[part] = res._nlb
+            out_ub[part] = res._ub
+            del out_nlb, out_ub
+        del args, res
+    finally:
+        for block in blocks:
+            block.close()
+
+
+class ProcessExecutor:
+    """
+    Opt-in process pool running functions on SharedArrayInterval chunks.
+
+    func has to be picklable, i.e. defined at module level. It receives
+    ArrayInterval views of the rows of its chunk for every
+    SharedArrayInterval operand and all other operands unchanged, so
+    results can be written in place (x += y) or returned for out. Use it
+    as a context manager or call shutdown to stop the processes.
+    """
+
+    __slots__ = ("_pool", "min_chunk", "workers")
+    _pool: ProcessPoolExecutor
+    min_chunk: int
+    workers: int
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        min_chunk: int = 2**16,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Start workers processes, default one per CPU."""
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self._pool = ProcessPoolExecutor(self.workers, mp_context=mp_context)
+
+    def __enter__(self) -> ProcessExecutor:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop the worker processes after the block."""
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        return (
+            f"ProcessExecutor(workers={self.workers}, "
+            f"min_chunk={self.min_chunk})"
+        )
+
+    def shutdown(self) -> None:
+        """Wait for running chunks and stop the worker processes."""
+        self._pool.shutdown()
+
+    def map(
+        self,
+        func: Callable[..., ArrayInterval | None],
+        *operands: Any,
+        out: SharedArrayInterval | None = None,
+    ) -> SharedArrayInterval | None:
+        """
+        Run func on chunks of rows of the SharedArrayInterval operands.
+
+        All SharedArrayInterval operands need the same first dimension, the
+        chunks are cut along it. If out is given, func returns the
+        ArrayInterval of its rows and it is stored there.
+        """
+        shared: list[SharedArrayInterval] = [
+            arg for arg in operands if isinstance(arg, SharedArrayInterval)
+        ]
+        if not shared or not shared[0].shape:
+            raise ValueError(
+                "Need a SharedArrayInterval operand of at least one axis."
+            )
+        length: int = shared[0].shape[0]
+        if any(arg.shape[:1] != (length,) for arg in shared) or (
+            out is not None and out.shape[:1] != (length,)
+        ):
+            raise ValueError("Shared operands differ in their first axis.")
+        size: int = int(numpy.prod(shared[0].shape))
+        parts: int = max(
+            1, min(self.workers, length, size // max(1, self.min_chunk))
+        )
+        handles: tuple[Any, ...] = tuple(
+            arg._handle if isinstance(arg, SharedArrayInterval) else arg
+            for arg in operands
+        )
+        out_handle: _Handle | None = None if out is None else out._handle
+        futures = [
+            self._pool.submit(_run_chunk, func, handles, out_handle, part)
+            for part in _chunk_slices(length, parts)
+        ]
+        for future in futures:
+            future.result()
+        return out
@@ -0,0 +1,310 @@
+"""Trace ScalarInterval formulas once and replay them vectorized.
+
+A formula written against ScalarInterval is run a single time on symbolic
+placeholders. Every operation is recorded as a node of a directed acyclic
+graph, identical subexpressions are merged on the fly (hash consing). The
+resulting IntervalFormula can then be evaluated on ArrayInterval inputs of
+any length, one vectorized NumPy pass per node instead of one Python object
+per element and operation.
+"""
+
+from __future__ import annotations
+
+import inspect
+import operator
+from collections.abc import Callable, Hashable, Sequence
+from logging import Logger, getLogger
+from typing import Any, NoReturn, SupportsFloat
+
+from .scalar_interval import ScalarInterval
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["IntervalFormula", "TracedInterval", "trace"]
+
+# operators are replayed by the operator module to keep python's reflection
+_OPERATORS: dict[str, Callable[..., Any]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "pow": operator.pow,
+    "neg": operator.neg,
+    "abs": operator.abs,
+}
+_COMMUTATIVE: frozenset[str] = frozenset(("add", "mul"))
+
+
+class IntervalFormula:
+    """Recorded DAG of an interval formula, replayable on ArrayInterval."""
+
+    __slots__ = ("_constants", "_keys", "_nodes", "_outputs", "ninputs")
+    _nodes: list[tuple[str, tuple[int, ...]]]
+    _keys: dict[Hashable, int]
+    _constants: dict[int, float | ScalarInterval]
+    _outputs: list[int]
+    ninputs: int
+
+    def __init__(self, ninputs: int) -> None:
+        """Start an empty graph with ninputs placeholder nodes."""
+        self._nodes = []
+        self._keys = {}
+        self._constants = {}
+        self._outputs = []
+        self.ninputs = ninputs
+        for pos in range(ninputs):
+            self._node("input", (pos,))
+
+    def __len__(self) -> int:
+        """Return the number of nodes (inputs and constants included)."""
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        """Show inputs, nodes and outputs of the recorded formula."""
+        return (
+            f"IntervalFormula(ninputs={self.ninputs}, nodes={len(self)}, "
+            f"outputs={len(self._outputs)})"
+        )
+
+    def _node(self, operation: str, args: tuple[int, ...]) -> int:
+        """Return the node for operation(args), merging duplicates."""
+        if operation in _COMMUTATIVE:
+            args = tuple(sorted(args))
+        key: tuple[str, tuple[int, ...]] = (operation, args)
+        idx: int | None = self._keys.get(key)
+        if idx is None:
+            idx = len(self._nodes)
+            self._nodes.append(key)
+            self._keys[key] = idx
+        return idx
+
+    def _constant(self, value: ScalarInterval | SupportsFloat) -> int:
+        """Return the node of a constant, equal constants share one node."""
+        if isinstance(value, ScalarInterval):
+            key: Hashable = ("const", value.lowerbound, value.upperbound)
+        elif isinstance(value, int):  # keeps integer powers integer
+            key = ("const", int, value)
+        else:
+            value = float(value)
+            key = ("const", float, value)
+        idx: int | None = self._keys.get(key)
+        if idx is None:
+            idx = len(self._nodes)
+            self._nodes.append(("const", ()))
+            self._keys[key] = idx
+            self._constants[idx] = value
+        return idx
+
+    def _operand(self, value: object) -> int:
+        """Node index of a traced value or of a new constant."""
+        if isinstance(value, TracedInterval):
+            if value.formula is not self:
+                raise ValueError("Can not mix values of different traces.")
+            return value.node
+        if isinstance(value, (ScalarInterval, int, float)):
+            return self._constant(value)
+        raise TypeError(f"Can not trace operand of type {type(value)}.")
+
+    def _record(self, operation: str, *operands: object) -> TracedInterval:
+        """Append operation on operands and wrap the result."""
+        return TracedInterval(
+            self,
+            self._node(
+                operation, tuple(self._operand(arg) for arg in operands)
+            ),
+        )
+
+    def _lastuse(self) -> list[int]:
+        """Index of the last node (or output) consuming each node."""
+        last: list[int] = list(range(len(self._nodes)))
+        for idx, (operation, args) in enumerate(self._nodes):
+            if operation not in ("input", "const"):
+                for arg in args:
+                    last[arg] = idx
+        for idx in self._outputs:
+            last[idx] = len(self._nodes)
+        return last
+
+    def __call__(self, *inputs: Any) -> Any:
+        """Replay the formula on the given inputs.
+
+        With at least one ArrayInterval input the whole graph is evaluated
+        vectorized, ScalarInterval inputs and constants are broadcast.
+        Intermediate arrays are released right after their last use.
+        """
+        if len(inputs) != self.ninputs:
+            raise TypeError(
+                f"Formula takes {self.ninputs} inputs, {len(inputs)} given."
+            )
+        lastuse: list[int] = self._lastuse()
+        values: dict[int, Any] = {}
+        for idx, (operation, args) in enumerate(self._nodes):
+            if operation == "input":
+                values[idx] = inputs[args[0]]
+            elif operation == "const":
+                values[idx] = self._constants[idx]
+            else:
+                if operation in _OPERATORS:
+                    values[idx] = _OPERATORS[operation](
+                        *(values[arg] for arg in args)
+                    )
+                else:
+                    values[idx] = getattr(values[args[0]], operation)(
+                        *(values[arg] for arg in args[1:])
+                    )
+                for arg in set(args):
+                    if lastuse[arg] == idx:
+                        del values[arg]
+        results: list[Any] = [values[idx] for idx in self._outputs]
+        return results[0] if len(results) == 1 else tuple(results)
+
+
+class TracedInterval(ScalarInterval):
+    """Symbolic placeholder recording the operations applied to it.
+
+    Subclassing ScalarInterval lets the reflected dunders of this class win
+    over those of ScalarInterval constants, so mixed expressions are traced.
+    Anything depending on the actual bounds raises a TypeError.
+    """
+
+    __slots__ = ("formula", "node")
+    formula: IntervalFormula
+    node: int
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, formula: IntervalFormula, node: int
+    ) -> None:
+        """Wrap node of formula, only used by the tracing machinery."""
+        self.formula = formula
+        self.node = node
+
+    def _symbolic(self, *_: object) -> NoReturn:
+        """Refuse operations that need concrete bounds."""
+        raise TypeError(
+            "Traced intervals are symbolic, data dependent control flow "
+            "can not be recorded."
+        )
+
+    lowerbound = property(_symbolic)  # type: ignore[assignment]
+    upperbound = property(_symbolic)  # type: ignore[assignment]
+    mid = property(_symbolic)  # type: ignore[assignment]
+    rad = property(_symbolic)  # type: ignore[assignment]
+    __bool__ = __contains__ = _symbolic  # type: ignore[assignment]
+    __ge__ = __gt__ = __le__ = __lt__ = _symbolic  # type: ignore[assignment]
+    __eq__ = __ne__ = _symbolic  # type: ignore[assignment]
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show the node this placeholder stands for."""
+        return f"TracedInterval(node={self.node})"
+
+    __str__ = __repr__
+
+    def __add__(self, other: object) -> TracedInterval:
+        """Record addition."""
+        return self.formula._record("add", self, other)
+
+    def __radd__(self, other: object) -> TracedInterval:
+        """Record right addition."""
+        return self.formula._record("add", other, self)
+
+    def __sub__(self, other: object) -> TracedInterval:
+        """Record subtraction."""
+        return self.formula._record("sub", self, other)
+
+    def __rsub__(self, other: object) -> TracedInterval:
+        """Record right subtraction."""
+        return self.formula._record("sub", other, self)
+
+    def __mul__(self, other: object) -> TracedInterval:
+        """Record multiplication."""
+        return self.formula._record("mul", self, other)
+
+    def __rmul__(self, other: object) -> TracedInterval:
+        """Record right multiplication."""
+        return self.formula._record("mul", other, self)
+
+    def __truediv__(self, other: object) -> TracedInterval:
+        """Record true division."""
+        return self.formula._record("truediv", self, other)
+
+    def __rtruediv__(self, other: object) -> TracedInterval:
+        """Record right true division."""
+        return self.formula._record("truediv", other, self)
+
+    def __pow__(self, exponent: object) -> TracedInterval:
+        """Record power."""
+        return self.formula._record("pow", self, exponent)
+
+    __iadd__ = __add__  # type: ignore[assignment]
+    __isub__ = __sub__  # type: ignore[assignment]
+    __imul__ = __mul__  # type: ignore[assignment]
+    __itruediv__ = __truediv__  # type: ignore[assignment]
+
+    def __neg__(self) -> TracedInterval:
+        """Record negation."""
+        return self.formula._record("neg", self)
+
+    def __abs__(self) -> TracedInterval:
+        """Record absolute value."""
+        return self.formula._record("abs", self)
+
+    def reciproc(self) -> TracedInterval:
+        """Record reciprocal."""
+        return self.formula._record("reciproc", self)
+
+    def sqrt(self) -> TracedInterval:
+        """Record square root."""
+        return self.formula._record("sqrt", self)
+
+    def exp(self) -> TracedInterval:
+        """Record exponential."""
+        return self.formula._record("exp", self)
+
+    def log(
+        self, base: ScalarInterval | SupportsFloat | None = None
+    ) -> TracedInterval:
+        """Record logarithm, natural if base is omitted."""
+        if base is None:
+            return self.formula._record("log", self)
+        return self.formula._record("log", self, base)
+
+    def log2(self) -> TracedInterval:
+        """Record base 2 logarithm."""
+        return self.formula._record("log2", self)
+
+    def log10(self) -> TracedInterval:
+        """Record base 10 logarithm."""
+        return self.formula._record("log10", self)
+
+    def log1p(self) -> TracedInterval:
+        """Record logarithm of 1+x."""
+        return self.formula._record("log1p", self)
+
+    def tanh(self) -> TracedInterval:
+        """Record hyperbolic tangens."""
+        return self.formula._record("tanh", self)
+
+
+def trace(
+    func: Callable[..., Any], ninputs: int | None = None
+) -> IntervalFormula:
+    """Record func once on symbolic intervals and return the formula.
+
+    func may return one interval or a sequence of intervals, ninputs
+    defaults to the number of positional parameters of func.
+    """
+    if ninputs is None:
+        ninputs = sum(
+            param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+            for param in inspect.signature(func).parameters.values()
+        )
+    formula: IntervalFormula = IntervalFormula(ninputs)
+    result: Any = func(
+        *(TracedInterval(formula, pos) for pos in range(ninputs))
+    )
+    outputs: Sequence[Any] = (
+        result if isinstance(result, (tuple, list)) else (result,)
+    )
+    formula._outputs = [formula._operand(out) for out in outputs]
+    thelogger.info("Traced %s into %s.", func, formula)
+    return formula
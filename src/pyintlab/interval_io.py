@@ -0,0 +1,199 @@
+"""Compact versioned binary format for interval arrays and sequences.
+
+Pickling ScalarInterval objects costs far more than their 16 bytes of
+bounds. This format stores a small header and the bounds as two
+contiguous little-endian float64 blocks:
+
+    offset  size  field
+    0       4     magic b"PILI"
+    4       1     format version, FORMAT_VERSION
+    5       1     kind, 0 ArrayInterval, 1 sequence of ScalarIntervals
+    6       1     flags, bit 0 zlib compressed payload, bit 1 the first
+                  block holds negated lower bounds
+    7       1     ndim
+    8       8*n   shape as little-endian uint64
+    ...           payload: lower (or negated lower) bound block, then
+                  upper bound block, in C order of shape
+
+The header keeps the blocks 8-byte aligned. dumps writes the negated lower
+bounds of ArrayInterval, so loads of uncompressed data returns views over
+the input buffer without copying: read-only for bytes, writable for a
+bytearray. Sequences load as IntervalList, copied from read-only data as
+a list has to stay mutable.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+import sys
+import zlib
+from collections.abc import Iterable
+from logging import Logger, getLogger
+from typing import Any, BinaryIO
+
+import numpy
+
+from .array_interval import ArrayInterval, _check_bounds
+from .interval_list import IntervalList
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["FORMAT_VERSION", "dump", "dumps", "load", "loads"]
+
+FORMAT_VERSION: int = 1
+_MAGIC: bytes = b"PILI"
+_HEADER: struct.Struct = struct.Struct("<4sBBBB")
+_KIND_ARRAY: int = 0
+_KIND_SEQUENCE: int = 1
+_FLAG_COMPRESSED: int = 1
+_FLAG_NEGATED: int = 2
+_FLOAT: numpy.dtype = numpy.dtype("<f8")
+# NumPy 2 arrays have at most 64 axes
+_MAX_DIMS: int = 64
+
+
+def _blocks(
+    values: ArrayInterval | Iterable[Any],
+) -> tuple[int, tuple[int, ...], numpy.ndarray, numpy.ndarray]:
+    """Kind, shape and little-endian bound blocks of values."""
+    if isinstance(values, ArrayInterval):
+        kind: int = _KIND_ARRAY
+        nlb, ub = values._nlb, values._ub
+    else:
+        if not isinstance(values, IntervalList):
+            values = IntervalList(values)
+        kind = _KIND_SEQUENCE
+        nlb, ub = IntervalList._bounds(values)
+    return (
+        kind,
+        ub.shape,
+        numpy.ascontiguousarray(nlb, dtype=_FLOAT),
+        numpy.ascontiguousarray(ub, dtype=_FLOAT),
+    )
+
+
+def _header(kind: int, flags: int, shape: tuple[int, ...]) -> bytes:
+    """Fixed header and shape."""
+    return _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, kind, flags, len(shape)
+    ) + struct.pack(f"<{len(shape)}Q", *shape)
+
+
+def dumps(
+    values: ArrayInterval | Iterable[Any], compress: bool = False
+) -> bytes:
+    """
+    Serialize an ArrayInterval or a sequence of ScalarIntervals.
+
+    Sequences may be IntervalLists or any iterable of ScalarIntervals and
+    numbers. compress deflates the bound blocks with zlib, loads then has
+    to copy.
+    """
+    kind, shape, nlb, ub = _blocks(values)
+    if not compress:
+        return b"".join((_header(kind, _FLAG_NEGATED, shape), nlb, ub))
+    deflate = zlib.compressobj()
+    return b"".join(
+        (
+            _header(kind, _FLAG_NEGATED | _FLAG_COMPRESSED, shape),
+            deflate.compress(nlb),
+            deflate.compress(ub),
+            deflate.flush(),
+        )
+    )
+
+
+def loads(
+    data: bytes | bytearray | memoryview,
+) -> ArrayInterval | IntervalList:
+    """
+    ArrayInterval or IntervalList of data written by dumps.
+
+    Uncompressed little-endian arrays are not copied: the bounds are views
+    of data, so keep it alive and unchanged while they are in use. Views
+    of read-only data (bytes) are read-only, in-place operations on them
+    (x += y, out=x) raise ValueError, copy them first. IntervalLists are
+    only views of writable data, else copies. The bounds are validated,
+    ValueError for malformed data.
+    """
+    view: memoryview = memoryview(data).cast("B")
+    if len(view) < _HEADER.size:
+        raise ValueError("Data too short for an interval header.")
+    magic, version, kind, flags, ndim = _HEADER.unpack_from(view)
+    if magic != _MAGIC:
+        raise ValueError("Not pyintlab interval data, wrong magic bytes.")
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Interval data of format version {version}, this pyintlab "
+            f"reads up to version {FORMAT_VERSION}."
+        )
+    if kind not in (_KIND_ARRAY, _KIND_SEQUENCE):
+        raise ValueError(f"Unknown kind {kind} of interval data.")
+    if ndim > _MAX_DIMS or (kind == _KIND_SEQUENCE and ndim != 1):
+        raise ValueError(f"Invalid dimension {ndim} of interval data.")
+    offset: int = _HEADER.size + 8 * ndim
+    if len(view) < offset:
+        raise ValueError("Data too short for an interval header.")
+    shape: tuple[int, ...] = struct.unpack_from(
+        f"<{ndim}Q", view, _HEADER.size
+    )
+    # Python ints, a forged shape must not overflow
+    expected: int = 16 * math.prod(shape)
+    payload: Any = view[offset:]
+    if flags & _FLAG_COMPRESSED:
+        inflate = zlib.decompressobj()
+        try:
+            payload = inflate.decompress(payload, expected + 1)
+        except zlib.error as err:
+            raise ValueError(
+                f"Corrupt compressed interval data: {err}"
+            ) from err
+    if len(payload) != expected:
+        raise ValueError(
+            f"Interval data holds {len(payload)} payload bytes, "
+            f"expected {expected} for shape {shape}."
+        )
+    bounds: numpy.ndarray = numpy.frombuffer(payload, _FLOAT).reshape(
+        (2,) + shape
+    )
+    if sys.byteorder != "little":
+        bounds = bounds.astype(numpy.float64)
+    nlb, ub = bounds[0, ...], bounds[1, ...]
+    if not flags & _FLAG_NEGATED:
+        nlb = numpy.negative(nlb)
+    _check_bounds(nlb, ub)
+    if kind == _KIND_SEQUENCE:
+        if not (nlb.flags.writeable and ub.flags.writeable):
+            nlb, ub = nlb.copy(), ub.copy()
+        return IntervalList._from_bounds(nlb, ub)
+    return ArrayInterval._from_bounds(nlb, ub)
+
+
+def dump(
+    values: ArrayInterval | Iterable[Any],
+    file: str | os.PathLike | BinaryIO,
+    compress: bool = False,
+) -> None:
+    """Write values to a path or a binary file object, see dumps."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as stream:
+            dump(values, stream, compress)
+        return
+    if compress:
+        file.write(dumps(values, compress=True))
+        return
+    kind, shape, nlb, ub = _blocks(values)
+    file.write(_header(kind, _FLAG_NEGATED, shape))
+    file.write(memoryview(nlb).cast("B"))
+    file.write(memoryview(ub).cast("B"))
+
+
+def load(
+    file: str | os.PathLike | BinaryIO,
+) -> ArrayInterval | IntervalList:
+    """Read values written by dump, the bounds are writable."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as stream:
+            return load(stream)
+    return loads(bytearray(file.read()))
@@ -0,0 +1,397 @@
+"""Compact mutable sequence of intervals on two float64 buffers.
+
+A list of ScalarInterval objects costs about 96 bytes per interval plus
+the list slot. IntervalList keeps the negated lower and the upper bounds
+in two growable NumPy buffers like ArrayInterval, 16 bytes per interval,
+and offers the list API on top. Elements go in as ScalarIntervals,
+(lower, upper) tuples or numbers (point intervals) and come out as
+ScalarInterval copies, so lst[i] += x works as for a list.
+to_array_interval shares the buffers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
+from logging import Logger, getLogger
+from sys import getsizeof
+from typing import Any, SupportsFloat, overload
+
+import numpy
+
+from .array_interval import ArrayInterval
+from .scalar_interval import ScalarInterval
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["IntervalList"]
+
+# sort keys by name, computed on the bound buffers
+_SORT_KEYS: dict[str, Callable[[numpy.ndarray, numpy.ndarray], Any]] = {
+    "lowerbound": lambda nlb, ub: numpy.negative(nlb),
+    "upperbound": lambda nlb, ub: ub,
+    "mid": lambda nlb, ub: 0.5 * (ub - nlb),
+    "rad": lambda nlb, ub: 0.5 * (ub + nlb),
+}
+
+
+def _as_scalar(value: Any) -> Any:
+    """ScalarInterval of a (lower, upper) tuple, other values as they are."""
+    if not isinstance(value, tuple):
+        return value
+    if len(value) != 2:
+        raise TypeError(
+            f"Intervals as tuples need (lower, upper), got {value!r}."
+        )
+    return ScalarInterval(*value)
+
+
+def _item_bounds(
+    value: (
+        ScalarInterval | tuple[SupportsFloat, SupportsFloat] | SupportsFloat
+    ),
+) -> tuple[float, float]:
+    """Negated lower and upper bound of one interval, tuple or number."""
+    value = _as_scalar(value)
+    if isinstance(value, ScalarInterval):
+        return -value.lowerbound, value.upperbound
+    val: float = float(value)
+    return -val, val
+
+
+class IntervalList(MutableSequence):
+    """
+    Mutable sequence of intervals stored as 16 bytes each.
+
+    Supports indexing, slicing (copies, as for list), slice assignment,
+    del, append, extend, insert, pop, remove, index, count, reverse and
+    sort by bound. Buffers grow by an eighth like list does, so appends
+    are amortized O(1). Bulk operations with other IntervalLists or
+    ArrayIntervals are vectorized.
+    """
+
+    __slots__ = ("_nlb", "_size", "_ub")
+    _nlb: numpy.ndarray
+    _size: int
+    _ub: numpy.ndarray
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        """Intervals of iterable, an ArrayInterval is flattened."""
+        self._nlb = numpy.empty(0)
+        self._ub = numpy.empty(0)
+        self._size = 0
+        self.extend(iterable)
+
+    @classmethod
+    def _from_bounds(
+        cls, nlb: numpy.ndarray, ub: numpy.ndarray
+    ) -> IntervalList:
+        """Trusted constructor taking over 1-d bound buffers."""
+        res: IntervalList = object.__new__(cls)
+        res._nlb = numpy.ascontiguousarray(nlb, dtype=numpy.float64)
+        res._ub = numpy.ascontiguousarray(ub, dtype=numpy.float64)
+        res._size = len(res._ub)
+        return res
+
+    @staticmethod
+    def _bounds(values: Any) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Flat negated lower and upper bounds of many intervals."""
+        if isinstance(values, IntervalList):
+            return values._nlb[: len(values)], values._ub[: len(values)]
+        if not isinstance(values, ArrayInterval):
+            if not isinstance(values, numpy.ndarray):
+                values = [_as_scalar(value) for value in values]
+            values = ArrayInterval.from_scalar_intervals(values)
+        return values._nlb.ravel(), values._ub.ravel()
+
+    # --- Storage ---
+
+    def _reserve(self, size: int) -> None:
+        """Make room for size intervals, over-allocating like list."""
+        if size > len(self._ub):
+            capacity: int = size + (size >> 3) + 6
+            for name in ("_nlb", "_ub"):
+                buffer: numpy.ndarray = numpy.empty(capacity)
+                buffer[: self._size] = getattr(self, name)[: self._size]
+                setattr(self, name, buffer)
+
+    def _replace(self, nlb: numpy.ndarray, ub: numpy.ndarray) -> None:
+        """Replace all intervals by the bounds given."""
+        size: int = len(ub)
+        if size > len(self._ub) or 2 * size < len(self._ub):
+            self._nlb = numpy.array(nlb, dtype=numpy.float64)
+            self._ub = numpy.array(ub, dtype=numpy.float64)
+        else:
+            self._nlb[:size] = nlb
+            self._ub[:size] = ub
+        self._size = size
+
+    def _normalized(self, index: int) -> int:
+        """Non-negative position of index, IndexError if out of range."""
+        if not -self._size <= index < self._size:
+            raise IndexError("IntervalList index out of range")
+        return index % self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the bound buffers, including spare capacity."""
+        return self._nlb.nbytes + self._ub.nbytes
+
+    def __sizeof__(self) -> int:
+        """Object size including the bound buffers, for sys.getsizeof."""
+        return object.__sizeof__(self) + sum(
+            getsizeof(buffer) for buffer in (self._nlb, self._ub)
+        )
+
+    # --- Sequence protocol ---
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> ScalarInterval: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IntervalList: ...
+
+    def __getitem__(self, index: int | slice) -> ScalarInterval | IntervalList:
+        """Copy of one interval, or a new IntervalList for a slice."""
+        if isinstance(index, slice):
+            return self._from_bounds(
+                self._nlb[: self._size][index].copy(),
+                self._ub[: self._size][index].copy(),
+            )
+        pos: int = self._normalized(index)
+        return ScalarInterval._from_bounds(
+            -float(self._nlb[pos]), float(self._ub[pos])
+        )
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        """Store one interval, or intervals of an iterable in a slice."""
+        if not isinstance(index, slice):
+            pos: int = self._normalized(index)
+            self._nlb[pos], self._ub[pos] = _item_bounds(value)
+            return
+        nlb, ub = self._bounds(value)
+        start, stop, step = index.indices(self._size)
+        if step != 1:
+            count: int = len(range(start, stop, step))
+            if len(ub) != count:
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(ub)} "
+                    f"to extended slice of size {count}"
+                )
+            self._nlb[start:stop:step] = nlb
+            self._ub[start:stop:step] = ub
+            return
+        stop = max(start, stop)
+        if len(ub) == stop - start:
+            self._nlb[start:stop] = nlb
+            self._ub[start:stop] = ub
+            return
+        size: int = self._size
+        self._replace(
+            numpy.concatenate((self._nlb[:start], nlb, self._nlb[stop:size])),
+            numpy.concatenate((self._ub[:start], ub, self._ub[stop:size])),
+        )
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Remove one interval or a slice of them."""
+        if isinstance(index, slice):
+            positions: Any = numpy.arange(self._size)[index]
+        else:
+            positions = self._normalized(index)
+        self._replace(
+            numpy.delete(self._nlb[: self._size], positions),
+            numpy.delete(self._ub[: self._size], positions),
+        )
+
+    def __iter__(self) -> Iterator[ScalarInterval]:
+        """ScalarInterval copies in order."""
+        return map(
+            ScalarInterval._from_bounds,
+            (-self._nlb[: self._size]).tolist(),
+            self._ub[: self._size].tolist(),
+        )
+
+    def __reversed__(self) -> Iterator[ScalarInterval]:
+        return iter(self[::-1])
+
+    def __repr__(self) -> str:
+        return f"IntervalList({list(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Same intervals in the same order as another sequence."""
+        if isinstance(other, IntervalList):
+            nlb, ub = self._bounds(other)
+        elif isinstance(other, list):
+            try:
+                nlb, ub = self._bounds(other)
+            except (TypeError, ValueError):
+                return False
+        else:
+            return NotImplemented
+        return len(ub) == self._size and bool(
+            numpy.array_equal(nlb, self._nlb[: self._size])
+            and numpy.array_equal(ub, self._ub[: self._size])
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _matches(self, value: Any) -> numpy.ndarray:
+        """Mask of the intervals equal to value."""
+        nlb, ub = _item_bounds(value)
+        return (self._nlb[: self._size] == nlb) & (
+            self._ub[: self._size] == ub
+        )
+
+    def __contains__(self, value: object) -> bool:
+        """True if an interval with the same bounds is stored."""
+        try:
+            return bool(self._matches(value).any())
+        except (TypeError, ValueError):
+            return False
+
+    def index(
+        self, value: Any, start: int = 0, stop: int | None = None
+    ) -> int:
+        """Position of the first interval equal to value in [start, stop)."""
+        start, stop, _ = slice(start, stop).indices(self._size)
+        hits: numpy.ndarray = numpy.flatnonzero(
+            self._matches(value)[start:stop]
+        )
+        if not len(hits):
+            raise ValueError(f"{value!r} is not in IntervalList")
+        return start + int(hits[0])
+
+    def count(self, value: Any) -> int:
+        """Number of intervals equal to value."""
+        return int(numpy.count_nonzero(self._matches(value)))
+
+    # --- Mutation ---
+
+    def insert(self, index: int, value: Any) -> None:
+        """Insert one interval before index, clamped like list.insert."""
+        nlb, ub = _item_bounds(value)
+        size: int = self._size
+        pos: int = min(max(index + size if index < 0 else index, 0), size)
+        self._reserve(size + 1)
+        self._nlb[pos + 1 : size + 1] = self._nlb[pos:size]  # noqa: E203
+        self._ub[pos + 1 : size + 1] = self._ub[pos:size]  # noqa: E203
+        self._nlb[pos], self._ub[pos] = nlb, ub
+        self._size = size + 1
+
+    def append(self, value: Any) -> None:
+        """Add one interval at the end, amortized O(1)."""
+        nlb, ub = _item_bounds(value)
+        size: int = self._size
+        if size == len(self._ub):
+            self._reserve(size + 1)
+        self._nlb[size], self._ub[size] = nlb, ub
+        self._size = size + 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add the intervals of an iterable, ArrayInterval or IntervalList."""
+        nlb, ub = self._bounds(values)
+        size: int = self._size
+        self._reserve(size + len(ub))
+        self._nlb[size : size + len(ub)] = nlb  # noqa: E203
+        self._ub[size : size + len(ub)] = ub  # noqa: E203
+        self._size = size + len(ub)
+
+    def __iadd__(self, values: Iterable[Any]) -> IntervalList:
+        self.extend(values)
+        return self
+
+    def __add__(self, values: Iterable[Any]) -> IntervalList:
+        res: IntervalList = self[:]
+        res.extend(values)
+        return res
+
+    def pop(self, index: int = -1) -> ScalarInterval:
+        """Remove and return the interval at index, the last by default."""
+        if not self._size:
+            raise IndexError("pop from empty IntervalList")
+        value: ScalarInterval = self[index]
+        if self._normalized(index) == self._size - 1:
+            self._size -= 1
+        else:
+            del self[index]
+        return value
+
+    def remove(self, value: Any) -> None:
+        """Remove the first interval equal to value."""
+        del self[self.index(value)]
+
+    def clear(self) -> None:
+        """Remove all intervals and release the buffers."""
+        self._replace(numpy.empty(0), numpy.empty(0))
+
+    def copy(self) -> IntervalList:
+        return self[:]
+
+    def reverse(self) -> None:
+        """Reverse the order in place."""
+        self._nlb[: self._size] = self._nlb[: self._size][::-1]
+        self._ub[: self._size] = self._ub[: self._size][::-1]
+
+    def sort(
+        self,
+        key: str | Callable[[ScalarInterval], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        """
+        Stable sort in place.
+
+        key is "lowerbound", "upperbound", "mid", "rad" or a function of a
+        ScalarInterval as for list.sort. By default intervals are ordered
+        by lower bound, equal lower bounds by upper bound. Named keys and
+        the default run vectorized on the buffers.
+        """
+        nlb: numpy.ndarray = self._nlb[: self._size]
+        ub: numpy.ndarray = self._ub[: self._size]
+        if reverse:  # stable like list.sort(reverse=True)
+            nlb, ub = nlb[::-1], ub[::-1]
+        if key is None:
+            order: numpy.ndarray = numpy.lexsort((ub, numpy.negative(nlb)))
+        else:
+            if isinstance(key, str):
+                if key not in _SORT_KEYS:
+                    raise ValueError(
+                        f"Unknown sort key {key!r}, use one of "
+                        f"{', '.join(_SORT_KEYS)} or a function."
+                    )
+                keys: Any = _SORT_KEYS[key](nlb, ub)
+            else:
+                keys = numpy.array(
+                    [
+                        key(ScalarInterval._from_bounds(-low, up))
+                        for low, up in zip(nlb.tolist(), ub.tolist())
+                    ],
+                    dtype=object,
+                )
+            order = numpy.argsort(keys, kind="stable")
+        if reverse:
+            order = order[::-1]
+        self._nlb[: self._size] = nlb[order]
+        self._ub[: self._size] = ub[order]
+
+    # --- ArrayInterval interop ---
+
+    def to_array_interval(self) -> ArrayInterval:
+        """
+        The intervals as 1-d ArrayInterval sharing the buffers.
+
+        Writes through either side are visible in the other until the list
+        has to grow its buffers or shrinks a lot, then the ArrayInterval
+        keeps the old values. Use ArrayInterval(lst.to_array_interval())
+        for an independent copy.
+        """
+        return ArrayInterval._from_bounds(
+            self._nlb[: self._size], self._ub[: self._size]
+        )
+
+    @classmethod
+    def from_array_interval(cls, values: ArrayInterval) -> IntervalList:
+        """Copy the intervals of an ArrayInterval in C order."""
+        return cls._from_bounds(
+            numpy.array(values._nlb.ravel()), numpy.array(values._ub.ravel())
+        )
@@ -0,0 +1,199 @@
+"""Streaming aggregation of intervals from generators.
+
+IntervalAccumulator consumes intervals one at a time or in ArrayInterval
+micro-batches and keeps the count, hull, sum, minimum and maximum in
+constant memory, without materializing a list of ScalarIntervals. Single
+intervals are collected into bound buffers of batch elements, every full
+buffer is reduced at once with the ArrayInterval reductions, so the sum
+is rounded outward (or error-free summed) like ArrayInterval.sum.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from logging import Logger, getLogger
+from typing import Any
+
+import numpy
+
+from .array_interval import ArrayInterval
+from .scalar_interval import ScalarInterval
+
+thelogger: Logger = getLogger(__name__)
+__all__: list[str] = ["IntervalAccumulator"]
+
+
+def _scalar(value: ArrayInterval) -> ScalarInterval:
+    """ScalarInterval of a 0-d ArrayInterval."""
+    return ScalarInterval._from_bounds(-float(value._nlb), float(value._ub))
+
+
+def _pair(first: ArrayInterval, second: ArrayInterval) -> ArrayInterval:
+    """1-d ArrayInterval of two 0-d ones."""
+    return ArrayInterval._from_bounds(
+        numpy.stack((first._nlb, second._nlb)),
+        numpy.stack((first._ub, second._ub)),
+    )
+
+
+class IntervalAccumulator:
+    """
+    Running count, hull, sum, min, max and mean of a stream of intervals.
+
+    add takes ScalarIntervals, (lower, upper) tuples, numbers (point
+    intervals) and ArrayInterval batches, update every item of an
+    iterable. The state is a few bounds plus one buffer of at most batch
+    pending intervals. The results are ScalarIntervals, method selects
+    the sum algorithm as for ArrayInterval.sum.
+    """
+
+    __slots__ = (
+        "_count",
+        "_hull",
+        "_max",
+        "_min",
+        "_nlb",
+        "_sum",
+        "_ub",
+        "batch",
+        "method",
+    )
+    _count: int
+    _hull: ArrayInterval | None
+    _max: ArrayInterval | None
+    _min: ArrayInterval | None
+    _nlb: list[float]
+    _sum: ArrayInterval
+    _ub: list[float]
+    batch: int
+    method: str | None
+
+    def __init__(
+        self,
+        iterable: Iterable[Any] = (),
+        batch: int = 4096,
+        method: str | None = None,
+    ) -> None:
+        """Accumulator over the intervals of iterable, if any."""
+        self.batch = batch
+        self.method = method
+        self._count = 0
+        self._nlb, self._ub = [], []
+        self._sum = ArrayInterval._from_bounds(
+            numpy.zeros(()), numpy.zeros(())
+        )
+        self._hull = self._min = self._max = None
+        self.update(iterable)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "IntervalAccumulator(count=0)"
+        return (
+            f"IntervalAccumulator(count={len(self)}, hull={self.hull()}, "
+            f"sum={self.sum()})"
+        )
+
+    def __len__(self) -> int:
+        """Number of intervals added so far."""
+        return self._count + len(self._ub)
+
+    @property
+    def count(self) -> int:
+        return len(self)
+
+    # --- Ingestion ---
+
+    def add(self, value: Any) -> None:
+        """Add one interval, (lower, upper) tuple, number or batch."""
+        if isinstance(value, ArrayInterval):
+            self._reduce(value.reshape(-1))
+            return
+        if (
+            type(value) is tuple
+            and len(value) == 2
+            and type(value[0]) is type(value[1]) is float
+            and value[0] <= value[1]
+        ):
+            lower, upper = value
+        elif type(value) is float:
+            lower = upper = value
+        else:
+            if not isinstance(value, ScalarInterval):
+                # ints, other numbers and unordered bounds as ScalarInterval
+                value = (
+                    ScalarInterval(*value)
+                    if isinstance(value, tuple)
+                    else ScalarInterval(value)
+                )
+            lower, upper = value.lowerbound, value.upperbound
+        self._nlb.append(-lower)
+        self._ub.append(upper)
+        if len(self._ub) >= self.batch:
+            self.flush()
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """Add all items of iterable, e.g. a generator."""
+        add = self.add
+        for value in iterable:
+            add(value)
+
+    def flush(self) -> None:
+        """Reduce the pending intervals into the running state."""
+        if self._ub:
+            pending: ArrayInterval = ArrayInterval._from_bounds(
+                numpy.array(self._nlb), numpy.array(self._ub)
+            )
+            self._nlb, self._ub = [], []
+            self._reduce(pending)
+
+    def _reduce(self, values: ArrayInterval) -> None:
+        """Combine the reductions of 1-d values with the running ones."""
+        if not values.size:
+            return
+        self._count += values.size
+        parts: dict[str, ArrayInterval] = {
+            "hull": values.hull(),
+            "min": values.min(),
+            "max": values.max(),
+        }
+        for name, part in parts.items():
+            total: ArrayInterval | None = getattr(self, "_" + name)
+            if total is not None:
+                part = getattr(_pair(total, part), name)()
+            setattr(self, "_" + name, part)
+        self._sum = _pair(self._sum, values.sum(method=self.method)).sum(
+            method=self.method
+        )
+
+    # --- Results ---
+
+    def _result(self, name: str) -> ScalarInterval:
+        self.flush()
+        total: ArrayInterval | None = getattr(self, "_" + name)
+        if total is None:
+            raise ValueError(f"{name} of no intervals.")
+        return _scalar(total)
+
+    def hull(self) -> ScalarInterval:
+        """Smallest interval containing all intervals, exact."""
+        return self._result("hull")
+
+    def min(self) -> ScalarInterval:
+        """Range of the minimum of the intervals, exact."""
+        return self._result("min")
+
+    def max(self) -> ScalarInterval:
+        """Range of the maximum of the intervals, exact."""
+        return self._result("max")
+
+    def sum(self) -> ScalarInterval:
+        """Rigorous sum of the intervals, 0 for none."""
+        self.flush()
+        return _scalar(self._sum)
+
+    def mean(self) -> ScalarInterval:
+        """Rigorous arithmetic mean of the intervals."""
+        self.flush()
+        if not self._count:
+            raise ValueError("mean of no intervals.")
+        return _scalar(self._sum.divide(self._count))
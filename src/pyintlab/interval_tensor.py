@@ -1,52 +1,65 @@
 """class for Order >= 1 Tensors of Intervals."""
 
-from typing import Self
+from typing import Any
 
-from numpy import array, ndarray, unravel_index
+from numpy import asarray, ndarray, negative
 
-# from .scalar_interval import ScalarInterval
-from pyintlab.numpydt_scalar_interval import NPScalarInterval as ScalarInterval
+from pyintlab import array_linalg
+from pyintlab.array_interval import ArrayInterval, scalar_interval_dtype
+from pyintlab.scalar_interval import ScalarInterval
 
-# https://numpy.org/doc/stable/user/basics.subclassing.html
 
+def _bounds(values: Any) -> tuple[ndarray, ndarray]:
+    """Negated lower and upper bounds of (nested) intervals or numbers."""
+    if isinstance(values, ArrayInterval):
+        return values._nlb, values._ub
+    if isinstance(values, ndarray) and values.dtype == scalar_interval_dtype:
+        return asarray(negative(values["lowerbound"])), values["upperbound"]
+    res: ArrayInterval = ArrayInterval.from_scalar_intervals(values)
+    return res._nlb, res._ub
 
-class IntervallTensor(ndarray):
-    """Class for Order >= 1 Tensors of Intervals."""
 
-    def __new__(cls, input_array) -> Self:
-        return array(object=input_array, dtype=ScalarInterval).view(cls)
+class IntervallTensor(ArrayInterval):
+    """Class for Order >= 1 Tensors of Intervals.
 
+    The intervals live in the two float64 bound buffers of ArrayInterval
+    instead of one Python object per element. Slicing, reshape and
+    transpose return IntervallTensor views of the same buffers, fancy
+    indexing copies like NumPy does. Indexing a single element returns a
+    ScalarIntervalView into the buffers, arithmetic returns ArrayInterval.
+    Unlike ArrayInterval, numbers are point intervals here.
+    """
 
-def solve(A: IntervallTensor, b) -> None:
-    """Solve the linear equation Ax = b."""
-    [rows, cols] = A.shape
-    # Erster Schritt
-    pivpos = abs(A).argmax()
-    therow, thecol = unravel_index(pivpos, A.shape)
-    b[therow, 0] /= b[therow, 0]
-    A[therow, :] /= A[therow, thecol]
-    A[therow, thecol] = 1
-    for runrow in range(rows):
-        if runrow != therow:
-            b[runrow, 0] -= A[runrow, thecol] * b[therow, 0]
-            A[runrow, :] -= A[therow, :] * A[runrow, thecol]
-            A[runrow, thecol] = 0
-    print(A, "\n", b)
-    # Zweiter Schritt
-    pivpos = abs(A).argmax()
-    [therow, thecol] = unravel_index(pivpos, A.shape)
-    b[therow, 0] /= b[therow, 0]
-    A[therow, :] /= A[therow, thecol]
-    A[therow, thecol] = 1
-    print(A, "\n", b)
+    def __init__(self, input_array: Any) -> None:
+        """Copy (nested) intervals, numbers or interval arrays."""
+        nlb, ub = _bounds(input_array)
+        self._set_bounds(nlb.copy(), ub.copy())
+
+    def __setitem__(self, idx: Any, value: Any) -> None:
+        """Store (nested) intervals or numbers at idx."""
+        super().__setitem__(idx, ArrayInterval._from_bounds(*_bounds(value)))
+
+
+def solve(A: IntervallTensor, b: Any) -> IntervallTensor:
+    """Enclose the solutions of the linear equation Ax = b.
+
+    Thin wrapper around pyintlab.array_linalg.solve, which raises
+    numpy.linalg.LinAlgError if no enclosure can be verified.
+    """
+    return IntervallTensor(
+        array_linalg.solve(
+            ArrayInterval._from_bounds(*_bounds(A)),
+            ArrayInterval._from_bounds(*_bounds(b)),
+        )
+    )
 
 
 if __name__ == "__main__":
     A = IntervallTensor(
         [
-            [ScalarInterval(1, 2), ScalarInterval(3, 4)],
-            [ScalarInterval(5, 6), ScalarInterval(7, 8)],
+            [ScalarInterval(1, 1.1), ScalarInterval(3, 3.1)],
+            [ScalarInterval(5, 5.1), ScalarInterval(7, 7.1)],
         ]
     )
-    b = A @ [[1], [1]]
-    solve(A, b)
+    b = A @ IntervallTensor([[1], [1]])
+    print(solve(A, b).tolist())
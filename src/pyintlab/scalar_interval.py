@@ -14,10 +14,14 @@ __lazy_modules__: list[str] = [
 
 import math
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING, Self, SupportsFloat
+from types import NotImplementedType
+from typing import TYPE_CHECKING, Any, Self, SupportsFloat
 
 from valuefragments.mathhelpers import is_exact_float
 
+if TYPE_CHECKING:
+    from .array_interval import ArrayInterval
+
 thelogger: Logger = getLogger(__name__)
 if not TYPE_CHECKING:
     try:
@@ -26,7 +30,68 @@ if not TYPE_CHECKING:
     except ImportError:
         thelogger.info("No cython here. Using python float instead.")
 
-__all__: list[str] = ["ScalarInterval"]
+__all__: list[str] = ["ScalarInterval", "ScalarIntervalView"]
+
+if hasattr(math, "fma"):  # Python >= 3.13 offers a fused multiply-add
+
+    def _producterror(fac1: float, fac2: float, prod: float) -> float:
+        """Exact rounding error fac1*fac2-prod of a finite float product."""
+        return math.fma(fac1, fac2, -prod)
+
+    def _mul_down(fac1: float, fac2: float) -> float:
+        """Product rounded towards -inf."""
+        res: float = fac1 * fac2
+        if math.isfinite(res) and math.fma(fac1, fac2, -res) >= 0:
+            return res
+        return math.nextafter(res, -math.inf)
+
+    def _mul_up(fac1: float, fac2: float) -> float:
+        """Product rounded towards +inf."""
+        res: float = fac1 * fac2
+        if math.isfinite(res) and math.fma(fac1, fac2, -res) <= 0:
+            return res
+        return math.nextafter(res, math.inf)
+
+else:
+    _SPLITTER: float = 134217729.0  # 2**27+1 for Veltkamp splitting
+
+    def _producterror(fac1: float, fac2: float, prod: float) -> float:
+        """Exact rounding error fac1*fac2-prod (Dekker's TwoProduct)."""
+        _tmp: float = _SPLITTER * fac1
+        hi1: float = _tmp - (_tmp - fac1)
+        lo1: float = fac1 - hi1
+        _tmp = _SPLITTER * fac2
+        hi2: float = _tmp - (_tmp - fac2)
+        lo2: float = fac2 - hi2
+        return ((hi1 * hi2 - prod) + hi1 * lo2 + lo1 * hi2) + lo1 * lo2
+
+    # _producterror inlined, the products are the hot path of __mul__.
+    # Overflowed products fail the error test and are stepped outward.
+    def _mul_down(fac1: float, fac2: float) -> float:
+        """Product rounded towards -inf."""
+        res: float = fac1 * fac2
+        _tmp: float = _SPLITTER * fac1
+        hi1: float = _tmp - (_tmp - fac1)
+        lo1: float = fac1 - hi1
+        _tmp = _SPLITTER * fac2
+        hi2: float = _tmp - (_tmp - fac2)
+        lo2: float = fac2 - hi2
+        if ((hi1 * hi2 - res) + hi1 * lo2 + lo1 * hi2) + lo1 * lo2 >= 0:
+            return res
+        return math.nextafter(res, -math.inf)
+
+    def _mul_up(fac1: float, fac2: float) -> float:
+        """Product rounded towards +inf."""
+        res: float = fac1 * fac2
+        _tmp: float = _SPLITTER * fac1
+        hi1: float = _tmp - (_tmp - fac1)
+        lo1: float = fac1 - hi1
+        _tmp = _SPLITTER * fac2
+        hi2: float = _tmp - (_tmp - fac2)
+        lo2: float = fac2 - hi2
+        if ((hi1 * hi2 - res) + hi1 * lo2 + lo1 * hi2) + lo1 * lo2 <= 0:
+            return res
+        return math.nextafter(res, math.inf)
 
 
 class ScalarInterval:  # inheritance from object could be suppressed
@@ -39,6 +104,10 @@ class ScalarInterval:  # inheritance from object could be suppressed
     # measured with from pympler import asizeof by using __slots__ memory
     # usage of one ScalerInterval has been reduced from 504 to 96 bytes.
     # That is less than 20% of the original size.
+    # Interval array classes register here (pyintlab.array_interval does,
+    # importing it from here would be cyclic). Arithmetic with them returns
+    # NotImplemented, so their reflected dunders compute the array result.
+    _array_types: tuple[type, ...] = ()
     _lowerbound: float
     _upperbound: float
     # __new__ is not needed as the default is sufficient
@@ -103,6 +172,73 @@ class ScalarInterval:  # inheritance from object could be suppressed
         """Konservative Outward-Rundung: lo -> -inf, hi -> +inf."""
         return ScalarInterval._downward(lo), ScalarInterval._upward(hi)
 
+    @staticmethod
+    def _from_bounds(lowerbound: float, upperbound: float) -> ScalarInterval:
+        """Trusted fast path for already rounded and ordered float bounds.
+
+        Skips the varargs __init__, the property setters and the exactness
+        check, so only use it for results of the directed rounding helpers.
+        """
+        res: ScalarInterval = object.__new__(ScalarInterval)
+        res._lowerbound = lowerbound
+        res._upperbound = upperbound
+        return res
+
+    ###########################################################################
+    # directed rounding by error-free transformations, exact results are kept
+    ###########################################################################
+    @staticmethod
+    def _add_down(summand1: float, summand2: float) -> float:
+        """Sum rounded towards -inf (TwoSum error-free transformation)."""
+        res: float = summand1 + summand2
+        _tmp: float = res - summand1
+        if (summand1 - (res - _tmp)) + (summand2 - _tmp) >= 0:
+            return res
+        return math.nextafter(res, -math.inf)
+
+    @staticmethod
+    def _add_up(summand1: float, summand2: float) -> float:
+        """Sum rounded towards +inf (TwoSum error-free transformation)."""
+        res: float = summand1 + summand2
+        _tmp: float = res - summand1
+        if (summand1 - (res - _tmp)) + (summand2 - _tmp) <= 0:
+            return res
+        return math.nextafter(res, math.inf)
+
+    _mul_down = staticmethod(_mul_down)
+    _mul_up = staticmethod(_mul_up)
+
+    @staticmethod
+    def _divremainder(dividend: float, divisor: float, quot: float) -> float:
+        """Exact remainder of dividend/divisor, positive if quot is low."""
+        prod: float = quot * divisor
+        rem: float = (dividend - prod) - _producterror(quot, divisor, prod)
+        return rem if divisor > 0 else -rem
+
+    @staticmethod
+    def _div_down(dividend: float, divisor: float) -> float:
+        """Quotient rounded towards -inf."""
+        res: float = dividend / divisor
+        if (
+            math.isfinite(res)
+            and math.isfinite(divisor)
+            and ScalarInterval._divremainder(dividend, divisor, res) >= 0
+        ):
+            return res
+        return math.nextafter(res, -math.inf)
+
+    @staticmethod
+    def _div_up(dividend: float, divisor: float) -> float:
+        """Quotient rounded towards +inf."""
+        res: float = dividend / divisor
+        if (
+            math.isfinite(res)
+            and math.isfinite(divisor)
+            and ScalarInterval._divremainder(dividend, divisor, res) <= 0
+        ):
+            return res
+        return math.nextafter(res, math.inf)
+
     @property
     def mid(self) -> float:
         """Midpoint of interval."""
@@ -122,15 +258,13 @@ class ScalarInterval:  # inheritance from object could be suppressed
         Open thought: The absInterval is the Interval containing
         all abs values from all elements of the given Interval.
         """
-        return (
-            ScalarInterval(abs(self.lowerbound), abs(self.upperbound))
-            if self
-            else ScalarInterval(
-                0,
-                max(-self.lowerbound, self.upperbound),
-                _orderguaranteed=True,
-            )
-        )
+        _lb: float = self.lowerbound
+        _ub: float = self.upperbound
+        if _lb >= 0:
+            return ScalarInterval._from_bounds(_lb, _ub)
+        if _ub <= 0:
+            return ScalarInterval._from_bounds(-_ub, -_lb)
+        return ScalarInterval._from_bounds(0.0, max(-_lb, _ub))
 
     def __str__(self) -> str:
         """Show a readable representation of the Interval."""
@@ -183,30 +317,40 @@ class ScalarInterval:  # inheritance from object could be suppressed
             else NotImplemented
         )
 
-    def __add__(self, other: ScalarInterval | SupportsFloat) -> ScalarInterval:
+    def __add__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> ScalarInterval | NotImplementedType:
         """Dunder method for addition."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(other, ScalarInterval):
-            return ScalarInterval(
-                self.lowerbound + other.lowerbound,
-                self.upperbound + other.upperbound,
-                _orderguaranteed=True,
+            return ScalarInterval._from_bounds(
+                ScalarInterval._add_down(self.lowerbound, other.lowerbound),
+                ScalarInterval._add_up(self.upperbound, other.upperbound),
             )
         _val: float = float(other)
-        return ScalarInterval(
-            self.lowerbound + _val,
-            self.upperbound + _val,
-            _orderguaranteed=True,
+        return ScalarInterval._from_bounds(
+            ScalarInterval._add_down(self.lowerbound, _val),
+            ScalarInterval._add_up(self.upperbound, _val),
         )
 
-    def __iadd__(self, other: ScalarInterval | SupportsFloat) -> Self:
+    def __iadd__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> Self | NotImplementedType:
         """Dunder method for inplace addition."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(other, ScalarInterval):
-            self.lowerbound += other.lowerbound
-            self.upperbound += other.upperbound
+            self._lowerbound = ScalarInterval._add_down(
+                self.lowerbound, other.lowerbound
+            )
+            self._upperbound = ScalarInterval._add_up(
+                self.upperbound, other.upperbound
+            )
             return self
         _val: float = float(other)
-        self.lowerbound += _val
-        self.upperbound += _val
+        self._lowerbound = ScalarInterval._add_down(self.lowerbound, _val)
+        self._upperbound = ScalarInterval._add_up(self.upperbound, _val)
         return self
 
     def __radd__(
@@ -214,16 +358,14 @@ class ScalarInterval:  # inheritance from object could be suppressed
     ) -> ScalarInterval:
         """Dunder method for right addition."""
         if isinstance(other, ScalarInterval):
-            return ScalarInterval(
-                self.lowerbound + other.lowerbound,
-                self.upperbound + other.upperbound,
-                _orderguaranteed=True,
+            return ScalarInterval._from_bounds(
+                ScalarInterval._add_down(other.lowerbound, self.lowerbound),
+                ScalarInterval._add_up(other.upperbound, self.upperbound),
             )
         _val: float = float(other)
-        return ScalarInterval(
-            self.lowerbound + _val,
-            self.upperbound + _val,
-            _orderguaranteed=True,
+        return ScalarInterval._from_bounds(
+            ScalarInterval._add_down(_val, self.lowerbound),
+            ScalarInterval._add_up(_val, self.upperbound),
         )
 
     def reciproc(self) -> ScalarInterval:
@@ -232,57 +374,98 @@ class ScalarInterval:  # inheritance from object could be suppressed
             raise ZeroDivisionError(
                 f"Can not build the reziprocal of indefinite Interval {self}."
             )
-        return ScalarInterval(1 / self.upperbound, 1 / self.lowerbound)
+        return ScalarInterval._from_bounds(
+            ScalarInterval._div_down(1.0, self.upperbound),
+            ScalarInterval._div_up(1.0, self.lowerbound),
+        )
 
     @staticmethod
     def _mulbounds(
         lb1: float, ub1: float, lb2: float, ub2: float
     ) -> tuple[float, float]:
-        if lb1 >= 0 and lb2 >= 0:
-            return lb1 * lb2, ub1 * ub2
-        if ub1 <= 0 and ub2 <= 0:
-            return ub1 * ub2, lb1 * lb2
-        products: tuple[float, float, float, float] = (
-            lb1 * lb2,
-            lb1 * ub2,
-            ub1 * lb2,
-            ub1 * ub2,
+        """Outward rounded bounds of the interval product by sign cases."""
+        _down = _mul_down
+        _up = _mul_up
+        if lb1 >= 0:
+            if lb2 >= 0:
+                return _down(lb1, lb2), _up(ub1, ub2)
+            if ub2 <= 0:
+                return _down(ub1, lb2), _up(lb1, ub2)
+            return _down(ub1, lb2), _up(ub1, ub2)
+        if ub1 <= 0:
+            if lb2 >= 0:
+                return _down(lb1, ub2), _up(ub1, lb2)
+            if ub2 <= 0:
+                return _down(ub1, ub2), _up(lb1, lb2)
+            return _down(lb1, ub2), _up(lb1, lb2)
+        if lb2 >= 0:
+            return _down(lb1, ub2), _up(ub1, ub2)
+        if ub2 <= 0:
+            return _down(ub1, lb2), _up(lb1, lb2)
+        return (
+            min(_down(lb1, ub2), _down(ub1, lb2)),
+            max(_up(lb1, lb2), _up(ub1, ub2)),
         )
-        return min(products), max(products)
 
-    def __mul__(self, other: ScalarInterval | SupportsFloat) -> ScalarInterval:
+    @staticmethod
+    def _scalebounds(
+        lb1: float, ub1: float, val: float
+    ) -> tuple[float, float]:
+        """Outward rounded bounds of the interval scaled by a float."""
+        if val >= 0:
+            return _mul_down(lb1, val), _mul_up(ub1, val)
+        return _mul_down(ub1, val), _mul_up(lb1, val)
+
+    @staticmethod
+    def _divbounds(lb1: float, ub1: float, val: float) -> tuple[float, float]:
+        """Outward rounded bounds of the interval divided by a float."""
+        if val > 0:
+            return (
+                ScalarInterval._div_down(lb1, val),
+                ScalarInterval._div_up(ub1, val),
+            )
+        return ScalarInterval._div_down(ub1, val), ScalarInterval._div_up(
+            lb1, val
+        )
+
+    def __mul__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> ScalarInterval | NotImplementedType:
         """Dunder method for (left) multiplication."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(other, ScalarInterval):
-            return ScalarInterval(
+            return ScalarInterval._from_bounds(
                 *ScalarInterval._mulbounds(
-                    self.lowerbound,
-                    self.upperbound,
-                    other.lowerbound,
-                    other.upperbound,
-                ),
-                _orderguaranteed=True,
+                    self._lowerbound,
+                    self._upperbound,
+                    other._lowerbound,
+                    other._upperbound,
+                )
             )
-        _val: float = float(other)
-        return ScalarInterval(self.lowerbound * _val, self.upperbound * _val)
+        return ScalarInterval._from_bounds(
+            *ScalarInterval._scalebounds(
+                self._lowerbound, self._upperbound, float(other)
+            )
+        )
 
-    def __imul__(self, other: ScalarInterval | SupportsFloat) -> Self:
+    def __imul__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> Self | NotImplementedType:
         """Dunder method for (left) inplace multiplication."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(other, ScalarInterval):
-            self.lowerbound, self.upperbound = ScalarInterval._mulbounds(
-                self.lowerbound,
-                self.upperbound,
-                other.lowerbound,
-                other.upperbound,
+            self._lowerbound, self._upperbound = ScalarInterval._mulbounds(
+                self._lowerbound,
+                self._upperbound,
+                other._lowerbound,
+                other._upperbound,
             )
         else:
-            _val: float = float(other)
-            self.lowerbound *= _val
-            self.upperbound *= _val
-            if _val < 0:
-                self.lowerbound, self.upperbound = (
-                    self.upperbound,
-                    self.lowerbound,
-                )
+            self._lowerbound, self._upperbound = ScalarInterval._scalebounds(
+                self._lowerbound, self._upperbound, float(other)
+            )
         return self
 
     def __pos__(self) -> ScalarInterval:
@@ -295,55 +478,63 @@ class ScalarInterval:  # inheritance from object could be suppressed
 
     def __neg__(self) -> ScalarInterval:
         """Switches the sign of ScalarInterval x ==> -x."""
-        return ScalarInterval(
-            -self.upperbound, -self.lowerbound, _orderguaranteed=True
-        )
+        return ScalarInterval._from_bounds(-self.upperbound, -self.lowerbound)
 
     def __rmul__(
         self, other: ScalarInterval | SupportsFloat
     ) -> ScalarInterval:
         """Dunder method for right multiplikation."""
         if isinstance(other, ScalarInterval):
-            return ScalarInterval(
+            return ScalarInterval._from_bounds(
                 *ScalarInterval._mulbounds(
-                    other.lowerbound,
-                    other.upperbound,
-                    self.lowerbound,
-                    self.upperbound,
-                ),
-                _orderguaranteed=True,
+                    other._lowerbound,
+                    other._upperbound,
+                    self._lowerbound,
+                    self._upperbound,
+                )
             )
-        _val: float = float(other)
-        return ScalarInterval(_val * self.lowerbound, _val * self.upperbound)
+        return ScalarInterval._from_bounds(
+            *ScalarInterval._scalebounds(
+                self._lowerbound, self._upperbound, float(other)
+            )
+        )
 
     def __bool__(self) -> bool:  # python3
         """Dunder method for definiteness (does not contain zero)."""
         return self.lowerbound * self.upperbound > 0
 
-    def __sub__(self, other: ScalarInterval | SupportsFloat) -> ScalarInterval:
+    def __sub__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> ScalarInterval | NotImplementedType:
         """Dunder method for subtraction."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(other, ScalarInterval):
-            return ScalarInterval(
-                self.lowerbound - other.upperbound,
-                self.upperbound - other.lowerbound,
-                _orderguaranteed=True,
+            return ScalarInterval._from_bounds(
+                ScalarInterval._add_down(self.lowerbound, -other.upperbound),
+                ScalarInterval._add_up(self.upperbound, -other.lowerbound),
             )
-        _val: float = float(other)
-        return ScalarInterval(
-            self.lowerbound - _val,
-            self.upperbound - _val,
-            _orderguaranteed=True,
+        _val: float = -float(other)
+        return ScalarInterval._from_bounds(
+            ScalarInterval._add_down(self.lowerbound, _val),
+            ScalarInterval._add_up(self.upperbound, _val),
         )
 
-    def __isub__(self, other: ScalarInterval | SupportsFloat) -> Self:
+    def __isub__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> Self | NotImplementedType:
         """Dunder method for inplace subtraction."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(other, ScalarInterval):
-            self.lowerbound -= other.upperbound
-            self.upperbound -= other.lowerbound
+            self._lowerbound, self._upperbound = (
+                ScalarInterval._add_down(self.lowerbound, -other.upperbound),
+                ScalarInterval._add_up(self.upperbound, -other.lowerbound),
+            )
             return self
-        _val: float = float(other)
-        self.lowerbound -= _val
-        self.upperbound -= _val
+        _val: float = -float(other)
+        self._lowerbound = ScalarInterval._add_down(self.lowerbound, _val)
+        self._upperbound = ScalarInterval._add_up(self.upperbound, _val)
         return self
 
     def __rsub__(
@@ -351,42 +542,49 @@ class ScalarInterval:  # inheritance from object could be suppressed
     ) -> ScalarInterval:
         """Dunder method for rightsubtraction."""
         if isinstance(other, ScalarInterval):
-            return ScalarInterval(
-                other.lowerbound - self.upperbound,
-                other.upperbound - self.lowerbound,
-                orderguaranteed=True,
+            return ScalarInterval._from_bounds(
+                ScalarInterval._add_down(other.lowerbound, -self.upperbound),
+                ScalarInterval._add_up(other.upperbound, -self.lowerbound),
             )
         _val: float = float(other)
-        return ScalarInterval(
-            _val - self.upperbound,
-            _val - self.lowerbound,
-            _orderguaranteed=True,
+        return ScalarInterval._from_bounds(
+            ScalarInterval._add_down(_val, -self.upperbound),
+            ScalarInterval._add_up(_val, -self.lowerbound),
         )
 
     def __truediv__(
-        self, other: ScalarInterval | SupportsFloat
-    ) -> ScalarInterval:
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> ScalarInterval | NotImplementedType:
         """Dunder method for (left) true division."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if not other:
             raise ZeroDivisionError(
                 f"Can not divide by indefinite Interval {other}."
             )
         if isinstance(other, ScalarInterval):
             return self.__mul__(other.reciproc())
-        _val: float = float(other)
-        return ScalarInterval(self.lowerbound / _val, self.upperbound / _val)
+        return ScalarInterval._from_bounds(
+            *ScalarInterval._divbounds(
+                self.lowerbound, self.upperbound, float(other)
+            )
+        )
 
-    def __itruediv__(self, other: ScalarInterval | SupportsFloat) -> Self:
+    def __itruediv__(
+        self, other: ScalarInterval | SupportsFloat | ArrayInterval
+    ) -> Self | NotImplementedType:
         """Dunder method for (left) true inplace division."""
+        if isinstance(other, ScalarInterval._array_types):
+            return NotImplemented
         if not other:
             raise ZeroDivisionError(
                 f"Can not divide by indefinite Interval {other}."
             )
         if isinstance(other, ScalarInterval):
             return self.__imul__(other.reciproc())
-        _val: float = float(other)
-        self.lowerbound /= _val
-        self.upperbound /= _val
+        self._lowerbound, self._upperbound = ScalarInterval._divbounds(
+            self.lowerbound, self.upperbound, float(other)
+        )
         return self
 
     # https://docs.python.org/3.6/reference/datamodel.html#object.__radd__
@@ -404,9 +602,11 @@ class ScalarInterval:  # inheritance from object could be suppressed
         return self.lowerbound <= float(item) <= self.upperbound
 
     def __pow__(
-        self, exponent: ScalarInterval | int | float
-    ) -> ScalarInterval:
+        self, exponent: ScalarInterval | int | float | ArrayInterval
+    ) -> ScalarInterval | NotImplementedType:
         """Return the interval to the power of the given exponent."""
+        if isinstance(exponent, ScalarInterval._array_types):
+            return NotImplemented
         if isinstance(exponent, ScalarInterval):
             pows: tuple[float, float, float, float] = (
                 self.lowerbound**exponent.lowerbound,
@@ -474,6 +674,47 @@ class ScalarInterval:  # inheritance from object could be suppressed
         )
 
 
+class ScalarIntervalView(ScalarInterval):
+    """ScalarInterval reading and writing one element of bound buffers.
+
+    Interval arrays hand it out for single elements instead of copies. The
+    buffers hold negated lower and upper bounds, as in ArrayInterval. All
+    ScalarInterval operations see the current values, in-place operators
+    write through to the buffers, other results are plain ScalarIntervals.
+    """
+
+    __slots__ = ("_buffers", "_index")
+    _buffers: tuple[Any, Any]
+    _index: Any
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, nlb: Any, ub: Any, index: Any
+    ) -> None:
+        """Point at element index of the buffers nlb and ub."""
+        self._buffers = (nlb, ub)
+        self._index = index
+
+    @property
+    def _lowerbound(self) -> float:  # type: ignore[override]
+        """Lower bound, read from the buffer of negated lower bounds."""
+        return -float(self._buffers[0][self._index])
+
+    @_lowerbound.setter
+    def _lowerbound(self, value: float) -> None:
+        """Store the lower bound negated."""
+        self._buffers[0][self._index] = -value
+
+    @property
+    def _upperbound(self) -> float:  # type: ignore[override]
+        """Upper bound, read from the buffer of upper bounds."""
+        return float(self._buffers[1][self._index])
+
+    @_upperbound.setter
+    def _upperbound(self, value: float) -> None:
+        """Store the upper bound."""
+        self._buffers[1][self._index] = value
+
+
 ###############################################################################
 if __name__ == "__main__":  # Small application
     pitest: ScalarInterval = ScalarInterval(3, 4)
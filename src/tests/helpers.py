@@ -0,0 +1,18 @@
+"""Shared helpers of the ArrayInterval tests."""
+
+import numpy as np
+
+from pyintlab.array_interval import ArrayInterval
+
+
+def random_intervals(shape, seed=0):
+    """ArrayInterval of shape with normally distributed bounds."""
+    rng = np.random.default_rng(seed)
+    bounds = np.sort(rng.normal(size=(int(np.prod(shape)), 2)), axis=1)
+    return ArrayInterval(bounds).reshape(shape)
+
+
+def assert_same(res, ref):
+    """res and ref have identical bounds."""
+    assert np.array_equal(res.lowerbound, ref.lowerbound)
+    assert np.array_equal(res.upperbound, ref.upperbound)
@@ -1,5 +1,21 @@
-from pyintlab.array_interval import ArrayInterval
-from pyintlab.scalar_interval import ScalarInterval
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from pyintlab import array_interval
+from pyintlab.array_interval import (
+    ArrayInterval,
+    RoundingContext,
+    RoundingMode,
+    RoundingSession,
+    get_rounding_mode,
+    rounding_statistics,
+    scalar_interval_dtype,
+)
+from pyintlab.scalar_interval import ScalarInterval, ScalarIntervalView
+
+from .helpers import random_intervals
 
 
 def test_array_creation():
@@ -48,3 +64,415 @@ def test_matmul():
     # = [1, 1.21] + [2, 2.31] = [3, 3.52]
     assert res.lowerbound[0, 0] >= 3.0
     assert res.upperbound[0, 0] >= 3.52
+
+
+def test_matmul_blocked_matches_unblocked():
+    A = random_intervals((7, 5), seed=1)
+    B = random_intervals((5, 6), seed=2)
+
+    reference = A.matmul(B, memory_budget=2**40)
+    for budget in (1, 200, 4000):
+        res = A.matmul(B, memory_budget=budget)
+        assert np.allclose(res.lowerbound, reference.lowerbound)
+        assert np.allclose(res.upperbound, reference.upperbound)
+        assert np.all(res.lowerbound <= res.upperbound)
+
+
+def test_matmul_batched_and_vector():
+    A = random_intervals((3, 1, 4, 5), seed=3)
+    B = random_intervals((2, 5, 6), seed=4)
+    v = random_intervals((5,), seed=5)
+
+    res = A.matmul(B, memory_budget=500)
+    assert res.shape == (3, 2, 4, 6)
+    single = ArrayInterval(A[1, 0]) @ ArrayInterval(B[1])
+    assert np.allclose(res.lowerbound[1, 1], single.lowerbound)
+    assert np.allclose(res.upperbound[1, 1], single.upperbound)
+
+    assert (ArrayInterval(A[0, 0]) @ v).shape == (4,)
+    assert (v @ ArrayInterval(B[0])).shape == (6,)
+    assert (v @ v).shape == ()
+
+
+def test_matmul_midrad_encloses():
+    A = random_intervals((3, 6, 5), seed=6)
+    B = random_intervals((5, 4), seed=7)
+
+    blocked = A.matmul(B, method="blocked")
+    midrad = A.matmul(B, method="midrad")
+    assert midrad.shape == blocked.shape
+    # random point matrices out of A and B lie inside the enclosure
+    rng = np.random.default_rng(8)
+    for _ in range(5):
+        a = A.lowerbound + rng.random(A.shape) * (A.upperbound - A.lowerbound)
+        b = B.lowerbound + rng.random(B.shape) * (B.upperbound - B.lowerbound)
+        assert np.all(midrad.lowerbound <= a @ b)
+        assert np.all(a @ b <= midrad.upperbound)
+    # documented overestimation: at most 1.5 times the blocked radius
+    rad_blocked = blocked.upperbound - blocked.lowerbound
+    rad_midrad = midrad.upperbound - midrad.lowerbound
+    assert np.all(rad_midrad <= 1.5 * rad_blocked + 1e-12)
+
+    default = array_interval.MATMUL_METHOD
+    try:
+        array_interval.MATMUL_METHOD = "midrad"
+        assert np.array_equal((A @ B).upperbound, midrad.upperbound)
+    finally:
+        array_interval.MATMUL_METHOD = default
+    with pytest.raises(ValueError):
+        A.matmul(B, method="strassen")
+
+
+def test_struct_of_arrays_storage():
+    data = np.array(
+        [(1.0, 2.0), (-3.0, 4.0), (0.5, 0.5)], dtype=scalar_interval_dtype
+    )
+    ai = ArrayInterval(data)
+    for bound in (ai.lowerbound, ai.upperbound, (ai + ai).lowerbound):
+        assert bound.dtype == np.float64
+        assert bound.flags.c_contiguous
+
+    structured = ai.to_structured()
+    assert structured.dtype == scalar_interval_dtype
+    assert np.array_equal(structured, data)
+    assert ai[1] == ScalarInterval(-3.0, 4.0)
+
+    ai[0] = (-1.0, 1.0)
+    ai[1:] = ArrayInterval([(5.0, 6.0), (7.0, 8.0)])
+    assert ai.lowerbound.tolist() == [-1.0, 5.0, 7.0]
+    assert ai.upperbound.tolist() == [1.0, 6.0, 8.0]
+    with pytest.raises(ValueError):
+        ai[0] = (2.0, 1.0)
+
+
+def test_negated_lower_bound_storage():
+    A = random_intervals((50,), seed=9)
+    B = random_intervals((50,), seed=10)
+    # lower bounds are rounded as negated upper bounds, so these are exact
+    assert np.array_equal((A - B).lowerbound, (-(B - A)).lowerbound)
+    assert np.array_equal((A - B).upperbound, (-(B - A)).upperbound)
+    assert np.array_equal((A * -2.5).lowerbound, (-A * 2.5).lowerbound)
+    assert np.array_equal((-A).lowerbound, -A.upperbound)
+    assert np.all(A.lowerbound <= A.upperbound)
+    assert np.array_equal(A.to_structured()["lowerbound"], A.lowerbound)
+
+
+@pytest.mark.skipif(
+    not array_interval._HAS_ROUNDING_CONTROL, reason="no rounding control"
+)
+def test_rounding_context_restores_prior_mode():
+    with RoundingContext(RoundingMode.DOWNWARD):
+        assert np.float64(1.0) + np.float64(2.0**-60) == 1.0
+        with RoundingContext(RoundingMode.UPWARD):
+            assert get_rounding_mode() == RoundingMode.UPWARD
+            assert np.float64(1.0) + np.float64(2.0**-60) > 1.0
+        assert get_rounding_mode() == RoundingMode.DOWNWARD
+    assert get_rounding_mode() == RoundingMode.TONEAREST
+
+
+@pytest.mark.skipif(
+    not array_interval._HAS_ROUNDING_CONTROL, reason="no rounding control"
+)
+def test_rounding_session_amortizes_switches():
+    A = random_intervals((20,), seed=11)
+
+    def pipeline():
+        return ((A + A) * A - A) / 3.0
+
+    reference = pipeline()
+    rounding_statistics.reset()
+    pipeline()
+    assert rounding_statistics.switches == 8
+
+    rounding_statistics.reset()
+    with RoundingSession() as session:
+        res = pipeline()
+        with RoundingSession(RoundingMode.UPWARD):
+            assert get_rounding_mode() == RoundingMode.UPWARD
+    assert session.switches == 2
+    assert rounding_statistics.skipped == 4
+    assert get_rounding_mode() == RoundingMode.TONEAREST
+    assert np.array_equal(res.lowerbound, reference.lowerbound)
+    assert np.array_equal(res.upperbound, reference.upperbound)
+
+
+def test_numpy_ufunc_protocol():
+    A = random_intervals((4, 3), seed=12)
+    B = random_intervals((4, 3), seed=13)
+
+    for res, reference in (
+        (np.add(A, B), A + B),
+        (np.multiply(A, B), A * B),
+        (np.float64(2.5) * A, A * 2.5),
+        (np.subtract(1.0, A), 1.0 - A),
+        (np.exp(A), A.exp()),
+        (np.abs(A), abs(A)),
+        (np.add.reduce(A, axis=1), A.sum(axis=1)),
+    ):
+        assert np.array_equal(res.lowerbound, reference.lowerbound)
+        assert np.array_equal(res.upperbound, reference.upperbound)
+
+    points = np.linspace(-1.0, 1.0, 3)
+    res = points * A
+    assert res.lowerbound[0, 0] == -A.upperbound[0, 0]
+    assert res.upperbound[0, 1] == 0.0
+
+    out = random_intervals((4, 3), seed=14)
+    assert np.add(A, B, out=out) is out
+    assert np.array_equal(out.upperbound, (A + B).upperbound)
+
+
+def test_numpy_array_functions():
+    A = random_intervals((4, 3), seed=15)
+    B = random_intervals((3,), seed=16)
+
+    total = np.sum(A)
+    assert total.shape == ()
+    assert total.lowerbound <= A.lowerbound.sum() <= total.upperbound
+    assert np.sum(A, axis=0).shape == (3,)
+
+    assert np.concatenate([A, A], axis=1).shape == (4, 6)
+    stacked = np.stack([B, B, B])
+    assert stacked.shape == (3, 3)
+    assert np.array_equal(stacked.upperbound[2], B.upperbound)
+
+    mixed = np.where(A.lowerbound > 0, A, 0.0)
+    assert np.all(mixed.lowerbound[A.lowerbound <= 0] == 0.0)
+
+    assert np.array_equal(np.dot(A, B).lowerbound, (A @ B).lowerbound)
+    assert np.shape(A) == (4, 3) and np.ndim(A) == 2 and np.size(A) == 12
+
+
+def test_inplace_and_out_buffers():
+    A = random_intervals((5, 4), seed=17)
+    B = random_intervals((5, 4), seed=18)
+    nlb, ub = A._nlb, A._ub
+
+    acc = ArrayInterval._from_bounds(A._nlb.copy(), A._ub.copy())
+    buffers = acc._nlb, acc._ub
+    acc += B
+    acc *= -2.0
+    acc -= A
+    acc /= ArrayInterval([(1.0, 2.0)])
+    assert acc._nlb is buffers[0] and acc._ub is buffers[1]
+    reference = ((A + B) * -2.0 - A) / ArrayInterval([(1.0, 2.0)])
+    assert np.array_equal(acc.lowerbound, reference.lowerbound)
+    assert np.array_equal(acc.upperbound, reference.upperbound)
+
+    out = random_intervals((5, 4), seed=19)
+    assert A.multiply(B, out=out) is out
+    assert np.array_equal(out.upperbound, (A * B).upperbound)
+    assert A.exp(out=out) is out
+    assert np.array_equal(out.lowerbound, A.exp().lowerbound)
+
+    # aliasing of operands and out
+    zero = A - A
+    A_copy = ArrayInterval._from_bounds(A._nlb.copy(), A._ub.copy())
+    A_copy -= A_copy
+    assert np.array_equal(A_copy.upperbound, zero.upperbound)
+    A_copy = ArrayInterval._from_bounds(A._nlb.copy(), A._ub.copy())
+    A_copy.negative(out=A_copy)
+    assert np.array_equal(A_copy.lowerbound, -A.upperbound)
+    assert np.array_equal(A_copy.upperbound, -A.lowerbound)
+
+    # results never share memory with the operands
+    for res in (-A, +A, A.positive(), A.negative()):
+        assert not np.shares_memory(res._nlb, nlb)
+        assert not np.shares_memory(res._ub, ub)
+
+
+def test_reductions_enclose_exact_values():
+    rng = np.random.default_rng(20)
+    x = rng.normal(size=(301, 2)) * 10.0 ** rng.integers(-8, 8, (301, 2))
+    x = np.concatenate([x, -x[:150]])
+    A = ArrayInterval._from_bounds(-x, x.copy())
+    exact = [sum(Fraction(v) for v in x[:, j]) for j in range(2)]
+    widths = {}
+    for method in ("rounding", "eft"):
+        total = A.sum(axis=0, method=method)
+        for j in range(2):
+            assert Fraction(total.lowerbound[j]) <= exact[j]
+            assert exact[j] <= Fraction(total.upperbound[j])
+        widths[method] = total.upperbound - total.lowerbound
+    assert np.all(widths["eft"] <= widths["rounding"])
+    assert np.all(widths["eft"] <= 8 * np.spacing(np.abs(total.upperbound)))
+    assert A.sum(method="eft").shape == ()
+    assert A.sum(axis=(0, 1), keepdims=True, method="eft").shape == (1, 1)
+    with pytest.raises(ValueError):
+        A.sum(method="kahan")
+
+    running = A.cumsum(axis=0)
+    assert running.shape == x.shape
+    assert Fraction(running.lowerbound[-1, 0]) <= exact[0]
+    assert np.cumsum(A).shape == (x.size,)
+
+    mean = np.mean(A, axis=0)
+    assert Fraction(mean.upperbound[1]) >= exact[1] / x.shape[0]
+
+
+def test_prod_min_max_hull():
+    A = ArrayInterval([(-1.0, 2.0), (0.5, 1.0), (-3.0, -2.0)])
+    product = A.prod()
+    assert (product.lowerbound, product.upperbound) == (-6.0, 3.0)
+    assert np.prod(ArrayInterval([(1.0, 2.0)] * 5)).upperbound == 32.0
+    empty = ArrayInterval._from_bounds(np.empty((0, 2)), np.empty((0, 2)))
+    assert np.array_equal(empty.prod(axis=0).upperbound, [1.0, 1.0])
+
+    assert (A.min().lowerbound, A.min().upperbound) == (-3.0, -2.0)
+    assert (np.max(A).lowerbound, np.max(A).upperbound) == (0.5, 2.0)
+    assert (A.hull().lowerbound, A.hull().upperbound) == (-3.0, 2.0)
+
+    B = random_intervals((4, 3), seed=21)
+    C = random_intervals((3,), seed=22)
+    assert np.array_equal(B.dot(C).upperbound, (B @ C).upperbound)
+    assert np.array_equal(C.dot(C).upperbound, (C @ C).upperbound)
+
+
+def test_rounding_fallback_encloses(monkeypatch):
+    monkeypatch.setattr(array_interval, "ROUNDING_FALLBACK", True)
+    A = random_intervals((6, 5), seed=23)
+    B = random_intervals((5, 4), seed=24)
+
+    def exact_bounds(i, j):
+        # sums of the extreme corner products, computed exactly
+        lower = upper = Fraction(0)
+        for k in range(5):
+            corners = [
+                Fraction(float(a)) * Fraction(float(b))
+                for a in (A.lowerbound[i, k], A.upperbound[i, k])
+                for b in (B.lowerbound[k, j], B.upperbound[k, j])
+            ]
+            lower += min(corners)
+            upper += max(corners)
+        return lower, upper
+
+    for method in ("blocked", "midrad"):
+        C = A.matmul(B, method=method)
+        for i in range(6):
+            for j in range(4):
+                lower, upper = exact_bounds(i, j)
+                assert Fraction(C.lowerbound[i, j]) <= lower
+                assert Fraction(C.upperbound[i, j]) >= upper
+
+    third = ArrayInterval([(1.0, 1.0)]) / 3.0
+    assert Fraction(third.lowerbound[0]) < Fraction(1, 3)
+    assert Fraction(third.upperbound[0]) > Fraction(1, 3)
+    total = ArrayInterval([(0.1, 0.1)]) + ArrayInterval([(0.2, 0.2)])
+    exact = Fraction(0.1) + Fraction(0.2)
+    assert Fraction(total.lowerbound[0]) <= exact
+    assert exact <= Fraction(total.upperbound[0])
+
+    x = np.random.default_rng(25).normal(size=1000)
+    exact = sum(map(Fraction, x))
+    X = ArrayInterval._from_bounds(-x, x.copy())
+    running = X.cumsum()
+    for lower, upper in (
+        (X.sum().lowerbound, X.sum().upperbound),
+        (running.lowerbound[-1], running.upperbound[-1]),
+    ):
+        assert Fraction(float(lower)) <= exact <= Fraction(float(upper))
+
+
+def test_indexing_views_and_scalar_conversion():
+    ai = ArrayInterval(np.array([[0.0, 1.0], [2.0, 3.0], [-1.0, 4.0]]))
+    element = ai[2]
+    assert isinstance(element, ScalarIntervalView)
+    assert element == ScalarInterval(-1.0, 4.0)
+    element *= 2
+    assert ai.upperbound[2] == 8.0
+    view = ai[1:]
+    assert isinstance(view, ArrayInterval)
+    assert np.shares_memory(view._ub, ai._ub)
+    view[0] = ScalarInterval(5.0, 6.0)
+    assert ai[1] == ScalarInterval(5.0, 6.0)
+
+    scalars = [ScalarInterval(1, 2), 3.0, ScalarInterval(-1, 0.5)]
+    converted = ArrayInterval.from_scalar_intervals(scalars)
+    assert converted.tolist() == [
+        ScalarInterval(1, 2),
+        ScalarInterval(3.0),
+        ScalarInterval(-1, 0.5),
+    ]
+    assert ArrayInterval(scalars).tolist() == converted.tolist()
+    objects = converted.to_scalar_intervals()
+    assert objects.dtype == object and objects.shape == (3,)
+    assert type(objects[0]) is ScalarInterval
+    copied = ArrayInterval(converted)
+    assert not np.shares_memory(copied._ub, converted._ub)
+
+
+def test_numpy_scalar_and_scalar_interval_operands():
+    x = ArrayInterval([(1.0, 2.0), (-3.0, 4.0)])
+    for number in (np.int64(2), np.float32(2.0), 2):
+        for res in (x + number, x * number, x / number, number * x):
+            assert isinstance(res, ArrayInterval)
+    assert (x / np.int64(2)).upperbound.tolist() == [1.0, 2.0]
+    shifted = x + ScalarInterval(1, 2)
+    assert shifted.lowerbound.tolist() == [2.0, -2.0]
+    assert shifted.upperbound.tolist() == [4.0, 6.0]
+    scaled = x * ScalarInterval(-1, 1)
+    assert scaled.lowerbound.tolist() == [-2.0, -4.0]
+    assert scaled.upperbound.tolist() == [2.0, 4.0]
+    quotient = x / ScalarInterval(2, 4)
+    assert quotient.lowerbound[1] <= -1.5 and quotient.upperbound[1] >= 2.0
+
+
+def test_mixed_scalar_and_array_arithmetic():
+    x = ArrayInterval([(1.0, 2.0), (-3.0, 4.0)])
+    element = x[0]
+    for res in (
+        x + element,
+        element + x,
+        element - x,
+        element * x,
+        element / x[:1],
+        element**x,
+    ):
+        assert isinstance(res, ArrayInterval)
+    assert (element - x).upperbound.tolist() == [1.0, 5.0]
+    assert (x[1] * x).lowerbound.tolist() == [-6.0, -12.0]
+    total = ScalarInterval(0, 0)
+    total += x
+    assert isinstance(total, ArrayInterval)
+
+
+def test_mean_of_empty_axis_is_empty_interval():
+    empty = ArrayInterval._from_bounds(np.zeros((0, 3)), np.zeros((0, 3)))
+    res = np.mean(empty, axis=0)
+    assert res.shape == (3,)
+    assert np.isnan(res.lowerbound).all() and np.isnan(res.upperbound).all()
+    assert empty.mean(axis=1).shape == (0,)
+
+
+def test_arrow_columns_round_trip():
+    values = ArrayInterval(
+        np.sort(np.random.default_rng(3).normal(size=(12, 2)), axis=1)
+    ).reshape(3, 4)
+    columns = values.arrow_columns()
+    assert list(columns) == ["lower", "upper"]
+    assert np.array_equal(columns["lower"], values.lowerbound.ravel())
+    assert np.shares_memory(columns["upper"], values._ub)
+    res = ArrayInterval.from_arrow_columns(**columns, shape=(3, 4))
+    assert np.shares_memory(res._ub, values._ub)
+    assert np.array_equal(res.lowerbound, values.lowerbound)
+    lower = memoryview(columns["lower"])[2:5]
+    upper = memoryview(columns["upper"])[2:5]
+    part = ArrayInterval.from_arrow_columns(lower, upper)
+    assert np.shares_memory(part._ub, values._ub)
+    assert np.array_equal(part.upperbound, values.upperbound.ravel()[2:5])
+    raw = ArrayInterval.from_arrow_columns(
+        columns["lower"].tobytes(), memoryview(columns["upper"]).cast("B")
+    )
+    assert np.array_equal(raw.lowerbound, values.lowerbound.ravel())
+    assert np.shares_memory(raw._ub, values._ub)
+    with pytest.raises(ValueError):
+        ArrayInterval.from_arrow_columns(lower, columns["upper"])
+
+
+def test_from_arrow_columns_validates_bounds():
+    with pytest.raises(ValueError, match="Lower bound"):
+        ArrayInterval.from_arrow_columns([5.0, np.nan], [1.0, 2.0])
+    with pytest.raises(ValueError, match="Lower bound"):
+        ArrayInterval.from_arrow_columns([1.0], [np.nan])
+    empty = ArrayInterval.from_arrow_columns([np.nan], [np.nan])
+    assert empty.isempty().all()
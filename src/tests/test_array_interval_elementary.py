@@ -0,0 +1,132 @@
+"""Elementary functions of ArrayInterval against mpmath interval results."""
+
+import numpy as np
+import pytest
+from mpmath import iv, mp, mpf
+
+from pyintlab.array_interval import ArrayInterval
+
+BOUNDS = [
+    (0.1, 0.2),
+    (0.5, 3.0),
+    (1.0, 1.0),
+    (1e-300, 1e-10),
+    (2.0, 700.0),
+    (-1.0, 1.0),
+    (-3.0, -0.5),
+    (-0.0, 0.0),
+    (-20.0, 20.0),
+]
+
+
+def _encloses(res, pos, exact):
+    """res[pos] contains the mpmath interval exact."""
+    return mpf(float(res.lowerbound[pos])) <= exact.a and exact.b <= mpf(
+        float(res.upperbound[pos])
+    )
+
+
+@pytest.mark.parametrize(
+    "name, domain",
+    [
+        ("sqrt", 0.0),
+        ("exp", -np.inf),
+        ("log", 0.0),
+        ("log2", 0.0),
+        ("log10", 0.0),
+        ("log1p", -1.0),
+        ("tanh", -np.inf),
+        ("sin", -np.inf),
+        ("cos", -np.inf),
+    ],
+)
+def test_functions_enclose_mpmath(name, domain):
+    mp.prec = 120
+    iv.prec = 120
+    res = getattr(ArrayInterval(BOUNDS), name)()
+    ivfunc = {
+        "log2": lambda x: iv.log(x, 2),
+        "log10": lambda x: iv.log(x, 10),
+        # monotone, 1 + x would drop tiny x
+        "log1p": lambda x: iv.mpf([mp.log1p(x.a), mp.log1p(x.b)]),
+        "tanh": lambda x: iv.mpf([mp.tanh(x.a), mp.tanh(x.b)]),
+    }.get(name) or getattr(iv, name)
+    for pos, (lb, ub) in enumerate(BOUNDS):
+        if ub < domain or (ub == domain and name.startswith("log")):
+            assert res.isempty()[pos]
+            continue
+        exact = ivfunc(iv.mpf([max(lb, domain), ub]))
+        if exact.a == -mp.inf:  # log of the domain boundary
+            assert res.lowerbound[pos] == -np.inf
+            exact = ivfunc(iv.mpf([ub, ub]))
+        assert _encloses(res, pos, exact), (name, lb, ub)
+    mp.prec = 53
+    iv.prec = 53
+
+
+def test_domain_masks():
+    values = ArrayInterval([(-4.0, 9.0), (-4.0, -1.0), (4.0, 9.0)])
+    res = values.sqrt()
+    assert res.isempty().tolist() == [False, True, False]
+    assert res.lowerbound[0] == 0.0
+    assert res.upperbound[0] >= 3.0
+
+    res = values**0.5
+    assert res.isempty().tolist() == [False, True, False]
+    assert res.lowerbound[2] <= 2.0 <= res.upperbound[2]
+
+
+def test_non_monotone_functions():
+    res = ArrayInterval([(-2.0, 1.0), (0.5, 3.5), (1.0, 2.0)]).cos()
+    assert res.upperbound[0] == 1.0
+    assert res.lowerbound[1] == -1.0
+    assert res.lowerbound[2] <= np.cos(2.0) and res.upperbound[2] >= np.cos(
+        1.0
+    )
+
+    res = ArrayInterval([(1.0, 2.0), (4.0, 5.0), (2.0, 3.0)]).sin()
+    assert res.upperbound[0] == 1.0
+    assert res.lowerbound[1] == -1.0
+    assert -1.0 < res.lowerbound[2] and res.upperbound[2] < 1.0
+
+    squares = ArrayInterval([(-2.0, 3.0), (-3.0, -2.0)]) ** 2
+    assert squares.lowerbound[0] == 0.0
+    assert squares.upperbound[0] >= 9.0
+    assert squares.lowerbound[1] <= 4.0 <= squares.upperbound[1]
+    same = ArrayInterval([(-2.0, 3.0), (-3.0, -2.0)]) ** np.int64(2)
+    assert np.array_equal(same.lowerbound, squares.lowerbound)
+    assert np.array_equal(same.upperbound, squares.upperbound)
+    ones = ArrayInterval([(-2.0, 1.0), (0.0, 0.0)]) ** 0
+    assert ones.lowerbound.tolist() == ones.upperbound.tolist() == [1.0, 1.0]
+
+    res = abs(ArrayInterval([(-2.0, 3.0), (-3.0, -2.0), (1.0, 2.0)]))
+    assert res.lowerbound.tolist() == [0.0, 2.0, 1.0]
+    assert res.upperbound.tolist() == [3.0, 3.0, 2.0]
+
+
+def test_log_with_base():
+    values = ArrayInterval([(8.0, 8.0), (1.0, 100.0)])
+    res = values.log(2)
+    assert res.lowerbound[0] <= 3.0 <= res.upperbound[0]
+    res = values.log(ArrayInterval([(10.0, 10.0)]))
+    assert res.lowerbound[1] <= 0.0 and res.upperbound[1] >= 2.0
+
+
+def test_negative_powers_of_intervals_containing_zero():
+    values = ArrayInterval(
+        [(-1.0, 1.0), (0.0, 2.0), (-2.0, 0.0), (0.0, 0.0), (2.0, 4.0)]
+    )
+    even = values**-2
+    assert even.upperbound[:3].tolist() == [np.inf] * 3
+    assert even.lowerbound[0] <= 1.0 and even.lowerbound[1] <= 0.25
+    assert even.isempty().tolist() == [False, False, False, True, False]
+    assert even.lowerbound[4] <= 1 / 16 <= 0.25 <= even.upperbound[4]
+    odd = values ** np.int64(-3)
+    assert (odd.lowerbound[0], odd.upperbound[0]) == (-np.inf, np.inf)
+    assert odd.upperbound[1] == np.inf and 0 < odd.lowerbound[1] <= 0.125
+    assert odd.lowerbound[2] == -np.inf and -0.125 <= odd.upperbound[2] < 0
+    assert odd.isempty()[3]
+    assert odd.lowerbound[4] <= 1 / 64 <= 0.125 <= odd.upperbound[4]
+    tiny = ArrayInterval([(1e-200, 1e-100), (-1e-100, -1e-200)]) ** -3
+    assert tiny.upperbound[0] == np.inf and tiny.lowerbound[1] == -np.inf
+    assert tiny.lowerbound[0] > 0 and tiny.upperbound[1] < 0
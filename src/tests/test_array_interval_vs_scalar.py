@@ -81,6 +81,29 @@ class TestArrayIntervalVsScalar:
         assert np.allclose(result_ai.lowerbound, ref_lower)
         assert np.allclose(result_ai.upperbound, ref_upper)
 
+    def test_multiplication_sign_cases(self):
+        """Every sign combination of both factors matches ScalarInterval."""
+        points = [-3.0, -1.0, 0.0, 2.0, 5.0]
+        intervals = [(a, b) for a in points for b in points if a <= b]
+        left = [x for x in intervals for _ in intervals]
+        right = [y for _ in intervals for y in intervals]
+
+        result_ai = ArrayInterval(left) * ArrayInterval(right)
+
+        for i, (x, y) in enumerate(zip(left, right)):
+            res_si = ScalarInterval(*x) * ScalarInterval(*y)
+            assert result_ai.lowerbound[i] == res_si.lowerbound
+            assert result_ai.upperbound[i] == res_si.upperbound
+
+    def test_multiplication_by_scalar(self):
+        """Numbers broadcast against the array, negative ones swap bounds."""
+        ai = ArrayInterval([(-1.0, 2.0), (3.0, 4.0)])
+
+        result_ai = ai * -2.0
+
+        assert result_ai.lowerbound.tolist() == [-4.0, -8.0]
+        assert result_ai.upperbound.tolist() == [2.0, -6.0]
+
     def test_matmul_consistency(self):
         """Verify that ArrayInterval matrix multiplication matches ScalarInterval matrix multiplication."""
         # Create 2x2 interval matrices
@@ -0,0 +1,128 @@
+"""Tests for the verified interval linear system solvers."""
+
+import numpy as np
+import pytest
+
+from pyintlab import interval_tensor
+from pyintlab.array_interval import ArrayInterval
+from pyintlab.array_linalg import IntervalFactorization, solve, solve_batched
+from pyintlab.interval_tensor import IntervallTensor
+from pyintlab.numpydt_scalar_interval import NPScalarInterval
+
+
+def _perturbed(matrices, relative=1e-6):
+    radius = relative * np.abs(matrices)
+    return ArrayInterval._from_bounds(-(matrices - radius), matrices + radius)
+
+
+def test_batched_encloses_point_solutions():
+    rng = np.random.default_rng(1)
+    matrices = rng.normal(size=(200, 4, 4)) + 4 * np.eye(4)
+    solutions = rng.normal(size=(200, 4))
+    rhs = np.einsum("bij,bj->bi", matrices, solutions)
+
+    res, verified = solve_batched(_perturbed(matrices), rhs)
+    assert res.shape == (200, 4) and verified.shape == (200,)
+    assert verified.all()
+    assert np.all(res.lowerbound <= solutions)
+    assert np.all(solutions <= res.upperbound)
+    assert np.max(res.upperbound - res.lowerbound) < 1e-3
+
+    res, verified = solve_batched(_perturbed(matrices), rhs, method="midrad")
+    assert verified.all()
+    assert np.all(res.lowerbound <= solutions)
+    assert np.all(solutions <= res.upperbound)
+
+
+def test_batched_encloses_interval_solution_set():
+    # [2, 3] x = [4, 6] has the solution set [4/3, 3]
+    res, verified = solve_batched(
+        ArrayInterval._from_bounds(
+            np.full((1, 1), -2.0), np.full((1, 1), 3.0)
+        ),
+        ArrayInterval([(4.0, 6.0)]),
+    )
+    assert verified.item()
+    assert res.lowerbound[0] <= 4 / 3 and res.upperbound[0] >= 3.0
+
+
+def test_batched_flags_singular_systems():
+    matrices = np.stack([np.ones((3, 3)), np.eye(3)])
+    res, verified = solve_batched(
+        ArrayInterval._from_bounds(-matrices, matrices), np.ones((2, 3))
+    )
+    assert verified.tolist() == [False, True]
+    assert np.all(np.isinf(res.upperbound[0]))
+    assert np.all(res.lowerbound[1] == 1.0) and np.all(
+        res.upperbound[1] == 1.0
+    )
+
+    with pytest.raises(ValueError):
+        solve_batched(
+            ArrayInterval._from_bounds(-matrices, matrices), np.ones(2)
+        )
+
+
+def test_dense_solve_encloses_solutions():
+    rng = np.random.default_rng(2)
+    matrix = rng.normal(size=(120, 120))
+    solutions = rng.normal(size=(120, 3))
+    A = _perturbed(matrix, 1e-12)
+
+    res = solve(A, matrix @ solutions)
+    assert res.shape == (120, 3)
+    assert np.all(res.lowerbound <= solutions)
+    assert np.all(solutions <= res.upperbound)
+    assert np.max(res.upperbound - res.lowerbound) < 1e-6
+
+    vector = solve(A, matrix @ solutions[:, 0], method="blocked")
+    assert vector.shape == (120,)
+    assert np.all(vector.lowerbound <= solutions[:, 0])
+    assert np.all(solutions[:, 0] <= vector.upperbound)
+
+
+def test_dense_solve_refuses_singular():
+    ones = np.ones((3, 3))
+    with pytest.raises(np.linalg.LinAlgError):
+        solve(ArrayInterval._from_bounds(-ones, ones), np.ones(3))
+    with pytest.raises(ValueError):
+        solve(ArrayInterval._from_bounds(-ones, ones), np.ones(4))
+
+
+def test_interval_tensor_solve():
+    A = IntervallTensor(
+        [
+            [NPScalarInterval(1, 1.1), NPScalarInterval(3, 3.1)],
+            [NPScalarInterval(5, 5.1), NPScalarInterval(7, 7.1)],
+        ]
+    )
+    res = interval_tensor.solve(A, [[4.0], [12.0]])
+    assert isinstance(res, IntervallTensor) and res.shape == (2, 1)
+    for row in range(2):
+        assert res[row, 0].lowerbound <= 1.0 <= res[row, 0].upperbound
+
+
+def test_factorization_solves_many_right_hand_sides():
+    rng = np.random.default_rng(3)
+    matrix = rng.normal(size=(60, 60)) + 10 * np.eye(60)
+    factorization = IntervalFactorization(_perturbed(matrix, 1e-9))
+    assert factorization.regular
+    assert factorization.norm_bound < 1
+
+    solutions = rng.normal(size=(60, 5))
+    columns = factorization.solve(matrix @ solutions)
+    for pos in range(5):
+        single = factorization.solve(matrix @ solutions[:, pos])
+        assert np.all(single.lowerbound <= solutions[:, pos])
+        assert np.all(solutions[:, pos] <= single.upperbound)
+        assert np.allclose(single.upperbound, columns.upperbound[:, pos])
+
+    stacked = IntervalFactorization(_perturbed(np.stack([matrix, 2 * matrix])))
+    res = stacked.solve(np.stack([matrix, 2 * matrix]) @ solutions[:, 0])
+    assert res.shape == (2, 60)
+    assert np.all(res.lowerbound <= solutions[:, 0])
+
+    singular = IntervalFactorization(_perturbed(np.ones((3, 3))))
+    assert not singular.regular
+    with pytest.raises(np.linalg.LinAlgError):
+        singular.solve(np.ones(3))
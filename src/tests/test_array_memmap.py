@@ -0,0 +1,79 @@
+"""Tests for chunked processing of memory-mapped interval files."""
+
+import math
+import operator
+
+import numpy as np
+import pytest
+
+from pyintlab.array_interval import scalar_interval_dtype
+from pyintlab.array_memmap import IntervalMemmap
+
+from .helpers import assert_same, random_intervals
+
+
+def test_files_round_trip(tmp_path):
+    values = random_intervals((1000, 3))
+    mapped = IntervalMemmap.from_array(
+        tmp_path / "values.npy", values, chunk_bytes=4096
+    )
+    assert len(mapped._slices()) > 10
+    mapped.flush()
+    reopened = IntervalMemmap.open(tmp_path / "values.npy")
+    assert_same(reopened.load(), values)
+    assert_same(reopened[10:20, 1], values[10:20, 1])
+    records = np.load(tmp_path / "values.npy")
+    assert records.dtype == scalar_interval_dtype
+    assert np.array_equal(records["lowerbound"], values.lowerbound)
+
+
+def test_chunked_map_matches_in_memory(tmp_path):
+    values = random_intervals((999, 4))
+    other = random_intervals((999, 4), seed=1)
+    left = IntervalMemmap.from_array(tmp_path / "a.npy", values, 2048)
+    right = IntervalMemmap.from_array(tmp_path / "b.npy", other, 2048)
+    res = left.map(operator.mul, right, out=tmp_path / "res.npy")
+    assert isinstance(res, IntervalMemmap)
+    assert_same(
+        IntervalMemmap.open(tmp_path / "res.npy").load(), values * other
+    )
+    assert_same(left.map(lambda x, y: x + y, 1.5), values + 1.5)
+    assert_same(left.map(lambda x: x.sum(axis=1)), values.sum(axis=1))
+    with pytest.raises(ValueError):
+        left.map(lambda x: x[:1])
+
+
+def test_streaming_reductions_enclose(tmp_path):
+    values = random_intervals((5000, 2))
+    mapped = IntervalMemmap.from_array(tmp_path / "v.npy", values, 4096)
+    lower = values.lowerbound.reshape(5000, 2)
+    upper = values.upperbound.reshape(5000, 2)
+    for axis in (None, 0):
+        total = mapped.sum(axis=axis)
+        exact_lower = np.asarray(
+            [math.fsum(col) for col in lower.T]
+            if axis == 0
+            else math.fsum(lower.ravel())
+        )
+        exact_upper = np.asarray(
+            [math.fsum(col) for col in upper.T]
+            if axis == 0
+            else math.fsum(upper.ravel())
+        )
+        assert np.all(total.lowerbound <= exact_lower)
+        assert np.all(total.upperbound >= exact_upper)
+        mean = mapped.mean(axis=axis)
+        count = 5000 if axis == 0 else 10000
+        assert np.all(
+            mean.lowerbound <= np.nextafter(exact_lower / count, np.inf)
+        )
+        assert np.all(
+            mean.upperbound >= np.nextafter(exact_upper / count, -np.inf)
+        )
+        for name in ("min", "max", "hull"):
+            assert_same(
+                getattr(mapped, name)(axis=axis),
+                getattr(values, name)(axis=axis),
+            )
+    with pytest.raises(ValueError):
+        mapped.sum(axis=1)
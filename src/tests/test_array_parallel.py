@@ -0,0 +1,65 @@
+"""Tests for the thread-parallel ArrayInterval executor."""
+
+import operator
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from pyintlab import array_interval
+from pyintlab.array_parallel import ParallelExecutor
+
+from .helpers import random_intervals
+
+
+@pytest.fixture
+def executor():
+    with ParallelExecutor(workers=3, min_chunk=1) as pool:
+        yield pool
+
+
+def test_elementwise_matches_sequential(executor):
+    A = random_intervals((10, 4), seed=1)
+    B = random_intervals((10, 4), seed=2)
+    row = random_intervals((4,), seed=3)
+
+    def expression(x, y, z):
+        return x * y - z / 3.0 + 1.0
+
+    res = executor.elementwise(expression, A, B, row)
+    reference = expression(A, B, row)
+    assert np.array_equal(res.lowerbound, reference.lowerbound)
+    assert np.array_equal(res.upperbound, reference.upperbound)
+
+    res = executor.elementwise(operator.add, A, 2.0)
+    assert np.array_equal(res.upperbound, (A + 2.0).upperbound)
+
+
+@pytest.mark.parametrize("fallback", [False, True])
+def test_sum_encloses_exact_sums(executor, monkeypatch, fallback):
+    monkeypatch.setattr(array_interval, "ROUNDING_FALLBACK", fallback)
+    A = random_intervals((7, 5), seed=4)
+    for axis in (None, 0, 1, -1):
+        res = executor.sum(A, axis=axis)
+        exact_lb = np.sum(np.vectorize(Fraction)(A.lowerbound), axis=axis)
+        exact_ub = np.sum(np.vectorize(Fraction)(A.upperbound), axis=axis)
+        assert np.all(np.vectorize(Fraction)(res.lowerbound) <= exact_lb)
+        assert np.all(np.vectorize(Fraction)(res.upperbound) >= exact_ub)
+    with pytest.raises(ValueError):
+        executor.sum(A, axis=2)
+
+
+def test_matmul_matches_sequential(executor):
+    A = random_intervals((8, 5), seed=5)
+    B = random_intervals((5, 6), seed=6)
+    v = random_intervals((5,), seed=7)
+
+    for right in (B, v):
+        for method in ("blocked", "midrad"):
+            res = executor.matmul(A, right, method=method)
+            reference = A.matmul(right, method=method)
+            assert res.shape == reference.shape
+            assert np.allclose(res.lowerbound, reference.lowerbound)
+            assert np.allclose(res.upperbound, reference.upperbound)
+            assert np.all(res.lowerbound <= reference.upperbound)
+            assert np.all(reference.lowerbound <= res.upperbound)
@@ -0,0 +1,45 @@
+"""Tests for the shared-memory process pool."""
+
+import numpy as np
+import pytest
+
+from pyintlab.array_processes import ProcessExecutor, SharedArrayInterval
+from pyintlab.scalar_interval import ScalarInterval
+
+from .helpers import random_intervals
+
+
+def _scale_in_place(values, factor):
+    values *= factor
+
+
+def _scalar_loop(values, offset):
+    res = values.copy()
+    for pos in range(len(res)):
+        element = res[pos]
+        element += offset
+    return res
+
+
+def test_in_place_and_out_results():
+    values = random_intervals((1000, 3))
+    with (
+        ProcessExecutor(2, min_chunk=1) as executor,
+        SharedArrayInterval.from_array(values) as shared,
+        SharedArrayInterval((1000, 3)) as out,
+    ):
+        executor.map(_scale_in_place, shared, 2.0)
+        reference = values * 2.0
+        assert np.array_equal(shared.array.lowerbound, reference.lowerbound)
+        assert np.array_equal(shared.array.upperbound, reference.upperbound)
+
+        assert (
+            executor.map(_scalar_loop, shared, ScalarInterval(1, 2), out=out)
+            is out
+        )
+        reference = reference + ScalarInterval(1, 2)
+        assert np.array_equal(out.copy().lowerbound, reference.lowerbound)
+        assert np.array_equal(out.copy().upperbound, reference.upperbound)
+
+        with pytest.raises(ValueError):
+            executor.map(_scale_in_place, values, 2.0)
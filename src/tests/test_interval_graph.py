@@ -0,0 +1,86 @@
+"""Tests for tracing ScalarInterval formulas and replaying them on arrays."""
+
+import numpy as np
+from pytest import raises
+
+from pyintlab.array_interval import ArrayInterval
+from pyintlab.interval_graph import TracedInterval, trace
+from pyintlab.scalar_interval import ScalarInterval
+
+
+def annuity(
+    kreditsumme: ScalarInterval,
+    monatszins: ScalarInterval,
+    laufzeitmonate: ScalarInterval,
+) -> ScalarInterval:
+    """Monthly rate as in testkreditrechnung.py."""
+    return (
+        kreditsumme * monatszins / (1 - 1 / (1 + monatszins) ** laufzeitmonate)
+    )
+
+
+def test_common_subexpressions_are_merged() -> None:
+    """x*y + y*x records one product only."""
+    formula = trace(lambda x, y: x * y + y * x)
+    # two inputs, one product, one sum
+    assert len(formula) == 4  # nosec B101
+
+
+def test_replay_matches_scalar_path() -> None:
+    """Array replay encloses the same values as the scalar evaluation."""
+    formula = trace(annuity)
+    summen = [(240000.0, 275000.0), (100000.0, 120000.0)]
+    zinsen = [(3.3 / 1200, 3.7 / 1200), (1.0 / 1200, 1.5 / 1200)]
+    laufzeiten = [(180.0, 204.0), (120.0, 121.0)]
+    result = formula(
+        ArrayInterval(summen), ArrayInterval(zinsen), ArrayInterval(laufzeiten)
+    )
+    assert isinstance(result, ArrayInterval)  # nosec B101
+    for pos, (summe, zins, laufzeit) in enumerate(
+        zip(summen, zinsen, laufzeiten)
+    ):
+        reference = annuity(
+            ScalarInterval(*summe),
+            ScalarInterval(*zins),
+            ScalarInterval(*laufzeit),
+        )
+        assert (  # nosec B101
+            formula(
+                ScalarInterval(*summe),
+                ScalarInterval(*zins),
+                ScalarInterval(*laufzeit),
+            )
+            == reference
+        )
+        assert np.isclose(  # nosec B101
+            result.lowerbound[pos], reference.lowerbound
+        )
+        assert np.isclose(  # nosec B101
+            result.upperbound[pos], reference.upperbound
+        )
+
+
+def test_constants_and_multiple_outputs() -> None:
+    """ScalarInterval constants broadcast, tuples give several outputs."""
+    offset = ScalarInterval(1, 2)
+    formula = trace(lambda x: (offset + x, x**2))
+    shifted, squared = formula(ArrayInterval([(-1.0, 1.0), (2.0, 3.0)]))
+    assert shifted.lowerbound.tolist() == [0.0, 3.0]  # nosec B101
+    assert shifted.upperbound.tolist() == [3.0, 5.0]  # nosec B101
+    assert squared.lowerbound[0] == 0.0  # nosec B101
+    assert squared.upperbound[1] >= 9.0  # nosec B101
+
+
+def test_control_flow_is_refused() -> None:
+    """Bounds of placeholders are unknown while tracing."""
+    with raises(TypeError):
+        trace(lambda x: x if x > 0 else -x)
+    with raises(TypeError):
+        trace(lambda x: x.lowerbound)
+
+
+def test_placeholders_win_over_scalar_constants() -> None:
+    """ScalarInterval op placeholder dispatches to the reflected dunder."""
+    formula = trace(lambda x: ScalarInterval(2, 3) / x)
+    assert formula(ScalarInterval(1, 2)) == ScalarInterval(1, 3)  # nosec
+    assert issubclass(TracedInterval, ScalarInterval)  # nosec B101
@@ -0,0 +1,127 @@
+"""Tests for the binary interval format."""
+
+import io
+import pickle
+import struct
+
+import numpy as np
+import pytest
+
+from pyintlab import interval_io
+from pyintlab.array_interval import ArrayInterval
+from pyintlab.interval_list import IntervalList
+from pyintlab.scalar_interval import ScalarInterval
+
+from .helpers import assert_same, random_intervals
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("shape", [(), (0,), (7,), (3, 4, 5)])
+def test_array_round_trip(shape, compress):
+    values = random_intervals(shape)
+    data = interval_io.dumps(values, compress=compress)
+    res = interval_io.loads(data)
+    assert isinstance(res, ArrayInterval)
+    assert res.shape == values.shape
+    assert_same(res, values)
+
+
+def test_layout_and_size():
+    values = random_intervals((10, 3))
+    data = interval_io.dumps(values)
+    magic, version, kind, flags, ndim = struct.unpack_from("<4sBBBB", data)
+    assert (magic, version, kind, ndim) == (b"PILI", 1, 0, 2)
+    assert struct.unpack_from("<2Q", data, 8) == (10, 3)
+    assert len(data) == 24 + 16 * values.size
+    blocks = np.frombuffer(data, "<f8", offset=24).reshape(2, 10, 3)
+    assert np.array_equal(blocks[1], values.upperbound)
+    assert len(data) < len(pickle.dumps(values.to_scalar_intervals().tolist()))
+
+
+def test_loads_is_zero_copy():
+    values = random_intervals((100,))
+    data = bytearray(interval_io.dumps(values))
+    res = interval_io.loads(data)
+    assert np.shares_memory(res._ub, np.frombuffer(data, np.uint8))
+    res[0] = ScalarInterval(-1.0, 1.0)
+    assert interval_io.loads(data)[0] == ScalarInterval(-1.0, 1.0)
+    readonly = interval_io.loads(bytes(data))
+    assert not readonly._ub.flags.writeable
+
+
+def test_sequences_load_as_interval_list():
+    scalars = [ScalarInterval(1, 2), ScalarInterval(-3.5, 0.25), 4]
+    res = interval_io.loads(interval_io.dumps(scalars, compress=True))
+    assert isinstance(res, IntervalList)
+    assert res == IntervalList(scalars)
+    compact = IntervalList(scalars)
+    assert interval_io.loads(interval_io.dumps(compact)) == compact
+
+
+def test_files(tmp_path):
+    values = random_intervals((50, 2))
+    interval_io.dump(values, tmp_path / "values.pil")
+    assert_same(interval_io.load(tmp_path / "values.pil"), values)
+    stream = io.BytesIO()
+    interval_io.dump(
+        IntervalList.from_array_interval(values), stream, compress=True
+    )
+    stream.seek(0)
+    res = interval_io.load(stream)
+    assert res == IntervalList.from_array_interval(values)
+    res.append(ScalarInterval(0))
+    assert len(res) == 101
+
+
+def test_invalid_data():
+    data = interval_io.dumps(random_intervals((4,)))
+    with pytest.raises(ValueError, match="magic"):
+        interval_io.loads(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="version"):
+        interval_io.loads(data[:4] + b"\x09" + data[5:])
+    with pytest.raises(ValueError, match="payload"):
+        interval_io.loads(data[:-8])
+    with pytest.raises(ValueError, match="short"):
+        interval_io.loads(data[:3])
+
+
+def test_loads_from_read_only_bytes():
+    data = interval_io.dumps([ScalarInterval(1, 2), ScalarInterval(3, 4)])
+    compact = interval_io.loads(data)
+    compact[0] = ScalarInterval(5, 6)
+    compact.sort()
+    assert compact == IntervalList(
+        [ScalarInterval(3, 4), ScalarInterval(5, 6)]
+    )
+    values = interval_io.loads(interval_io.dumps(random_intervals((8,))))
+    with pytest.raises(ValueError, match="read-only"):
+        values += values
+    with pytest.raises(ValueError, match="read-only"):
+        values.add(values, out=values)
+    writable = values.copy()
+    writable += values
+    assert_same(writable, values + values)
+
+
+def test_loads_validates_bounds():
+    data = bytearray(interval_io.dumps([ScalarInterval(1, 2)]))
+    struct.pack_into("<d", data, 16, -5.0)
+    with pytest.raises(ValueError, match="Lower bound"):
+        interval_io.loads(data)
+    struct.pack_into("<d", data, 16, float("nan"))
+    with pytest.raises(ValueError, match="Lower bound"):
+        interval_io.loads(data)
+    empty = ArrayInterval._from_bounds(np.full(2, np.nan), np.full(2, np.nan))
+    assert interval_io.loads(interval_io.dumps(empty)).isempty().all()
+
+
+def test_loads_rejects_forged_shapes():
+    data = interval_io.dumps(random_intervals((4,)))
+    forged = data[:7] + b"\x02" + struct.pack("<2Q", 2**63, 2**63)
+    with pytest.raises(ValueError, match="payload"):
+        interval_io.loads(forged + data[16:])
+    with pytest.raises(ValueError, match="dimension"):
+        interval_io.loads(data[:7] + b"\xff" + data[8:])
+    compressed = interval_io.dumps(random_intervals((4,)), compress=True)
+    with pytest.raises(ValueError, match="compressed"):
+        interval_io.loads(compressed[:16] + b"garbage")
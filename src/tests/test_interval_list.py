@@ -0,0 +1,106 @@
+"""Tests for the compact IntervalList container."""
+
+import sys
+
+import numpy as np
+import pytest
+
+from pyintlab.array_interval import ArrayInterval
+from pyintlab.interval_list import IntervalList
+from pyintlab.scalar_interval import ScalarInterval
+
+
+def _intervals(count):
+    return [ScalarInterval(pos, pos + 0.5 * (pos % 3)) for pos in range(count)]
+
+
+def test_behaves_like_list():
+    reference = _intervals(10)
+    compact = IntervalList(reference)
+    assert len(compact) == 10 and compact == reference
+    assert compact[3] == reference[3] and compact[-1] == reference[-1]
+    assert compact[2:8:2] == reference[2:8:2]
+
+    for ops in (
+        lambda seq: seq.append(ScalarInterval(-1, 1)),
+        lambda seq: seq.append(ScalarInterval(2.5)),
+        lambda seq: seq.extend(_intervals(4)),
+        lambda seq: seq.insert(-3, ScalarInterval(7, 8)),
+        lambda seq: seq.insert(100, ScalarInterval(9, 9)),
+        lambda seq: seq.__setitem__(1, ScalarInterval(-2, 2)),
+        lambda seq: seq.__setitem__(slice(2, 5), _intervals(1)),
+        lambda seq: seq.__setitem__(slice(None, None, 3), seq[::3][::-1]),
+        lambda seq: seq.__delitem__(slice(1, None, 4)),
+        lambda seq: seq.__delitem__(-2),
+        lambda seq: seq.reverse(),
+        lambda seq: seq.remove(ScalarInterval(7, 8)),
+    ):
+        ops(reference)
+        ops(compact)
+        assert list(compact) == reference
+    assert compact.pop() == reference.pop()
+    assert compact.pop(0) == reference.pop(0)
+    assert compact.index(reference[4]) == reference.index(reference[4])
+    assert compact.count(reference[3]) == reference.count(reference[3])
+    assert ScalarInterval(2.5) in compact and 1234.0 not in compact
+    with pytest.raises(IndexError):
+        compact[len(reference)]
+    with pytest.raises(ValueError):
+        compact[::2] = _intervals(1)
+    compact[0] += ScalarInterval(1, 1)
+    assert compact[0] == reference[0] + ScalarInterval(1, 1)
+
+
+def test_sort_by_bounds():
+    reference = [
+        ScalarInterval(1, 4),
+        ScalarInterval(0, 5),
+        ScalarInterval(1, 2),
+    ]
+    compact = IntervalList(reference)
+    compact.sort()
+    assert compact == [reference[1], reference[2], reference[0]]
+    for key in ("upperbound", "mid", "rad"):
+        for reverse in (False, True):
+            compact = IntervalList(reference)
+            compact.sort(key=key, reverse=reverse)
+            assert compact == sorted(
+                reference, key=lambda val: getattr(val, key), reverse=reverse
+            )
+    compact = IntervalList(reference)
+    compact.sort(key=lambda val: -val.lowerbound)
+    assert compact == sorted(reference, key=lambda val: -val.lowerbound)
+    with pytest.raises(ValueError):
+        compact.sort(key="width")
+
+
+def test_compact_storage_and_array_interval():
+    compact = IntervalList(_intervals(2000))
+    assert sys.getsizeof(compact) < 20 * len(compact)
+    shared = compact.to_array_interval()
+    assert isinstance(shared, ArrayInterval) and shared.shape == (2000,)
+    shared[5] = ScalarInterval(-1, 1)
+    assert compact[5] == ScalarInterval(-1, 1)
+    doubled = IntervalList(shared + shared)
+    assert doubled[5] == ScalarInterval(-2, 2)
+    back = IntervalList.from_array_interval(shared.reshape(40, 50))
+    assert back == compact
+    assert not np.shares_memory(back._ub, compact._ub)
+
+
+def test_tuples_are_intervals():
+    compact = IntervalList([(1, 2), (3.0, 4.0), 5])
+    assert compact == [ScalarInterval(1, 2), ScalarInterval(3, 4), 5]
+    compact.append((-1.0, 0.0))
+    compact[0] = (7, 8)
+    compact[1:2] = [(0.5, 0.75), ScalarInterval(6)]
+    assert compact == [
+        ScalarInterval(7, 8),
+        ScalarInterval(0.5, 0.75),
+        ScalarInterval(6),
+        ScalarInterval(5),
+        ScalarInterval(-1, 0),
+    ]
+    assert (0.5, 0.75) in compact and compact.index((-1, 0)) == 4
+    with pytest.raises(TypeError):
+        IntervalList([(1, 2, 3)])
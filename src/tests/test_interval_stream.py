@@ -0,0 +1,75 @@
+"""Tests for the streaming interval accumulator."""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from pyintlab.array_interval import ArrayInterval
+from pyintlab.interval_stream import IntervalAccumulator
+from pyintlab.scalar_interval import ScalarInterval
+
+
+def _bounds(size, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.normal(scale=1e3, size=(size, 2)), axis=1)
+
+
+@pytest.mark.parametrize("method", ["rounding", "eft"])
+def test_stream_matches_array_reductions(method):
+    bounds = _bounds(1000)
+    values = ArrayInterval(bounds)
+    acc = IntervalAccumulator(
+        ((lower, upper) for lower, upper in bounds.tolist()),
+        batch=64,
+        method=method,
+    )
+    assert len(acc) == acc.count == 1000
+    assert len(acc._ub) < 64
+    for name in ("hull", "min", "max"):
+        ref = getattr(values, name)()
+        res = getattr(acc, name)()
+        assert (res.lowerbound, res.upperbound) == (
+            float(ref.lowerbound),
+            float(ref.upperbound),
+        )
+    total = acc.sum()
+    assert total.lowerbound <= sum(map(Fraction, bounds[:, 0].tolist()))
+    assert total.upperbound >= sum(map(Fraction, bounds[:, 1].tolist()))
+    mean = acc.mean()
+    assert mean.lowerbound <= sum(map(Fraction, bounds[:, 0].tolist())) / 1000
+    assert mean.upperbound >= sum(map(Fraction, bounds[:, 1].tolist())) / 1000
+
+
+def test_sum_stays_an_enclosure_under_cancellation():
+    acc = IntervalAccumulator(batch=3)
+    acc.update([1e16, 1.0, -1e16, 1.0, 2.0**-60] * 3)
+    total = acc.sum()
+    exact = 3 * (2 + Fraction(2) ** -60)
+    assert total.lowerbound <= exact <= total.upperbound
+
+
+def test_mixed_inputs():
+    acc = IntervalAccumulator(batch=4)
+    acc.add(ScalarInterval(1, 2))
+    acc.add((3.0, 5.0))
+    acc.add((7, 6))
+    acc.add(4)
+    acc.add(0.5)
+    acc.add(ArrayInterval([(-1.0, 0.0), (10.0, 11.0)]).reshape(2, 1))
+    assert len(acc) == 7
+    hull = acc.hull()
+    assert (hull.lowerbound, hull.upperbound) == (-1.0, 11.0)
+    total = acc.sum()
+    assert (total.lowerbound, total.upperbound) == (23.5, 29.5)
+    assert "count=7" in repr(acc)
+
+
+def test_empty_stream():
+    acc = IntervalAccumulator(iter(()))
+    assert len(acc) == 0
+    assert acc.sum() == ScalarInterval(0)
+    acc.add(ArrayInterval(np.empty((0, 2))))
+    for name in ("hull", "min", "max", "mean"):
+        with pytest.raises(ValueError):
+            getattr(acc, name)()
@@ -0,0 +1,43 @@
+"""Tests for IntervallTensor views on the interval bound buffers."""
+
+import numpy as np
+
+from pyintlab.interval_tensor import IntervallTensor
+from pyintlab.scalar_interval import ScalarInterval, ScalarIntervalView
+
+
+def test_slices_reshape_and_transpose_are_views() -> None:
+    """Basic indexing shares the bound buffers, fancy indexing copies."""
+    tensor = IntervallTensor(np.arange(12.0).reshape(3, 4))
+    for view in (tensor[1:, ::2], tensor.reshape(4, 3).T, tensor.ravel()):
+        assert isinstance(view, IntervallTensor)  # nosec B101
+        assert np.shares_memory(view._ub, tensor._ub)  # nosec B101
+    fancy = tensor[[0, 2]]
+    assert fancy.shape == (2, 4)  # nosec B101
+    assert not np.shares_memory(fancy._ub, tensor._ub)  # nosec B101
+    tensor[1:, ::2] = ScalarInterval(-1, 1)
+    assert tensor.lowerbound[2, 2] == -1.0  # nosec B101
+    assert tensor.upperbound[2, 3] == 11.0  # nosec B101
+
+
+def test_elements_write_through() -> None:
+    """Single elements are ScalarIntervalViews into the buffers."""
+    tensor = IntervallTensor([[ScalarInterval(1, 2), 3.0]])
+    element = tensor[0, 0]
+    assert isinstance(element, ScalarIntervalView)  # nosec B101
+    assert element == ScalarInterval(1, 2)  # nosec B101
+    element += ScalarInterval(1, 2)
+    assert tensor[0, 0] == ScalarInterval(2, 4)  # nosec B101
+    assert tensor.upperbound[0, 0] == 4.0  # nosec B101
+
+
+def test_tolist_and_iteration() -> None:
+    """Conversion back to ScalarInterval objects copies the bounds."""
+    tensor = IntervallTensor([[ScalarInterval(1, 2), ScalarInterval(3, 4)]])
+    assert tensor.tolist() == [  # nosec B101
+        [ScalarInterval(1, 2), ScalarInterval(3, 4)]
+    ]
+    assert type(tensor.tolist()[0][0]) is ScalarInterval  # nosec B101
+    rows = list(tensor)
+    assert len(rows) == len(tensor) == 1  # nosec B101
+    assert rows[0].shape == (2,)  # nosec B101
@@ -78,3 +78,32 @@ def test_div_zero3() -> None:
     """Assert that Division by zero raises Exception."""
     with raises(ZeroDivisionError) as _:
         _ = ScalarInterval(2.7, 3.1415) / ScalarInterval(-0.42, 0.3)
+
+
+def test_exact_results_stay_points() -> None:
+    """Exact float results must not be widened by the directed rounding."""
+    assert ScalarInterval(3) * ScalarInterval(5) == ScalarInterval(15)  # nosec
+    assert ScalarInterval(0.5) + 0.25 == ScalarInterval(0.75)  # nosec B101
+    assert 1 / ScalarInterval(4) == ScalarInterval(0.25)  # nosec B101
+
+
+def test_inexact_results_enclose() -> None:
+    """Inexact float results are rounded outward to a proper interval."""
+    third = 1 / ScalarInterval(3)
+    assert third.lowerbound < third.upperbound  # nosec B101
+    assert third.upperbound == math.nextafter(third.lowerbound, 1)  # nosec
+    tenth = ScalarInterval(0.1) + ScalarInterval(0.2)
+    assert tenth.lowerbound <= 0.1 + 0.2 <= tenth.upperbound  # nosec B101
+    assert tenth.lowerbound < tenth.upperbound  # nosec B101
+
+
+def test_reflected_and_inplace_ordering() -> None:
+    """Reflected and inplace operators keep lower <= upper."""
+    assert 10 - ScalarInterval(1, 2) == ScalarInterval(8, 9)  # nosec B101
+    bint = ScalarInterval(1, 2)
+    assert ScalarInterval(5) - bint == ScalarInterval(3, 4)  # nosec B101
+    aint = ScalarInterval(2, 4)
+    aint /= -2
+    assert aint == ScalarInterval(-2, -1)  # nosec B101
+    aint *= -3
+    assert aint == ScalarInterval(3, 6)  # nosec B101